@@ -0,0 +1,102 @@
+"""Runs the dispatch overhead benchmarks
+
+Usage: python -m benchmarks --backend numpy pytorch --sizes 1 64 1024
+"""
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import platform
+import sys
+
+import eagerpy as ep
+
+from . import dispatch
+
+BACKENDS = ["numpy", "pytorch", "jax", "tensorflow"]
+
+
+def versions(backends: List[str]) -> Dict[str, Any]:
+    result: Dict[str, Any] = {
+        "eagerpy": ep.__version__,
+        "python": platform.python_version(),
+    }
+    for backend in backends:
+        module = ep.backends.get_backend(backend).module
+        if module is not None and module.__name__ in sys.modules:
+            m = sys.modules[module.__name__]
+            result[module.__name__] = getattr(m, "__version__", None)
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--backend", nargs="+", default=BACKENDS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1, 64, 1024])
+    parser.add_argument("--ops", nargs="+", default=None)
+    parser.add_argument("--min-time", type=float, default=0.02)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="write results as JSON")
+    parser.add_argument("--compare", default=None, help="baseline JSON file")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="maximum relative increase of the overhead compared to the baseline",
+    )
+    parser.add_argument(
+        "--min-regression-us",
+        type=float,
+        default=1.0,
+        help="overhead increases below this many microseconds are ignored",
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'backend':<12} {'op':<16} {'size':>6} "
+        f"{'eagerpy_us':>10} {'native_us':>10} {'overhead':>10}"
+    )
+    results = dispatch.run(
+        args.backend,
+        args.sizes,
+        ops=args.ops,
+        min_time=args.min_time,
+        repeat=args.repeat,
+        log=print,
+    )
+    records = [r.asdict() for r in results]
+
+    uncovered = dispatch.uncovered_methods()
+    if uncovered:
+        print(f"methods without benchmark: {', '.join(uncovered)}")
+
+    if args.output is not None:
+        report = {
+            "metadata": {
+                "platform": platform.platform(),
+                "versions": versions(args.backend),
+                "min_time": args.min_time,
+                "repeat": args.repeat,
+            },
+            "results": records,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = dispatch.find_regressions(
+            records, baseline, args.max_regression, args.min_regression_us
+        )
+        for r, b in regressions:
+            print(
+                f"regression: {r['backend']} {r['op']} size {r['size']}: "
+                f"overhead {b['overhead_us']:.2f}us -> {r['overhead_us']:.2f}us"
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
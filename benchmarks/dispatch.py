@@ -0,0 +1,703 @@
+"""Measures the overhead EagerPy adds on top of the native framework calls
+
+For every method of :class:`eagerpy.Tensor`, the time of the EagerPy call is
+compared to the time of the equivalent native call on the raw tensors.
+"""
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import inspect
+import timeit
+import numpy as np
+import eagerpy as ep
+
+
+class Inputs(NamedTuple):
+    x: Any  # float32 matrix with values in (0.1, 0.9)
+    y: Any  # float32 matrix with values in (1.1, 1.9)
+    s: Any  # float32 scalar
+    mask: Any  # boolean matrix
+    labels: Any  # integer vector with one entry per row of x
+    indices: Any  # integer matrix with valid indices for the last axis of x
+    shape: Tuple[int, ...]
+    n: int
+    dtype: Any  # the native dtype of labels
+    array: Any  # NumPy array with the shape of x
+
+
+Op = Callable[[Inputs], Any]
+
+
+class Result(NamedTuple):
+    backend: str
+    op: str
+    size: int
+    wrapped: float  # seconds per call
+    native: Optional[float]  # seconds per call
+
+    @property
+    def overhead(self) -> Optional[float]:
+        if self.native is None:
+            return None
+        return self.wrapped - self.native
+
+    def asdict(self) -> Dict[str, Any]:
+        overhead = self.overhead
+        return {
+            "backend": self.backend,
+            "op": self.op,
+            "size": self.size,
+            "wrapped_us": self.wrapped * 1e6,
+            "native_us": None if self.native is None else self.native * 1e6,
+            "overhead_us": None if overhead is None else overhead * 1e6,
+            "ratio": None if self.native is None else self.wrapped / self.native,
+        }
+
+
+def make_inputs(dummy: ep.Tensor, size: int) -> Inputs:
+    shape = (size, size)
+    x = ep.uniform(dummy, shape, 0.1, 0.9).float32()
+    y = x + 1.0
+    labels = ep.arange(dummy, size) % size
+    return Inputs(
+        x=x,
+        y=y,
+        s=x[0, 0],
+        mask=x > 0.5,
+        labels=labels,
+        indices=x.argsort(axis=-1),
+        shape=shape,
+        n=size,
+        dtype=labels.dtype,
+        array=x.numpy().copy(),
+    )
+
+
+def unwrap_inputs(inputs: Inputs) -> Inputs:
+    return Inputs._make(v.raw if isinstance(v, ep.Tensor) else v for v in inputs)
+
+
+# operators behave identically for EagerPy tensors and native tensors
+OPERATORS: Dict[str, Op] = {
+    "__abs__": lambda a: abs(a.x),
+    "__neg__": lambda a: -a.x,
+    "__add__": lambda a: a.x + a.y,
+    "__radd__": lambda a: 1.0 + a.x,
+    "__sub__": lambda a: a.x - a.y,
+    "__rsub__": lambda a: 1.0 - a.x,
+    "__mul__": lambda a: a.x * a.y,
+    "__rmul__": lambda a: 2.0 * a.x,
+    "__truediv__": lambda a: a.x / a.y,
+    "__rtruediv__": lambda a: 1.0 / a.x,
+    "__floordiv__": lambda a: a.y // a.x,
+    "__rfloordiv__": lambda a: 1.0 // a.x,
+    "__mod__": lambda a: a.y % a.x,
+    "__pow__": lambda a: a.x ** 2.0,
+    "__lt__": lambda a: a.x < a.y,
+    "__le__": lambda a: a.x <= a.y,
+    "__eq__": lambda a: a.x == a.y,
+    "__ne__": lambda a: a.x != a.y,
+    "__gt__": lambda a: a.x > a.y,
+    "__ge__": lambda a: a.x >= a.y,
+    "__getitem__": lambda a: a.x[0],
+    "__len__": lambda a: len(a.x),
+    "__bool__": lambda a: bool(a.s),
+}
+
+METHODS: Dict[str, Op] = {
+    "abs": lambda a: a.x.abs(),
+    "all": lambda a: a.mask.all(),
+    "any": lambda a: a.mask.any(),
+    "arange": lambda a: a.x.arange(a.n),
+    "arctanh": lambda a: a.x.arctanh(),
+    "argmax": lambda a: a.x.argmax(axis=-1),
+    "argmin": lambda a: a.x.argmin(axis=-1),
+    "argpartition": lambda a: a.x.argpartition(2, axis=-1),
+    "argsort": lambda a: a.x.argsort(axis=-1),
+    "astype": lambda a: a.x.astype(a.dtype),
+    "bool": lambda a: a.x.bool(),
+    "clip": lambda a: a.x.clip(0.2, 0.8),
+    "concatenate": lambda a: ep.concatenate([a.x, a.y], axis=-1),
+    "crossentropy": lambda a: a.x.crossentropy(a.labels),
+    "cumsum": lambda a: a.x.cumsum(axis=-1),
+    "exp": lambda a: a.x.exp(),
+    "expand_dims": lambda a: a.x.expand_dims(0),
+    "flatten": lambda a: a.x.flatten(),
+    "flip": lambda a: a.x.flip(axis=-1),
+    "float32": lambda a: a.x.float32(),
+    "from_numpy": lambda a: a.x.from_numpy(a.array),
+    "full": lambda a: a.x.full(a.shape, 2.0),
+    "full_like": lambda a: a.x.full_like(2.0),
+    "gather": lambda a: a.x.gather(a.labels, axis=1),
+    "index_update": lambda a: a.x.index_update(0, 2.0),
+    "isinf": lambda a: a.x.isinf(),
+    "isnan": lambda a: a.x.isnan(),
+    "item": lambda a: a.s.item(),
+    "log": lambda a: a.x.log(),
+    "log10": lambda a: a.x.log10(),
+    "log1p": lambda a: a.x.log1p(),
+    "log2": lambda a: a.x.log2(),
+    "log_softmax": lambda a: a.x.log_softmax(axis=-1),
+    "logical_and": lambda a: a.mask.logical_and(a.mask),
+    "logical_not": lambda a: a.mask.logical_not(),
+    "logical_or": lambda a: a.mask.logical_or(a.mask),
+    "matmul": lambda a: a.x.matmul(a.y),
+    "max": lambda a: a.x.max(axis=-1),
+    "max_with_indices": lambda a: a.x.max_with_indices(axis=-1),
+    "maximum": lambda a: a.x.maximum(a.y),
+    "mean": lambda a: a.x.mean(axis=-1),
+    "meshgrid": lambda a: a.labels.meshgrid(a.labels),
+    "min": lambda a: a.x.min(axis=-1),
+    "min_with_indices": lambda a: a.x.min_with_indices(axis=-1),
+    "minimum": lambda a: a.x.minimum(a.y),
+    "ndim": lambda a: a.x.ndim,
+    "normal": lambda a: a.x.normal(a.shape),
+    "numpy": lambda a: a.x.numpy(),
+    "onehot_like": lambda a: a.x.onehot_like(a.labels),
+    "ones": lambda a: a.x.ones(a.shape),
+    "ones_like": lambda a: a.x.ones_like(),
+    "pad": lambda a: a.x.pad(((1, 1), (1, 1))),
+    "partition": lambda a: a.x.partition(2, axis=-1),
+    "pow": lambda a: a.x.pow(2.0),
+    "prod": lambda a: a.x.prod(axis=-1),
+    "put_along_axis": lambda a: a.x.put_along_axis(a.indices, 2.0, axis=-1),
+    "reshape": lambda a: a.x.reshape(-1),
+    "scatter": lambda a: a.x.scatter(a.labels, 2.0, "add"),
+    "shape": lambda a: a.x.shape,
+    "sign": lambda a: a.x.sign(),
+    "softmax": lambda a: a.x.softmax(axis=-1),
+    "sort": lambda a: a.x.sort(axis=-1),
+    "sqrt": lambda a: a.x.sqrt(),
+    "square": lambda a: a.x.square(),
+    "squeeze": lambda a: a.x.squeeze(),
+    "stack": lambda a: ep.stack([a.x, a.y]),
+    "sum": lambda a: a.x.sum(axis=-1),
+    "T": lambda a: a.x.T,
+    "take_along_axis": lambda a: a.x.take_along_axis(a.indices, axis=-1),
+    "tanh": lambda a: a.x.tanh(),
+    "tile": lambda a: a.x.tile((2, 2)),
+    "to_backend": lambda a: a.x.to_backend("numpy"),
+    "topk": lambda a: a.x.topk(2, axis=-1),
+    "transpose": lambda a: a.x.transpose(),
+    "uniform": lambda a: a.x.uniform(a.shape),
+    "where": lambda a: a.mask.where(a.x, a.y),
+    "zeros": lambda a: a.x.zeros(a.shape),
+    "zeros_like": lambda a: a.x.zeros_like(),
+    "norms.l0": lambda a: a.x.norms.l0(axis=-1),
+    "norms.l1": lambda a: a.x.norms.l1(axis=-1),
+    "norms.l2": lambda a: a.x.norms.l2(axis=-1),
+    "norms.linf": lambda a: a.x.norms.linf(axis=-1),
+    "norms.lp": lambda a: a.x.norms.lp(3, axis=-1),
+    # creation on a fixed tiny shape, dominated by dispatch and device placement
+    "tiny.full": lambda a: a.x.full((1,), 2.0),
+    "tiny.ones": lambda a: a.x.ones((1,)),
+    "tiny.zeros": lambda a: a.x.zeros((1,)),
+}
+
+# methods whose benchmark would not be meaningful as a single call
+SKIPPED = {"value_and_grad", "value_aux_and_grad"}
+
+
+def _array_api_ops(xp: Any) -> Dict[str, Op]:
+    # operations that are identical for NumPy and JAX
+    return {
+        "abs": lambda a: xp.abs(a.x),
+        "all": lambda a: a.mask.all(),
+        "any": lambda a: a.mask.any(),
+        "arange": lambda a: xp.arange(a.n),
+        "arctanh": lambda a: xp.arctanh(a.x),
+        "argmax": lambda a: a.x.argmax(axis=-1),
+        "argmin": lambda a: a.x.argmin(axis=-1),
+        "argpartition": lambda a: xp.argpartition(a.x, 2, axis=-1),
+        "argsort": lambda a: a.x.argsort(axis=-1),
+        "astype": lambda a: a.x.astype(a.dtype),
+        "bool": lambda a: a.x.astype(xp.bool_),
+        "clip": lambda a: xp.clip(a.x, 0.2, 0.8),
+        "concatenate": lambda a: xp.concatenate([a.x, a.y], axis=-1),
+        "cumsum": lambda a: a.x.cumsum(axis=-1),
+        "exp": lambda a: xp.exp(a.x),
+        "expand_dims": lambda a: xp.expand_dims(a.x, 0),
+        "flatten": lambda a: a.x.reshape((-1,)),
+        "flip": lambda a: xp.flip(a.x, axis=-1),
+        "float32": lambda a: a.x.astype(xp.float32),
+        "from_numpy": lambda a: xp.asarray(a.array),
+        "full": lambda a: xp.full(a.shape, 2.0, dtype=a.x.dtype),
+        "full_like": lambda a: xp.full_like(a.x, 2.0),
+        "gather": lambda a: xp.take(a.x, a.labels, axis=1),
+        "isinf": lambda a: xp.isinf(a.x),
+        "isnan": lambda a: xp.isnan(a.x),
+        "item": lambda a: a.s.item(),
+        "log": lambda a: xp.log(a.x),
+        "log10": lambda a: xp.log10(a.x),
+        "log1p": lambda a: xp.log1p(a.x),
+        "log2": lambda a: xp.log2(a.x),
+        "logical_and": lambda a: xp.logical_and(a.mask, a.mask),
+        "logical_not": lambda a: xp.logical_not(a.mask),
+        "logical_or": lambda a: xp.logical_or(a.mask, a.mask),
+        "matmul": lambda a: xp.matmul(a.x, a.y),
+        "max": lambda a: a.x.max(axis=-1),
+        "maximum": lambda a: xp.maximum(a.x, a.y),
+        "mean": lambda a: a.x.mean(axis=-1),
+        "meshgrid": lambda a: xp.meshgrid(a.labels, a.labels),
+        "min": lambda a: a.x.min(axis=-1),
+        "minimum": lambda a: xp.minimum(a.x, a.y),
+        "ndim": lambda a: a.x.ndim,
+        "ones": lambda a: xp.ones(a.shape, dtype=a.x.dtype),
+        "ones_like": lambda a: xp.ones_like(a.x),
+        "pad": lambda a: xp.pad(a.x, ((1, 1), (1, 1)), mode="constant"),
+        "partition": lambda a: xp.partition(a.x, 2, axis=-1),
+        "pow": lambda a: a.x ** 2.0,
+        "prod": lambda a: a.x.prod(axis=-1),
+        "reshape": lambda a: a.x.reshape((-1,)),
+        "shape": lambda a: a.x.shape,
+        "sign": lambda a: xp.sign(a.x),
+        "sort": lambda a: xp.sort(a.x, axis=-1),
+        "sqrt": lambda a: xp.sqrt(a.x),
+        "square": lambda a: xp.square(a.x),
+        "squeeze": lambda a: a.x.squeeze(),
+        "stack": lambda a: xp.stack([a.x, a.y]),
+        "sum": lambda a: a.x.sum(axis=-1),
+        "T": lambda a: a.x.T,
+        "take_along_axis": lambda a: xp.take_along_axis(a.x, a.indices, axis=-1),
+        "tanh": lambda a: xp.tanh(a.x),
+        "tile": lambda a: xp.tile(a.x, (2, 2)),
+        "transpose": lambda a: xp.transpose(a.x),
+        "where": lambda a: xp.where(a.mask, a.x, a.y),
+        "zeros": lambda a: xp.zeros(a.shape, dtype=a.x.dtype),
+        "zeros_like": lambda a: xp.zeros_like(a.x),
+        "norms.l0": lambda a: (a.x != 0).sum(axis=-1).astype(a.x.dtype),
+        "norms.l1": lambda a: xp.abs(a.x).sum(axis=-1),
+        "norms.l2": lambda a: xp.sqrt(xp.square(a.x).sum(axis=-1)),
+        "norms.linf": lambda a: xp.abs(a.x).max(axis=-1),
+        "norms.lp": lambda a: (xp.abs(a.x) ** 3).sum(axis=-1) ** (1 / 3),
+        "tiny.full": lambda a: xp.full((1,), 2.0, dtype=a.x.dtype),
+        "tiny.ones": lambda a: xp.ones((1,), dtype=a.x.dtype),
+        "tiny.zeros": lambda a: xp.zeros((1,), dtype=a.x.dtype),
+    }
+
+
+def numpy_ops() -> Dict[str, Op]:
+    def softmax(x: Any) -> Any:
+        e = np.exp(x - x.max(axis=-1, keepdims=True))
+        return e / e.sum(axis=-1, keepdims=True)
+
+    def log_softmax(x: Any) -> Any:
+        x = x - x.max(axis=-1, keepdims=True)
+        return x - np.log(np.exp(x).sum(axis=-1, keepdims=True))
+
+    def onehot_like(x: Any, labels: Any) -> Any:
+        r = np.zeros_like(x)
+        r[np.arange(len(r)), labels] = 1
+        return r
+
+    def index_update(x: Any) -> Any:
+        r = x.copy()
+        r[0] = 2.0
+        return r
+
+    def scatter(x: Any, labels: Any) -> Any:
+        r = x.copy()
+        np.add.at(r, labels, 2.0)
+        return r
+
+    def put_along_axis(x: Any, indices: Any) -> Any:
+        r = x.copy()
+        np.put_along_axis(r, indices, 2.0, axis=-1)
+        return r
+
+    def crossentropy(x: Any, labels: Any) -> Any:
+        x = x - x.max(axis=1, keepdims=True)
+        s = np.log(np.exp(x).sum(axis=1))
+        return s - np.take_along_axis(x, labels[:, None], axis=1).squeeze(axis=1)
+
+    ops = _array_api_ops(np)
+    ops.update(
+        {
+            "crossentropy": lambda a: crossentropy(a.x, a.labels),
+            "index_update": lambda a: index_update(a.x),
+            "log_softmax": lambda a: log_softmax(a.x),
+            "normal": lambda a: np.random.normal(0.0, 1.0, size=a.shape),
+            "numpy": lambda a: a.x.view(),
+            "onehot_like": lambda a: onehot_like(a.x, a.labels),
+            "put_along_axis": lambda a: put_along_axis(a.x, a.indices),
+            "scatter": lambda a: scatter(a.x, a.labels),
+            "softmax": lambda a: softmax(a.x),
+            "to_backend": lambda a: a.x,
+            "uniform": lambda a: np.random.uniform(0.0, 1.0, size=a.shape),
+        }
+    )
+    return ops
+
+
+def jax_ops() -> Dict[str, Op]:
+    import jax
+    import jax.numpy as jnp
+
+    key = jax.random.PRNGKey(0)
+
+    def crossentropy(x: Any, labels: Any) -> Any:
+        logp = jax.nn.log_softmax(x, axis=1)
+        return -jnp.take_along_axis(logp, labels[:, None], axis=1).squeeze(axis=1)
+
+    ops = _array_api_ops(jnp)
+    ops.update(
+        {
+            "crossentropy": lambda a: crossentropy(a.x, a.labels),
+            "index_update": lambda a: a.x.at[0].set(2.0),
+            "log_softmax": lambda a: jax.nn.log_softmax(a.x, axis=-1),
+            "normal": lambda a: jax.random.normal(key, a.shape),
+            "numpy": lambda a: np.asarray(a.x),
+            "onehot_like": lambda a: jax.nn.one_hot(a.labels, a.n, dtype=a.x.dtype),
+            "put_along_axis": lambda a: jnp.put_along_axis(
+                a.x, a.indices, 2.0, axis=-1, inplace=False
+            ),
+            "scatter": lambda a: a.x.at[a.labels].add(2.0),
+            "softmax": lambda a: jax.nn.softmax(a.x, axis=-1),
+            "to_backend": lambda a: np.from_dlpack(a.x),
+            "topk": lambda a: jax.lax.top_k(a.x, 2),
+            "uniform": lambda a: jax.random.uniform(key, a.shape),
+        }
+    )
+    return ops
+
+
+def pytorch_ops() -> Dict[str, Op]:
+    import torch
+
+    F = torch.nn.functional
+
+    def index_update(x: Any) -> Any:
+        r = x.clone()
+        r[0] = 2.0
+        return r
+
+    def onehot_like(x: Any, labels: Any) -> Any:
+        r = torch.zeros_like(x)
+        r[torch.arange(len(r)), labels] = 1
+        return r
+
+    def options(a: Inputs) -> Dict[str, Any]:
+        return {"dtype": a.x.dtype, "device": a.x.device}
+
+    return {
+        "abs": lambda a: torch.abs(a.x),
+        "all": lambda a: a.mask.all(),
+        "any": lambda a: a.mask.any(),
+        "arange": lambda a: torch.arange(a.n, device=a.x.device),
+        "arctanh": lambda a: 0.5 * (torch.log1p(a.x) - torch.log1p(-a.x)),
+        "argmax": lambda a: a.x.argmax(dim=-1),
+        "argmin": lambda a: a.x.argmin(dim=-1),
+        "argsort": lambda a: a.x.argsort(dim=-1),
+        "astype": lambda a: a.x.to(a.dtype),
+        "bool": lambda a: a.x.to(torch.bool),
+        "clip": lambda a: a.x.clamp(0.2, 0.8),
+        "concatenate": lambda a: torch.cat([a.x, a.y], dim=-1),
+        "crossentropy": lambda a: F.cross_entropy(a.x, a.labels, reduction="none"),
+        "cumsum": lambda a: a.x.cumsum(dim=-1),
+        "exp": lambda a: torch.exp(a.x),
+        "expand_dims": lambda a: a.x.unsqueeze(dim=0),
+        "flatten": lambda a: a.x.reshape((-1,)),
+        "flip": lambda a: a.x.flip(dims=(-1,)),
+        "float32": lambda a: a.x.to(torch.float32),
+        "from_numpy": lambda a: torch.as_tensor(a.array, device=a.x.device),
+        "full": lambda a: torch.full(a.shape, 2.0, **options(a)),
+        "full_like": lambda a: torch.full_like(a.x, 2.0),
+        "gather": lambda a: a.x.index_select(1, a.labels),
+        "index_update": lambda a: index_update(a.x),
+        "isinf": lambda a: torch.isinf(a.x),
+        "isnan": lambda a: torch.isnan(a.x),
+        "item": lambda a: a.s.item(),
+        "log": lambda a: torch.log(a.x),
+        "log10": lambda a: torch.log10(a.x),
+        "log1p": lambda a: torch.log1p(a.x),
+        "log2": lambda a: torch.log2(a.x),
+        "log_softmax": lambda a: F.log_softmax(a.x, dim=-1),
+        "logical_and": lambda a: a.mask & a.mask,
+        "logical_not": lambda a: ~a.mask,
+        "logical_or": lambda a: a.mask | a.mask,
+        "matmul": lambda a: torch.matmul(a.x, a.y),
+        "max": lambda a: a.x.max(-1).values,
+        "max_with_indices": lambda a: a.x.max(-1),
+        "maximum": lambda a: torch.max(a.x, a.y),
+        "mean": lambda a: a.x.mean(dim=-1),
+        "meshgrid": lambda a: torch.meshgrid(a.labels, a.labels),
+        "min": lambda a: a.x.min(-1).values,
+        "min_with_indices": lambda a: a.x.min(-1),
+        "minimum": lambda a: torch.min(a.x, a.y),
+        "ndim": lambda a: a.x.ndim,
+        "normal": lambda a: torch.randn(a.shape, **options(a)),
+        "numpy": lambda a: a.x.detach().cpu().numpy(),
+        "onehot_like": lambda a: onehot_like(a.x, a.labels),
+        "ones": lambda a: torch.ones(a.shape, **options(a)),
+        "ones_like": lambda a: torch.ones_like(a.x),
+        "pad": lambda a: F.pad(a.x, [1, 1, 1, 1]),
+        "pow": lambda a: a.x ** 2.0,
+        "prod": lambda a: a.x.prod(-1),
+        "put_along_axis": lambda a: a.x.scatter(-1, a.indices, 2.0),
+        "reshape": lambda a: a.x.reshape((-1,)),
+        "scatter": lambda a: a.x.clone().index_put_(
+            (a.labels,), torch.tensor(2.0, **options(a)), accumulate=True
+        ),
+        "shape": lambda a: a.x.shape,
+        "sign": lambda a: torch.sign(a.x),
+        "softmax": lambda a: F.softmax(a.x, dim=-1),
+        "sort": lambda a: a.x.sort(dim=-1).values,
+        "sqrt": lambda a: torch.sqrt(a.x),
+        "square": lambda a: a.x ** 2,
+        "squeeze": lambda a: a.x.squeeze(),
+        "stack": lambda a: torch.stack([a.x, a.y]),
+        "sum": lambda a: a.x.sum(dim=-1),
+        "T": lambda a: a.x.permute(1, 0),
+        "take_along_axis": lambda a: torch.gather(a.x, -1, a.indices),
+        "tanh": lambda a: torch.tanh(a.x),
+        "tile": lambda a: a.x.repeat((2, 2)),
+        "to_backend": lambda a: np.from_dlpack(a.x),
+        "topk": lambda a: a.x.topk(2, dim=-1),
+        "transpose": lambda a: a.x.permute(1, 0),
+        "uniform": lambda a: torch.rand(a.shape, **options(a)),
+        "where": lambda a: torch.where(a.mask, a.x, a.y),
+        "zeros": lambda a: torch.zeros(a.shape, **options(a)),
+        "zeros_like": lambda a: torch.zeros_like(a.x),
+        "norms.l0": lambda a: (a.x != 0).sum(dim=-1).to(a.x.dtype),
+        "norms.l1": lambda a: a.x.abs().sum(dim=-1),
+        "norms.l2": lambda a: (a.x ** 2).sum(dim=-1).sqrt(),
+        "norms.linf": lambda a: a.x.abs().max(-1).values,
+        "norms.lp": lambda a: (a.x.abs() ** 3).sum(dim=-1) ** (1 / 3),
+        "tiny.full": lambda a: torch.full((1,), 2.0, **options(a)),
+        "tiny.ones": lambda a: torch.ones((1,), **options(a)),
+        "tiny.zeros": lambda a: torch.zeros((1,), **options(a)),
+    }
+
+
+def tensorflow_ops() -> Dict[str, Op]:
+    import tensorflow as tf
+
+    def index_update(x: Any) -> Any:
+        return tf.tensor_scatter_nd_update(x, [[0]], tf.fill(x.shape[-1:], 2.0)[None])
+
+    def put_along_axis(x: Any, indices: Any) -> Any:
+        rows = tf.broadcast_to(tf.range(x.shape[0])[:, None], indices.shape)
+        coords = tf.stack([rows, indices], axis=-1)
+        return tf.tensor_scatter_nd_update(x, coords, tf.fill(indices.shape, 2.0))
+
+    def crossentropy(x: Any, labels: Any) -> Any:
+        return tf.nn.sparse_softmax_cross_entropy_with_logits(labels, x)
+
+    return {
+        "abs": lambda a: tf.abs(a.x),
+        "all": lambda a: tf.reduce_all(a.mask),
+        "any": lambda a: tf.reduce_any(a.mask),
+        "arange": lambda a: tf.range(0, a.n, 1),
+        "arctanh": lambda a: tf.atanh(a.x),
+        "argmax": lambda a: tf.argmax(a.x, axis=-1),
+        "argmin": lambda a: tf.argmin(a.x, axis=-1),
+        "argsort": lambda a: tf.argsort(a.x, axis=-1),
+        "astype": lambda a: tf.cast(a.x, a.dtype),
+        "bool": lambda a: tf.cast(a.x, tf.bool),
+        "clip": lambda a: tf.clip_by_value(a.x, 0.2, 0.8),
+        "concatenate": lambda a: tf.concat([a.x, a.y], axis=-1),
+        "crossentropy": lambda a: crossentropy(a.x, a.labels),
+        "cumsum": lambda a: tf.cumsum(a.x, axis=-1),
+        "exp": lambda a: tf.exp(a.x),
+        "expand_dims": lambda a: tf.expand_dims(a.x, axis=0),
+        "flatten": lambda a: tf.reshape(a.x, (-1,)),
+        "flip": lambda a: tf.reverse(a.x, axis=(-1,)),
+        "float32": lambda a: tf.cast(a.x, tf.float32),
+        "from_numpy": lambda a: tf.convert_to_tensor(a.array),
+        "full": lambda a: tf.fill(a.shape, 2.0),
+        "full_like": lambda a: tf.fill(a.x.shape, tf.cast(2.0, a.x.dtype)),
+        "gather": lambda a: tf.gather(a.x, a.labels, axis=1),
+        "index_update": lambda a: index_update(a.x),
+        "isinf": lambda a: tf.math.is_inf(a.x),
+        "isnan": lambda a: tf.math.is_nan(a.x),
+        "item": lambda a: a.s.numpy().item(),
+        "log": lambda a: tf.math.log(a.x),
+        "log10": lambda a: tf.math.log(a.x) / tf.math.log(10.0),
+        "log1p": lambda a: tf.math.log1p(a.x),
+        "log2": lambda a: tf.math.log(a.x) / tf.math.log(2.0),
+        "log_softmax": lambda a: tf.nn.log_softmax(a.x, axis=-1),
+        "logical_and": lambda a: tf.logical_and(a.mask, a.mask),
+        "logical_not": lambda a: tf.logical_not(a.mask),
+        "logical_or": lambda a: tf.logical_or(a.mask, a.mask),
+        "matmul": lambda a: tf.matmul(a.x, a.y),
+        "max": lambda a: tf.reduce_max(a.x, axis=-1),
+        "maximum": lambda a: tf.maximum(a.x, a.y),
+        "mean": lambda a: tf.reduce_mean(a.x, axis=-1),
+        "meshgrid": lambda a: tf.meshgrid(a.labels, a.labels),
+        "min": lambda a: tf.reduce_min(a.x, axis=-1),
+        "minimum": lambda a: tf.minimum(a.x, a.y),
+        "ndim": lambda a: a.x.ndim,
+        "normal": lambda a: tf.random.normal(a.shape, dtype=a.x.dtype),
+        "numpy": lambda a: a.x.numpy(),
+        "onehot_like": lambda a: tf.one_hot(a.labels, depth=a.n, dtype=a.x.dtype),
+        "ones": lambda a: tf.ones(a.shape, dtype=a.x.dtype),
+        "ones_like": lambda a: tf.ones_like(a.x),
+        "pad": lambda a: tf.pad(a.x, ((1, 1), (1, 1))),
+        "pow": lambda a: a.x ** 2.0,
+        "prod": lambda a: tf.reduce_prod(a.x, axis=-1),
+        "put_along_axis": lambda a: put_along_axis(a.x, a.indices),
+        "reshape": lambda a: tf.reshape(a.x, (-1,)),
+        "scatter": lambda a: tf.tensor_scatter_nd_add(
+            a.x, a.labels[:, None], tf.fill(a.x.shape, 2.0)
+        ),
+        "shape": lambda a: tuple(a.x.shape.as_list()),
+        "sign": lambda a: tf.sign(a.x),
+        "softmax": lambda a: tf.nn.softmax(a.x, axis=-1),
+        "sort": lambda a: tf.sort(a.x, axis=-1),
+        "sqrt": lambda a: tf.sqrt(a.x),
+        "square": lambda a: tf.square(a.x),
+        "squeeze": lambda a: tf.squeeze(a.x),
+        "stack": lambda a: tf.stack([a.x, a.y]),
+        "sum": lambda a: tf.reduce_sum(a.x, axis=-1),
+        "T": lambda a: tf.transpose(a.x),
+        "take_along_axis": lambda a: tf.gather(a.x, a.indices, axis=1, batch_dims=1),
+        "tanh": lambda a: tf.tanh(a.x),
+        "tile": lambda a: tf.tile(a.x, (2, 2)),
+        "topk": lambda a: tf.math.top_k(a.x, 2),
+        "transpose": lambda a: tf.transpose(a.x),
+        "uniform": lambda a: tf.random.uniform(a.shape, dtype=a.x.dtype),
+        "where": lambda a: tf.where(a.mask, a.x, a.y),
+        "zeros": lambda a: tf.zeros(a.shape, dtype=a.x.dtype),
+        "zeros_like": lambda a: tf.zeros_like(a.x),
+        "norms.l0": lambda a: tf.cast(tf.math.count_nonzero(a.x, axis=-1), a.x.dtype),
+        "norms.l1": lambda a: tf.reduce_sum(tf.abs(a.x), axis=-1),
+        "norms.l2": lambda a: tf.sqrt(tf.reduce_sum(tf.square(a.x), axis=-1)),
+        "norms.linf": lambda a: tf.reduce_max(tf.abs(a.x), axis=-1),
+        "norms.lp": lambda a: tf.reduce_sum(tf.abs(a.x) ** 3, axis=-1) ** (1 / 3),
+        "tiny.full": lambda a: tf.fill((1,), tf.constant(2.0, dtype=a.x.dtype)),
+        "tiny.ones": lambda a: tf.ones((1,), dtype=a.x.dtype),
+        "tiny.zeros": lambda a: tf.zeros((1,), dtype=a.x.dtype),
+    }
+
+
+NATIVE_OPS: Dict[str, Callable[[], Dict[str, Op]]] = {
+    "numpy": numpy_ops,
+    "jax": jax_ops,
+    "pytorch": pytorch_ops,
+    "pytorch-gpu": pytorch_ops,
+    "tensorflow": tensorflow_ops,
+}
+
+
+def get_sync(backend: str) -> Callable[[Any], None]:
+    """Returns a function that waits until an asynchronous result is ready"""
+
+    def noop(result: Any) -> None:
+        pass
+
+    if backend == "jax":
+
+        def sync_jax(result: Any) -> None:
+            if hasattr(result, "block_until_ready"):
+                result.block_until_ready()
+
+        return sync_jax
+    if backend == "pytorch-gpu":  # pragma: no cover
+        import torch
+
+        def sync_torch(result: Any) -> None:
+            torch.cuda.synchronize()
+
+        return sync_torch
+    return noop
+
+
+def uncovered_methods() -> List[str]:
+    """Public methods and properties of Tensor that have no benchmark"""
+    names = {
+        name
+        for name, _ in inspect.getmembers(ep.Tensor)
+        if not name.startswith("_") and name not in ("norms", "raw", "dtype")
+    }
+    covered = set(METHODS) | SKIPPED
+    return sorted(names - covered)
+
+
+def timeit_per_call(
+    f: Op, inputs: Inputs, sync: Callable[[Any], None], min_time: float, repeat: int
+) -> float:
+    def run() -> None:
+        sync(f(inputs))
+
+    run()  # warm-up, e.g. for lazy imports and compilation caches
+    timer = timeit.Timer(run)
+    number = 1
+    while True:
+        duration = timer.timeit(number)
+        if duration >= min_time:
+            break
+        number *= 10 if duration < min_time / 10 else 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(
+    backends: Iterable[str],
+    sizes: Iterable[int],
+    ops: Optional[Iterable[str]] = None,
+    min_time: float = 0.02,
+    repeat: int = 5,
+    log: Optional[Callable[[str], None]] = None,
+) -> List[Result]:
+    cases = dict(OPERATORS, **METHODS)
+    if ops is not None:
+        ops = list(ops)
+        unknown = set(ops) - set(cases)
+        if unknown:
+            raise ValueError(f"unknown ops: {', '.join(sorted(unknown))}")
+        cases = {name: cases[name] for name in ops}
+
+    results = []
+    for backend in backends:
+        dummy = ep.utils.get_dummy(backend)
+        natives = NATIVE_OPS[backend]() if backend in NATIVE_OPS else {}
+        sync = get_sync(backend)
+        for size in sizes:
+            wrapped_inputs = make_inputs(dummy, size)
+            native_inputs = unwrap_inputs(wrapped_inputs)
+            for name, op in cases.items():
+                native_op = OPERATORS.get(name, natives.get(name))
+                wrapped = timeit_per_call(op, wrapped_inputs, sync, min_time, repeat)
+                native = None
+                if native_op is not None:
+                    native = timeit_per_call(
+                        native_op, native_inputs, sync, min_time, repeat
+                    )
+                result = Result(backend, name, size, wrapped, native)
+                results.append(result)
+                if log is not None:
+                    log(format_result(result))
+    return results
+
+
+def format_result(result: Result) -> str:
+    d = result.asdict()
+    native = "-" if d["native_us"] is None else f"{d['native_us']:10.2f}"
+    overhead = "-" if d["overhead_us"] is None else f"{d['overhead_us']:+10.2f}"
+    return (
+        f"{d['backend']:<12} {d['op']:<16} {d['size']:>6} "
+        f"{d['wrapped_us']:10.2f} {native:>10} {overhead:>10}"
+    )
+
+
+def find_regressions(
+    results: Iterable[Dict[str, Any]],
+    baseline: Iterable[Dict[str, Any]],
+    tolerance: float,
+    min_overhead_us: float,
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Returns all pairs of (result, baseline) whose overhead increased by
+    more than the relative tolerance and more than min_overhead_us"""
+
+    def key(r: Dict[str, Any]) -> Tuple[str, str, int]:
+        return (r["backend"], r["op"], r["size"])
+
+    reference = {key(r): r for r in baseline}
+    regressions = []
+    for r in results:
+        b = reference.get(key(r))
+        if b is None or r["overhead_us"] is None or b["overhead_us"] is None:
+            continue
+        increase = r["overhead_us"] - b["overhead_us"]
+        if increase > min_overhead_us and increase > tolerance * abs(
+            b["overhead_us"]
+        ):
+            regressions.append((r, b))
+    return regressions
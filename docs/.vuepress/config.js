@@ -29,6 +29,7 @@ module.exports = {
           '/api/',
           ['/api/tensor', 'Tensor'],
           '/api/lib',
+          '/api/losses',
           '/api/norms',
           '/api/types',
         ],
@@ -26,6 +26,7 @@ from .tensor import PyTorchTensor  # noqa: F401,E402
 from .tensor import TensorFlowTensor  # noqa: F401,E402
 from .tensor import NumPyTensor  # noqa: F401,E402
 from .tensor import JAXTensor  # noqa: F401,E402
+from .tensor import DaskTensor  # noqa: F401,E402
 
 from . import types  # noqa: F401,E402
 
@@ -33,13 +34,29 @@ from .astensor import astensor  # noqa: F401,E402
 from .astensor import astensors  # noqa: F401,E402
 from .astensor import astensor_  # noqa: F401,E402
 from .astensor import astensors_  # noqa: F401,E402
+from .astensor import register_tensor_type  # noqa: F401,E402
 
 from .modules import torch  # noqa: F401,E402
 from .modules import tensorflow  # noqa: F401,E402
 from .modules import jax  # noqa: F401,E402
 from .modules import numpy  # noqa: F401,E402
 
+from . import backends  # noqa: F401,E402
+from .backends import register_backend  # noqa: F401,E402
+
 from . import utils  # noqa: F401,E402
+from . import random  # noqa: F401,E402
+
+from .lazy import lazy  # noqa: F401,E402
+from .lazy import is_enabled as lazy_enabled  # noqa: F401,E402
+
+from .transforms import jit  # noqa: F401,E402
+from .transforms import vmap  # noqa: F401,E402
+
+from .convert import convert  # noqa: F401,E402
+from .convert import CopyWarning  # noqa: F401,E402
+
+from .io import from_file  # noqa: F401,E402
 
 from .framework import *  # noqa: F401,E402,F403
 
@@ -1,13 +1,23 @@
-from typing import TYPE_CHECKING, Union, overload, Tuple, TypeVar, Generic, Any
+from typing import (
+    TYPE_CHECKING,
+    Union,
+    overload,
+    Tuple,
+    TypeVar,
+    Generic,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Type,
+    cast,
+)
 import sys
 
 from .tensor import Tensor
 from .tensor import TensorType
 
 from .tensor import PyTorchTensor
-from .tensor import TensorFlowTensor
-from .tensor import JAXTensor
-from .tensor import NumPyTensor
 
 from .types import NativeTensor
 
@@ -16,9 +26,49 @@ if TYPE_CHECKING:
     import torch
 
 
-def _get_module_name(x: Any) -> str:
-    # splitting is necessary for TensorFlow tensors
-    return type(x).__module__.split(".")[0]
+# native types (or their qualified names) and the EagerPy tensor class that
+# wraps instances of them; names are only resolved once the module of the
+# type has been imported, so that we do not have to import all frameworks
+# (the built-in backends are registered in backends.py)
+_registry: List[Tuple[Union[type, str], Type[Tensor]]] = []
+
+# the tensor class (or None) for every concrete type seen so far
+_tensor_classes: Dict[type, Optional[Type[Tensor]]] = {}
+
+
+def register_tensor_type(
+    native_type: Union[type, str], tensor_class: Type[Tensor]
+) -> None:
+    """Makes astensor wrap instances of native_type (including subclasses)
+    in tensor_class. native_type can also be the qualified name of the type,
+    e.g. "torch.Tensor". Later registrations take precedence."""
+    _registry.append((native_type, tensor_class))
+    _tensor_classes.clear()
+
+
+def _resolve(native_type: Union[type, str]) -> Optional[type]:
+    if isinstance(native_type, type):
+        return native_type
+    module, _, name = native_type.rpartition(".")
+    if module not in sys.modules:
+        # if the module has not been imported, x cannot be an instance
+        return None
+    return cast(Optional[type], getattr(sys.modules[module], name, None))
+
+
+def _get_tensor_class(x: Any) -> Optional[Type[Tensor]]:
+    t = type(x)
+    if t in _tensor_classes:
+        return _tensor_classes[t]
+    cls: Optional[Type[Tensor]] = None
+    if not isinstance(x, Tensor):
+        for native_type, tensor_class in reversed(_registry):
+            resolved = _resolve(native_type)
+            if resolved is not None and isinstance(x, resolved):
+                cls = tensor_class
+                break
+    _tensor_classes[t] = cls
+    return cls
 
 
 @overload
@@ -39,19 +89,10 @@ def astensor(x: NativeTensor) -> Tensor:  # type: ignore
 def astensor(x: Union[NativeTensor, Tensor]) -> Tensor:  # type: ignore
     if isinstance(x, Tensor):
         return x
-    # we use the module name instead of isinstance
-    # to avoid importing all the frameworks
-    name = _get_module_name(x)
-    m = sys.modules
-    if name == "torch" and isinstance(x, m[name].Tensor):  # type: ignore
-        return PyTorchTensor(x)
-    if name == "tensorflow" and isinstance(x, m[name].Tensor):  # type: ignore
-        return TensorFlowTensor(x)
-    if name == "jax" and isinstance(x, m[name].numpy.ndarray):  # type: ignore
-        return JAXTensor(x)
-    if name == "numpy" and isinstance(x, m[name].ndarray):  # type: ignore
-        return NumPyTensor(x)
-    raise ValueError(f"Unknown type: {type(x)}")
+    cls = _get_tensor_class(x)
+    if cls is None:
+        raise ValueError(f"Unknown type: {type(x)}")
+    return cls(x)
 
 
 def astensors(*xs: Union[NativeTensor, Tensor]) -> Tuple[Tensor, ...]:  # type: ignore
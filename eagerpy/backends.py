@@ -0,0 +1,114 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+from types import ModuleType
+from importlib import import_module
+
+from .tensor import Tensor
+from .tensor import PyTorchTensor
+from .tensor import TensorFlowTensor
+from .tensor import JAXTensor
+from .tensor import NumPyTensor
+from .tensor import DaskTensor
+
+from .astensor import register_tensor_type
+from .modules import ModuleWrapper
+from . import modules
+
+
+class Backend(NamedTuple):
+    name: str
+    tensor_class: Type[Tensor]
+    native_types: Sequence[Union[type, str]]
+    dummy_factory: Callable[[], Any]
+    module: Optional[ModuleType]
+
+
+_backends: Dict[str, Backend] = {}
+
+
+def register_backend(
+    name: str,
+    tensor_cls: Type[Tensor],
+    native_types: Sequence[Union[type, str]],
+    dummy_factory: Callable[[], Any],
+    module: Union[str, ModuleType, None] = None,
+) -> Backend:
+    """Registers a backend so that astensor wraps instances of native_types
+    (types or qualified names like "torch.Tensor") in tensor_cls and
+    utils.get_dummy and convert accept its name. dummy_factory should return
+    an empty tensor (EagerPy or native) on the default device. If module is
+    given, a wrapper of it that returns EagerPy tensors is available as the
+    module attribute of the returned Backend."""
+    if name in _backends:
+        raise ValueError(f"backend {name} is already registered")
+    if isinstance(module, str):
+        module = ModuleWrapper(module)
+    for native_type in native_types:
+        register_tensor_type(native_type, tensor_cls)
+    backend = Backend(name, tensor_cls, tuple(native_types), dummy_factory, module)
+    _backends[name] = backend
+    return backend
+
+
+def get_backend(name: str) -> Backend:
+    try:
+        return _backends[name]
+    except KeyError:
+        raise ValueError(f"unknown backend: {name}") from None
+
+
+def list_backends() -> List[str]:
+    return list(_backends.keys())
+
+
+register_backend(
+    "pytorch",
+    PyTorchTensor,
+    ["torch.Tensor"],
+    lambda: modules.torch.zeros(0),
+    modules.torch,
+)
+register_backend(
+    "pytorch-gpu",
+    PyTorchTensor,
+    [],
+    lambda: modules.torch.zeros(0, device="cuda:0"),
+    modules.torch,
+)
+register_backend(
+    "tensorflow",
+    TensorFlowTensor,
+    ["tensorflow.Tensor"],
+    lambda: modules.tensorflow.zeros(0),
+    modules.tensorflow,
+)
+register_backend(
+    "jax",
+    JAXTensor,
+    ["jax.numpy.ndarray"],
+    lambda: modules.jax.numpy.zeros(0),
+    modules.jax,
+)
+register_backend(
+    "numpy",
+    NumPyTensor,
+    ["numpy.ndarray"],
+    lambda: modules.numpy.zeros(0),
+    modules.numpy,
+)
+register_backend(
+    "dask",
+    DaskTensor,
+    ["dask.array.Array"],
+    lambda: import_module("dask.array").zeros(0),
+    "dask.array",
+)
@@ -0,0 +1,74 @@
+from typing import Type, TypeVar, Union
+import warnings
+import numpy as np
+
+from .tensor import Tensor
+
+from .astensor import astensor_
+from .backends import get_backend
+
+
+T = TypeVar("T")
+
+
+class CopyWarning(UserWarning):
+    """Issued by convert when the data could not be shared and was copied"""
+
+
+def _get_backend(backend: Union[str, Type[Tensor]]) -> Type[Tensor]:
+    if isinstance(backend, type) and issubclass(backend, Tensor):
+        return backend
+    return get_backend(backend).tensor_class
+
+
+def _copied(x: Tensor, y: Tensor) -> bool:
+    if np.prod(x.shape) == 0:
+        # empty tensors do not necessarily have a buffer
+        return False
+    x_ptr = x._data_ptr()
+    y_ptr = y._data_ptr()
+    if x_ptr is None or y_ptr is None:
+        return False
+    return x_ptr != y_ptr
+
+
+def convert(t: T, backend: Union[str, Type[Tensor]], *, allow_copy: bool = True) -> T:
+    """Converts a tensor to another backend (e.g. "numpy", "pytorch", "jax"
+    or "tensorflow", or a tensor class) using DLPack, so that the result
+    shares memory with t if the target framework supports its device, dtype
+    and memory layout. Otherwise, the data is copied and a CopyWarning is
+    issued or, if allow_copy is False, a ValueError is raised."""
+    x, restore_type = astensor_(t)
+    target = _get_backend(backend)
+    if isinstance(x, target):
+        return t
+
+    try:
+        result = target._from_dlpack(x._dlpack())
+    except Exception as e:
+        # e.g. unsupported devices, dtypes, strides or read-only arrays,
+        # depending on the frameworks involved
+        if not allow_copy:
+            raise ValueError(
+                f"cannot convert {type(x).__name__} to {target.__name__} without a copy: {e}"
+            ) from e
+        warnings.warn(
+            f"{type(x).__name__} copied to convert it to {target.__name__}: {e}",
+            CopyWarning,
+            stacklevel=2,
+        )
+        # a writeable C-contiguous copy can be imported by all frameworks
+        a = np.array(x.numpy(), order="C")
+        return restore_type(target._from_dlpack(a))
+
+    if _copied(x, result):
+        if not allow_copy:
+            raise ValueError(
+                f"cannot convert {type(x).__name__} to {target.__name__} without a copy"
+            )
+        warnings.warn(
+            f"{type(x).__name__} copied to convert it to {target.__name__}",
+            CopyWarning,
+            stacklevel=2,
+        )
+    return restore_type(result)
@@ -1,4 +1,14 @@
-from typing import overload, Sequence, Callable, Tuple, Any, Optional, cast, Union
+from typing import (
+    overload,
+    Sequence,
+    Callable,
+    Tuple,
+    Any,
+    Optional,
+    cast,
+    Union,
+    TYPE_CHECKING,
+)
 from typing_extensions import Literal
 
 from .types import Axes, AxisAxes, Shape, ShapeOrScalar
@@ -7,6 +17,9 @@ from .tensor import Tensor
 from .tensor import TensorType
 from .tensor import TensorOrScalar
 
+if TYPE_CHECKING:
+    from .random import Generator  # noqa: F401
+
 newaxis = None
 inf = float("inf")
 nan = float("nan")
@@ -114,6 +127,18 @@ def argmax(t: TensorType, axis: Optional[int] = None) -> TensorType:
     return t.argmax(axis=axis)
 
 
+def min_with_indices(
+    t: TensorType, axis: Optional[int] = None
+) -> Tuple[TensorType, TensorType]:
+    return t.min_with_indices(axis=axis)
+
+
+def max_with_indices(
+    t: TensorType, axis: Optional[int] = None
+) -> Tuple[TensorType, TensorType]:
+    return t.max_with_indices(axis=axis)
+
+
 def argsort(t: TensorType, axis: int = -1) -> TensorType:
     return t.argsort(axis=axis)
 
@@ -122,16 +147,38 @@ def sort(t: TensorType, axis: int = -1) -> TensorType:
     return t.sort(axis=axis)
 
 
+def topk(t: TensorType, k: int, axis: int = -1) -> Tuple[TensorType, TensorType]:
+    return t.topk(k, axis=axis)
+
+
+def partition(t: TensorType, kth: int, axis: int = -1) -> TensorType:
+    return t.partition(kth, axis=axis)
+
+
+def argpartition(t: TensorType, kth: int, axis: int = -1) -> TensorType:
+    return t.argpartition(kth, axis=axis)
+
+
 def uniform(
-    t: TensorType, shape: ShapeOrScalar, low: float = 0.0, high: float = 1.0
+    t: TensorType,
+    shape: ShapeOrScalar,
+    low: float = 0.0,
+    high: float = 1.0,
+    *,
+    generator: Optional["Generator"] = None,
 ) -> TensorType:
-    return t.uniform(shape, low=low, high=high)
+    return t.uniform(shape, low=low, high=high, generator=generator)
 
 
 def normal(
-    t: TensorType, shape: ShapeOrScalar, mean: float = 0.0, stddev: float = 1.0
+    t: TensorType,
+    shape: ShapeOrScalar,
+    mean: float = 0.0,
+    stddev: float = 1.0,
+    *,
+    generator: Optional["Generator"] = None,
 ) -> TensorType:
-    return t.normal(shape, mean=mean, stddev=stddev)
+    return t.normal(shape, mean=mean, stddev=stddev, generator=generator)
 
 
 def ones(t: TensorType, shape: ShapeOrScalar) -> TensorType:
@@ -268,6 +315,17 @@ def index_update(t: TensorType, indices: Any, values: TensorOrScalar) -> TensorT
     return t.index_update(indices, values)
 
 
+def scatter(
+    t: TensorType,
+    indices: Any,
+    values: TensorOrScalar,
+    mode: str = "set",
+    *,
+    inplace: bool = False,
+) -> TensorType:
+    return t.scatter(indices, values, mode, inplace=inplace)
+
+
 def arange(
     t: TensorType, start: int, stop: Optional[int] = None, step: Optional[int] = None
 ) -> TensorType:
@@ -366,5 +424,15 @@ def take_along_axis(t: TensorType, indices: TensorType, axis: int) -> TensorType
     return t.take_along_axis(indices, axis)
 
 
+def put_along_axis(
+    t: TensorType, indices: TensorType, values: TensorOrScalar, axis: int
+) -> TensorType:
+    return t.put_along_axis(indices, values, axis)
+
+
+def gather(t: TensorType, indices: TensorType, axis: int = 0) -> TensorType:
+    return t.gather(indices, axis=axis)
+
+
 def flatten(t: TensorType, start: int = 0, end: int = -1) -> TensorType:
     return t.flatten(start=start, end=end)
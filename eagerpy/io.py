@@ -0,0 +1,16 @@
+from typing import Union
+from os import PathLike
+import numpy as np
+
+from .tensor import NumPyTensor
+
+
+def from_file(path: Union[str, "PathLike[str]"], mmap: bool = True) -> NumPyTensor:
+    """Loads an array saved with numpy.save. If mmap is True, the file is
+    memory-mapped (read-only) instead of read into memory, and sum, mean,
+    min, max and the norms stream over it in blocks of
+    eagerpy.tensor.numpy.BLOCK_SIZE bytes."""
+    x = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+    if not isinstance(x, np.ndarray):
+        raise ValueError(f"expected a .npy file, got {path}")
+    return NumPyTensor(x)
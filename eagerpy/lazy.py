@@ -0,0 +1,112 @@
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from contextlib import contextmanager
+import threading
+import numpy as np
+
+_state = threading.local()
+
+
+def is_enabled() -> bool:
+    return bool(getattr(_state, "enabled", False))
+
+
+@contextmanager
+def lazy(enabled: bool = True) -> Iterator[None]:
+    """Within this context, elementwise operations on NumPy tensors are not
+    executed immediately but recorded as an expression that is evaluated
+    once the result is needed. Intermediate results are then computed
+    in-place where possible, avoiding a new temporary array per operation."""
+    previous = is_enabled()
+    _state.enabled = enabled
+    try:
+        yield
+    finally:
+        _state.enabled = previous
+
+
+def _spec(x: Any) -> Any:
+    # a tiny array with the same ndim and dtype as x (scalars are kept because
+    # NumPy's type promotion treats them differently than arrays)
+    if isinstance(x, (np.ndarray, Expr)):
+        return np.ones((1,) * x.ndim, dtype=x.dtype)
+    return x
+
+
+class Expr:
+    """A NumPy ufunc applied to arrays, scalars or other expressions"""
+
+    __slots__ = ("ufunc", "args", "shape", "dtype", "value")
+
+    def __init__(self, ufunc: np.ufunc, *args: Any):
+        self.ufunc = ufunc
+        self.args: Tuple[Any, ...] = args
+        self.shape: Tuple[int, ...] = np.broadcast_shapes(*(np.shape(a) for a in args))
+        with np.errstate(all="ignore"):
+            self.dtype = ufunc(*(_spec(a) for a in args)).dtype
+        self.value: Optional[Any] = None
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def evaluate(self) -> Any:
+        if self.value is None:
+            self.value = evaluate(self)
+            # the inputs are no longer needed and should not be kept alive
+            self.args = ()
+        return self.value
+
+
+def _postorder(root: Expr) -> Tuple[List[Expr], Dict[int, int]]:
+    order: List[Expr] = []
+    uses: Dict[int, int] = {}
+    visited: Set[int] = set()
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        stack.append((node, True))
+        for arg in node.args:
+            if isinstance(arg, Expr) and arg.value is None:
+                uses[id(arg)] = uses.get(id(arg), 0) + 1
+                stack.append((arg, False))
+    return order, uses
+
+
+def evaluate(root: Expr) -> Any:
+    order, uses = _postorder(root)
+    # results of nodes that are still needed by other nodes; these are
+    # temporaries that nobody else can see and can therefore be overwritten
+    values: Dict[int, Any] = {}
+    for node in order:
+        args = []
+        out = None
+        for arg in node.args:
+            if not isinstance(arg, Expr):
+                args.append(arg)
+                continue
+            if arg.value is not None:
+                args.append(arg.value)
+                continue
+            value = values[id(arg)]
+            args.append(value)
+            uses[id(arg)] -= 1
+            if uses[id(arg)] == 0:
+                del values[id(arg)]
+                if (
+                    out is None
+                    and isinstance(value, np.ndarray)
+                    and value.shape == node.shape
+                    and value.dtype == node.dtype
+                ):
+                    out = value
+        if out is None:
+            values[id(node)] = node.ufunc(*args)
+        else:
+            values[id(node)] = node.ufunc(*args, out=out)
+    return values[id(root)]
@@ -0,0 +1,3 @@
+from . import losses  # noqa: F401
+
+from .losses import kl_div_with_logits  # noqa: F401
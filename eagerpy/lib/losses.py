@@ -0,0 +1,73 @@
+from math import log
+
+from ..tensor import TensorType
+from ..framework import maximum
+
+
+def _index(logits: TensorType, labels: TensorType) -> TensorType:
+    # the labels as an index along the last axis, so that the label logits
+    # can be taken without creating a one-hot mask of the size of logits
+    if logits.ndim != 2:
+        raise ValueError("expected logits to be a 2D tensor")
+    if logits.shape[:1] != labels.shape:
+        raise ValueError("labels must be 1D and must match the length of logits")
+    return labels.expand_dims(-1)
+
+
+def kl_div_with_logits(
+    logits_p: TensorType, logits_q: TensorType, axis: int = -1, keepdims: bool = False
+) -> TensorType:
+    return logits_p._kl_div_with_logits(logits_q, axis=axis, keepdims=keepdims)
+
+
+def js_div_with_logits(
+    logits_p: TensorType, logits_q: TensorType, axis: int = -1, keepdims: bool = False
+) -> TensorType:
+    """Jensen-Shannon divergence between softmax(logits_p) and
+    softmax(logits_q) along axis"""
+    log_p = logits_p.log_softmax(axis=axis)
+    log_q = logits_q.log_softmax(axis=axis)
+    # log((p + q) / 2) computed stably from log p and log q
+    log_m = maximum(log_p, log_q) + (-(log_p - log_q).abs()).exp().log1p() - log(2)
+    js = log_p.exp() * (log_p - log_m) + log_q.exp() * (log_q - log_m)
+    return js.sum(axis=axis, keepdims=keepdims) / 2
+
+
+def margin(logits: TensorType, labels: TensorType) -> TensorType:
+    """Difference between the logit of the label and the largest other logit,
+    negative for misclassified samples"""
+    index = _index(logits, labels)
+    label_logits = logits.take_along_axis(index, axis=-1).squeeze(axis=-1)
+    if logits.shape[-1] == 1:
+        # without other classes, every sample is correctly classified
+        return label_logits.zeros_like()
+    # the largest other logit is the second largest if the label is the largest
+    values, indices = logits.topk(2, axis=-1)
+    others = (indices[:, 0] == labels).where(values[:, 1], values[:, 0])
+    return label_logits - others
+
+
+def hinge(logits: TensorType, labels: TensorType, delta: float = 1.0) -> TensorType:
+    """Multi-class hinge loss max(0, delta - margin)"""
+    return maximum(delta - margin(logits, labels), 0)
+
+
+def focal(logits: TensorType, labels: TensorType, gamma: float = 2.0) -> TensorType:
+    """Focal loss -(1 - p)^gamma * log(p) of the label probability p,
+    equal to the crossentropy for gamma=0"""
+    # the native crossentropy kernels never build the full log_softmax
+    log_p = -logits.crossentropy(labels)
+    return -((1 - log_p.exp()) ** gamma) * log_p
+
+
+def topk_accuracy(logits: TensorType, labels: TensorType, k: int = 1) -> TensorType:
+    """Whether the label is among the k largest logits, counting ties in
+    favor of the label"""
+    if k < 1:
+        raise ValueError(f"k must be positive, got {k}")
+    index = _index(logits, labels)
+    label_logits = logits.take_along_axis(index, axis=-1).squeeze(axis=-1)
+    # the label is among the top k if its logit is not smaller than the k-th
+    # largest one, which only needs O(k) instead of O(C) memory per sample
+    values, _ = logits.topk(min(k, logits.shape[-1]), axis=-1)
+    return label_logits >= values[:, -1]
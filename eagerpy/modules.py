@@ -4,18 +4,15 @@ from types import ModuleType
 from typing import Any, Callable, Iterable
 import functools
 
-from .astensor import astensor
+from .astensor import _get_tensor_class
 
 
 def wrap(f: Callable) -> Callable:
     @functools.wraps(f)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         result = f(*args, **kwargs)
-        try:
-            result = astensor(result)
-        except ValueError:
-            pass
-        return result
+        cls = _get_tensor_class(result)
+        return result if cls is None else cls(result)
 
     return wrapper
 
@@ -34,11 +31,16 @@ class ModuleWrapper(ModuleType):
         return import_module(self.__name__).__dir__()
 
     def __getattr__(self, name: str) -> Any:
+        # only called if name is not yet in the __dict__ of the wrapper
         attr = getattr(import_module(self.__name__), name)
         if callable(attr):
             attr = wrap(attr)
         elif inspect.ismodule(attr):
             attr = ModuleWrapper(attr.__name__)
+        else:
+            # other attributes are not cached because they might change
+            return attr
+        setattr(self, name, attr)
         return attr
 
 
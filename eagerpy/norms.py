@@ -1,4 +1,6 @@
-from typing import Union, Optional
+from typing import Union, Optional, Tuple, Callable
+import functools
+import operator
 
 from .tensor import TensorType
 from .types import AxisAxes
@@ -44,3 +46,76 @@ def lp(
     if p == inf:
         return linf(x, axis=axis, keepdims=keepdims)
     return x.abs().pow(p).sum(axis=axis, keepdims=keepdims).pow(1.0 / p)
+
+
+def _flatten(
+    x: TensorType, axis: Optional[AxisAxes]
+) -> Tuple[TensorType, Callable[[TensorType], TensorType]]:
+    # moves the given axes to the end and merges them into one,
+    # returns the result and a function that undoes this
+    if axis is None:
+        axes = tuple(range(x.ndim))
+    elif isinstance(axis, int):
+        axes = (axis % x.ndim,)
+    else:
+        axes = tuple(a % x.ndim for a in axis)
+    batch = tuple(i for i in range(x.ndim) if i not in axes)
+    perm = batch + axes
+    inverse = tuple(perm.index(i) for i in range(x.ndim))
+    x = x.transpose(perm)
+    shape = x.shape
+    n = functools.reduce(operator.mul, shape[len(batch) :], 1)
+
+    def restore(y: TensorType) -> TensorType:
+        return y.reshape(shape).transpose(inverse)
+
+    return x.reshape(shape[: len(batch)] + (n,)), restore
+
+
+def clip_by_norm(
+    x: TensorType,
+    max_norm: float,
+    p: Union[int, float] = 2,
+    axis: Optional[AxisAxes] = None,
+) -> TensorType:
+    """Rescales x along axis (e.g. all but the batch axis) so that its Lp norm
+    is at most max_norm"""
+    if p == 0:
+        raise ValueError("clip_by_norm is not defined for p=0, use project_lp")
+    norm = x.norms.lp(p, axis=axis, keepdims=True)
+    factor = (max_norm / norm.maximum(1e-12)).minimum(1)
+    return x * factor
+
+
+def project_lp(
+    x: TensorType,
+    eps: float,
+    p: Union[int, float],
+    axis: Optional[AxisAxes] = None,
+) -> TensorType:
+    """Projects x along axis (e.g. all but the batch axis) onto the Lp ball of
+    radius eps, for p in 0, 1, 2 and inf; for p=0, the eps entries with the
+    largest magnitude are kept"""
+    if p == inf:
+        return x.clip(-eps, eps)
+    if p == 2:
+        return clip_by_norm(x, eps, p=2, axis=axis)
+    if p == 0:
+        flat, restore = _flatten(x, axis)
+        count = min(int(eps), flat.shape[-1])
+        if count <= 0:
+            return x.zeros_like()
+        _, index = flat.abs().topk(count, axis=-1)
+        values = flat.take_along_axis(index, axis=-1)
+        return restore(flat.zeros_like().put_along_axis(index, values, axis=-1))
+    if p == 1:
+        # sort-based projection onto the simplex (Duchi et al., 2008)
+        # applied to the magnitudes
+        flat, restore = _flatten(x, axis)
+        n = flat.shape[-1]
+        u = flat.abs().sort(axis=-1).flip(axis=-1)
+        k = u.arange(1, n + 1).astype(u.dtype)
+        theta = ((u.cumsum(axis=-1) - eps) / k).max(axis=-1, keepdims=True)
+        w = (flat.abs() - theta.maximum(0)).maximum(0)
+        return restore(flat.sign() * w)
+    raise ValueError(f"project_lp only supports p in 0, 1, 2 and inf, got {p}")
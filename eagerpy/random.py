@@ -0,0 +1,97 @@
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional
+from contextlib import contextmanager
+import threading
+import numpy as np
+
+from .tensor import TensorType
+from .types import ShapeOrScalar
+
+
+class Generator:
+    """A seeded random number generator for tensors of all backends
+
+    Pass it to the sampling functions, e.g.
+    ``ep.uniform(t, shape, generator=g)``, or use its methods. For PyTorch,
+    NumPy, TensorFlow and Dask, it creates a seeded native generator
+    (``torch.Generator``, ``np.random.Generator``, ``tf.random.Generator``,
+    ``da.random.RandomState``) on first use. For JAX, the keys are derived
+    from the seed and a counter. Generators can be shared between threads;
+    use spawn to get independent generators for worker threads instead."""
+
+    # number of JAX keys that are split off at once
+    KEYS_PER_SPLIT = 64
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+        self._seed = seed
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._lock = threading.RLock()
+        self._states: Dict[Hashable, Any] = {}
+        self._counter = 0
+        self._keys: Any = None
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    def __repr__(self) -> str:
+        return f"Generator(seed={self._seed})"
+
+    def uniform(
+        self, t: TensorType, shape: ShapeOrScalar, low: float = 0.0, high: float = 1.0
+    ) -> TensorType:
+        return t.uniform(shape, low=low, high=high, generator=self)
+
+    def normal(
+        self,
+        t: TensorType,
+        shape: ShapeOrScalar,
+        mean: float = 0.0,
+        stddev: float = 1.0,
+    ) -> TensorType:
+        return t.normal(shape, mean=mean, stddev=stddev, generator=self)
+
+    def spawn(self, n: int) -> List["Generator"]:
+        """Returns n new generators whose streams are independent of this one
+        and of each other"""
+        with self._lock:
+            children = self._seed_sequence.spawn(n)
+        return [Generator(int(c.generate_state(1)[0])) for c in children]
+
+    @contextmanager
+    def _state(self, key: Hashable, factory: Callable[[int], Any]) -> Iterator[Any]:
+        # the native generator for key (e.g. a backend and a device), created
+        # using factory(seed); it must only be used inside the with block
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = factory(self._seed)
+            yield state
+
+    def _jax_key(self) -> Any:
+        # the counter-th key is the (counter % KEYS_PER_SPLIT)-th key split
+        # off from the root key folded with counter // KEYS_PER_SPLIT
+        import jax
+
+        with self._lock:
+            block, i = divmod(self._counter, self.KEYS_PER_SPLIT)
+            self._counter += 1
+            if i == 0:
+                key = jax.random.fold_in(jax.random.PRNGKey(self._seed), block)
+                self._keys = jax.random.split(key, self.KEYS_PER_SPLIT)
+            return self._keys[i]
+
+
+_default: Optional[Generator] = None
+_default_lock = threading.Lock()
+
+
+def default_generator() -> Generator:
+    """The generator used by backends without a global random state (JAX)
+    when no generator is given"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = Generator(0)
+        return _default
@@ -7,3 +7,4 @@ from .pytorch import PyTorchTensor  # noqa: F401
 from .tensorflow import TensorFlowTensor  # noqa: F401
 from .numpy import NumPyTensor  # noqa: F401
 from .jax import JAXTensor  # noqa: F401
+from .dask import DaskTensor  # noqa: F401
@@ -1,5 +1,5 @@
 from typing_extensions import final
-from typing import Any, cast
+from typing import Any, Optional, Tuple, cast
 
 from .tensor import Tensor
 from .tensor import TensorType
@@ -14,6 +14,18 @@ def unwrap1(t: Any) -> Any:
     return t.raw if isinstance(t, Tensor) else t
 
 
+def _with_indices(
+    x: TensorType, axis: Optional[int], largest: bool
+) -> Tuple[TensorType, TensorType]:
+    # a single pass to find the indices, the values are then only gathered
+    if axis is None:
+        x = x.reshape(-1)
+        axis = 0
+    indices = x.argmax(axis=axis) if largest else x.argmin(axis=axis)
+    values = x.take_along_axis(indices.expand_dims(axis), axis)
+    return values.squeeze(axis=axis), indices
+
+
 class BaseTensor(Tensor):
     __slots__ = "_raw"
 
@@ -36,11 +48,9 @@ class BaseTensor(Tensor):
         lines[-1] = lines[-1] + ")"
         return "\n".join(lines)
 
-    @final
     def __format__(self: TensorType, format_spec: str) -> str:
         return format(self.raw, format_spec)
 
-    @final
     @property
     def dtype(self: TensorType) -> Any:
         return self.raw.dtype
@@ -53,43 +63,33 @@ class BaseTensor(Tensor):
     def __len__(self: TensorType) -> int:
         return len(self.raw)
 
-    @final
     def __abs__(self: TensorType) -> TensorType:
         return type(self)(abs(self.raw))
 
-    @final
     def __neg__(self: TensorType) -> TensorType:
         return type(self)(-self.raw)
 
-    @final
     def __add__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__add__(unwrap1(other)))
 
-    @final
     def __radd__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__radd__(unwrap1(other)))
 
-    @final
     def __sub__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__sub__(unwrap1(other)))
 
-    @final
     def __rsub__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__rsub__(unwrap1(other)))
 
-    @final
     def __mul__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__mul__(unwrap1(other)))
 
-    @final
     def __rmul__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__rmul__(unwrap1(other)))
 
-    @final
     def __truediv__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__truediv__(unwrap1(other)))
 
-    @final
     def __rtruediv__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__rtruediv__(unwrap1(other)))
 
@@ -105,11 +105,26 @@ class BaseTensor(Tensor):
     def __mod__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__mod__(unwrap1(other)))
 
-    @final
     def __pow__(self: TensorType, exponent: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__pow__(unwrap1(exponent)))
 
-    @final
     @property
     def ndim(self: TensorType) -> int:
         return cast(int, self.raw.ndim)
+
+    def _kl_div_with_logits(
+        self: TensorType, logits_q: TensorType, axis: int, keepdims: bool
+    ) -> TensorType:
+        log_p = self.log_softmax(axis=axis)
+        log_q = logits_q.log_softmax(axis=axis)
+        return (log_p.exp() * (log_p - log_q)).sum(axis=axis, keepdims=keepdims)
+
+    def min_with_indices(
+        self: TensorType, axis: Optional[int] = None
+    ) -> Tuple[TensorType, TensorType]:
+        return _with_indices(self, axis, largest=False)
+
+    def max_with_indices(
+        self: TensorType, axis: Optional[int] = None
+    ) -> Tuple[TensorType, TensorType]:
+        return _with_indices(self, axis, largest=True)
@@ -0,0 +1,756 @@
+from typing import (
+    Tuple,
+    cast,
+    Union,
+    Any,
+    TypeVar,
+    TYPE_CHECKING,
+    Iterable,
+    Optional,
+    Type,
+    overload,
+    Callable,
+)
+from typing_extensions import Literal
+import numpy as np
+from importlib import import_module
+from functools import partial
+
+from ..types import Axes, AxisAxes, Shape, ShapeOrScalar
+
+from .tensor import Tensor
+from .tensor import TensorOrScalar
+
+from .base import BaseTensor
+from .base import unwrap_
+from .base import unwrap1
+
+if TYPE_CHECKING:
+    import dask.array as da  # for static analyzers
+    from .extensions import NormsMethods  # noqa: F401
+    from ..random import Generator  # noqa: F401
+else:
+    # lazy import in DaskTensor
+    da = None
+
+
+# stricter TensorType to get additional type information from the raw method
+TensorType = TypeVar("TensorType", bound="DaskTensor")
+
+# results are computed using the local threaded scheduler
+SCHEDULER = "threads"
+
+
+def assert_bool(x: Any) -> None:
+    if not isinstance(x, Tensor):
+        return
+    if x.dtype != np.dtype("bool"):
+        raise ValueError(f"requires dtype bool, got {x.dtype}, consider t.bool().all()")
+
+
+def _along(x: Any, axis: int) -> Any:
+    # operations like sort need all values along the axis in one chunk
+    return x.rechunk({axis % x.ndim: -1})
+
+
+def _along_like(index: Any, x: Any, axis: int) -> Any:
+    # broadcasts and chunks index like x (see _along), except along axis
+    shape = x.shape[:axis] + index.shape[axis : axis + 1] + x.shape[axis + 1 :]
+    chunks = x.chunks[:axis] + (-1,) + x.chunks[axis + 1 :]
+    return da.broadcast_to(index, shape).rechunk(chunks)
+
+
+def _put_along_axis(x: Any, index: Any, values: Any, axis: int) -> Any:
+    x = x.copy()
+    np.put_along_axis(x, index, values, axis=axis)
+    return x
+
+
+def _with_index(x: Any, axis: Optional[int], block_info: Any = None) -> Any:
+    # pairs every value with its index along axis, or its flat index for None
+    info = block_info[0]
+    index = [
+        i + start
+        for i, (start, _) in zip(np.indices(x.shape, sparse=True), info["array-location"])
+    ]
+    pairs = np.empty(x.shape, dtype=[("value", x.dtype), ("index", np.int64)])
+    pairs["value"] = x
+    if axis is None:
+        pairs["index"] = np.ravel_multi_index(tuple(index), info["shape"])
+    else:
+        pairs["index"] = index[axis]
+    return pairs
+
+
+def _select_pair(
+    pairs: Any, axis: Tuple[int, ...], keepdims: bool, largest: bool
+) -> Any:
+    # like dask's arg-reductions, but keeps the value with the index
+    kept = [i for i in range(pairs.ndim) if i not in axis]
+    shape = tuple(1 if i in axis else n for i, n in enumerate(pairs.shape))
+    rows = tuple(pairs.shape[i] for i in kept) + (-1,)
+    pairs = pairs.transpose(kept + list(axis)).reshape(rows)
+    values = pairs["value"]
+    reduce = values.max if largest else values.min
+    best = reduce(axis=-1, keepdims=True)
+    # ties go to the first index, and so does NaN, like in NumPy
+    hit = (values == best) | ((best != best) & (values != values))
+    index = np.where(hit, pairs["index"], np.iinfo(np.int64).max)
+    result = np.empty(best.shape, dtype=pairs.dtype)
+    result["value"] = best
+    result["index"] = index.min(axis=-1, keepdims=True)
+    if not keepdims:
+        shape = tuple(n for i, n in enumerate(shape) if i not in axis)
+    return result.reshape(shape)
+
+
+def _reduce_with_indices(
+    x: Any, axis: Optional[int], largest: bool
+) -> Tuple[Any, Any]:
+    # a single tree reduction over (value, index) pairs, so that the data is
+    # only read once for both results
+    dtype = np.dtype([("value", x.dtype), ("index", np.int64)])
+    meta = np.empty((0,) * x.ndim, dtype=dtype)
+    pairs = x.map_blocks(_with_index, axis, dtype=dtype, meta=meta)
+    select = partial(_select_pair, largest=largest)
+    pairs = da.reduction(pairs, select, select, axis=axis, dtype=dtype, meta=meta)
+    return pairs["value"], pairs["index"]
+
+
+def _captured_error() -> ValueError:
+    return ValueError(
+        "gradients of Dask functions are computed in memory using the NumPy"
+        " backend, so the function can only use Dask tensors that are passed"
+        " as arguments; pass captured Dask tensors (e.g. constants in a"
+        " closure) as additional arguments or convert them to NumPy first"
+    )
+
+
+def _known_shape(x: Any) -> Any:
+    # boolean indexing results in chunks of unknown size
+    if any(np.isnan(s) for s in x.shape):
+        x = x.compute_chunk_sizes()
+    return x
+
+
+def _index(x: Any) -> Any:
+    if isinstance(x, Tensor):
+        x = x.raw
+    if isinstance(x, (range, list)):
+        x = np.asarray(x)
+    return x
+
+
+def _isarray(x: Any) -> bool:
+    return isinstance(x, (np.ndarray, da.Array))
+
+
+class DaskTensor(BaseTensor):
+    """A tensor backed by a chunked dask.array.Array. Operations are
+    evaluated lazily and in parallel over chunks when the result is needed,
+    e.g. when calling numpy() or item(), so that arrays larger than memory
+    can be processed."""
+
+    __slots__ = ()
+
+    # more specific types for the extensions
+    norms: "NormsMethods[DaskTensor]"
+
+    def __init__(self, raw: "da.Array"):  # type: ignore
+        global da
+        if da is None:
+            da = import_module("dask.array")
+        super().__init__(raw)
+
+    @property
+    def raw(self) -> "da.Array":  # type: ignore
+        return super().raw
+
+    def __format__(self: TensorType, format_spec: str) -> str:
+        return format(self.raw.compute(scheduler=SCHEDULER), format_spec)
+
+    def numpy(self: TensorType) -> Any:
+        a = np.asarray(self.raw.compute(scheduler=SCHEDULER))
+        a.flags.writeable = False
+        return a
+
+    def item(self) -> Union[int, float, bool]:
+        return self.raw.compute(scheduler=SCHEDULER).item()  # type: ignore
+
+    @property
+    def shape(self: TensorType) -> Shape:
+        return cast(Tuple, self.raw.shape)
+
+    def reshape(self: TensorType, shape: Union[Shape, int]) -> TensorType:
+        if isinstance(shape, int):
+            shape = (shape,)
+        return type(self)(self.raw.reshape(shape))
+
+    def astype(self: TensorType, dtype: Any) -> TensorType:
+        return type(self)(self.raw.astype(dtype))
+
+    def clip(self: TensorType, min_: float, max_: float) -> TensorType:
+        return type(self)(da.clip(self.raw, min_, max_))
+
+    def square(self: TensorType) -> TensorType:
+        return type(self)(da.square(self.raw))
+
+    def arctanh(self: TensorType) -> TensorType:
+        return type(self)(da.arctanh(self.raw))
+
+    def sum(
+        self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
+    ) -> TensorType:
+        return type(self)(self.raw.sum(axis=axis, keepdims=keepdims))
+
+    def prod(
+        self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
+    ) -> TensorType:
+        return type(self)(self.raw.prod(axis=axis, keepdims=keepdims))
+
+    def mean(
+        self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
+    ) -> TensorType:
+        if self.raw.dtype not in [np.float16, np.float32, np.float64]:
+            raise ValueError(
+                f"Can only calculate the mean of floating types. Got {self.raw.dtype} instead."
+            )
+        return type(self)(self.raw.mean(axis=axis, keepdims=keepdims))
+
+    def min(
+        self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
+    ) -> TensorType:
+        return type(self)(self.raw.min(axis=axis, keepdims=keepdims))
+
+    def max(
+        self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
+    ) -> TensorType:
+        return type(self)(self.raw.max(axis=axis, keepdims=keepdims))
+
+    def minimum(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(da.minimum(self.raw, unwrap1(other)))
+
+    def maximum(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(da.maximum(self.raw, unwrap1(other)))
+
+    def argmin(self: TensorType, axis: Optional[int] = None) -> TensorType:
+        return type(self)(self.raw.argmin(axis=axis))
+
+    def argmax(self: TensorType, axis: Optional[int] = None) -> TensorType:
+        return type(self)(self.raw.argmax(axis=axis))
+
+    # gathering the values along axis would rechunk the tensor
+    def min_with_indices(
+        self: TensorType, axis: Optional[int] = None
+    ) -> Tuple[TensorType, TensorType]:
+        values, indices = _reduce_with_indices(self.raw, axis, largest=False)
+        return type(self)(values), type(self)(indices)
+
+    def max_with_indices(
+        self: TensorType, axis: Optional[int] = None
+    ) -> Tuple[TensorType, TensorType]:
+        values, indices = _reduce_with_indices(self.raw, axis, largest=True)
+        return type(self)(values), type(self)(indices)
+
+    def argsort(self: TensorType, axis: int = -1) -> TensorType:
+        x = _along(self.raw, axis)
+        return type(self)(
+            x.map_blocks(np.argsort, axis=axis, dtype=np.dtype(np.int64))
+        )
+
+    def sort(self: TensorType, axis: int = -1) -> TensorType:
+        x = _along(self.raw, axis)
+        return type(self)(x.map_blocks(np.sort, axis=axis))
+
+    def topk(self: TensorType, k: int, axis: int = -1) -> Tuple[TensorType, TensorType]:
+        n = self.shape[axis]
+        if not 0 <= k <= n:
+            raise ValueError(f"k must be between 0 and {n}, got {k}")
+        indices = type(self)(da.argtopk(self.raw, k, axis=axis))
+        return self.take_along_axis(indices, axis), indices
+
+    def partition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        x = _along(self.raw, axis)
+        return type(self)(x.map_blocks(np.partition, kth, axis=axis, dtype=x.dtype))
+
+    def argpartition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        x = _along(self.raw, axis)
+        return type(self)(
+            x.map_blocks(np.argpartition, kth, axis=axis, dtype=np.dtype(np.int64))
+        )
+
+    def uniform(
+        self: TensorType,
+        shape: ShapeOrScalar,
+        low: float = 0.0,
+        high: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
+    ) -> TensorType:
+        if generator is not None:
+            with generator._state("dask", da.random.RandomState) as rs:
+                return type(self)(rs.uniform(low, high, size=shape))
+        return type(self)(da.random.uniform(low, high, size=shape))
+
+    def normal(
+        self: TensorType,
+        shape: ShapeOrScalar,
+        mean: float = 0.0,
+        stddev: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
+    ) -> TensorType:
+        if generator is not None:
+            with generator._state("dask", da.random.RandomState) as rs:
+                return type(self)(rs.normal(mean, stddev, size=shape))
+        return type(self)(da.random.normal(mean, stddev, size=shape))
+
+    def ones(self: TensorType, shape: ShapeOrScalar) -> TensorType:
+        return type(self)(da.ones(shape, dtype=self.raw.dtype))
+
+    def zeros(self: TensorType, shape: ShapeOrScalar) -> TensorType:
+        return type(self)(da.zeros(shape, dtype=self.raw.dtype))
+
+    def ones_like(self: TensorType) -> TensorType:
+        return type(self)(da.ones_like(self.raw))
+
+    def zeros_like(self: TensorType) -> TensorType:
+        return type(self)(da.zeros_like(self.raw))
+
+    def full_like(self: TensorType, fill_value: float) -> TensorType:
+        return type(self)(da.full_like(self.raw, fill_value))
+
+    def onehot_like(
+        self: TensorType, indices: TensorType, *, value: float = 1
+    ) -> TensorType:
+        if indices.shape != self.shape[:-1]:
+            raise ValueError("shape of indices must match shape of tensor[..., 0]")
+        columns = da.arange(self.shape[-1], chunks=self.raw.chunks[-1])
+        hot = columns == unwrap1(indices)[..., np.newaxis]
+        x = da.where(hot, value, 0).astype(self.raw.dtype)
+        return type(self)(x)
+
+    def from_numpy(self: TensorType, a: Any) -> TensorType:
+        return type(self)(da.from_array(np.asarray(a)))
+
+    def _concatenate(
+        self: TensorType, tensors: Iterable[TensorType], axis: int = 0
+    ) -> TensorType:
+        # concatenates only "tensors", but not "self"
+        tensors_ = unwrap_(*tensors)
+        return type(self)(da.concatenate(tensors_, axis=axis))
+
+    def _stack(
+        self: TensorType, tensors: Iterable[TensorType], axis: int = 0
+    ) -> TensorType:
+        # stacks only "tensors", but not "self"
+        tensors_ = unwrap_(*tensors)
+        return type(self)(da.stack(tensors_, axis=axis))
+
+    def transpose(self: TensorType, axes: Optional[Axes] = None) -> TensorType:
+        if axes is None:
+            axes = tuple(range(self.ndim - 1, -1, -1))
+        return type(self)(da.transpose(self.raw, axes=axes))
+
+    def all(
+        self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
+    ) -> TensorType:
+        assert_bool(self)
+        return type(self)(self.raw.all(axis=axis, keepdims=keepdims))
+
+    def any(
+        self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
+    ) -> TensorType:
+        assert_bool(self)
+        return type(self)(self.raw.any(axis=axis, keepdims=keepdims))
+
+    def logical_and(self: TensorType, other: TensorOrScalar) -> TensorType:
+        assert_bool(self)
+        assert_bool(other)
+        return type(self)(da.logical_and(self.raw, unwrap1(other)))
+
+    def logical_or(self: TensorType, other: TensorOrScalar) -> TensorType:
+        assert_bool(self)
+        assert_bool(other)
+        return type(self)(da.logical_or(self.raw, unwrap1(other)))
+
+    def logical_not(self: TensorType) -> TensorType:
+        assert_bool(self)
+        return type(self)(da.logical_not(self.raw))
+
+    def exp(self: TensorType) -> TensorType:
+        return type(self)(da.exp(self.raw))
+
+    def log(self: TensorType) -> TensorType:
+        return type(self)(da.log(self.raw))
+
+    def log2(self: TensorType) -> TensorType:
+        return type(self)(da.log2(self.raw))
+
+    def log10(self: TensorType) -> TensorType:
+        return type(self)(da.log10(self.raw))
+
+    def log1p(self: TensorType) -> TensorType:
+        return type(self)(da.log1p(self.raw))
+
+    def tile(self: TensorType, multiples: Axes) -> TensorType:
+        multiples = unwrap1(multiples)
+        if len(multiples) != self.ndim:
+            raise ValueError("multiples requires one entry for each dimension")
+        return type(self)(da.tile(self.raw, multiples))
+
+    def softmax(self: TensorType, axis: int = -1) -> TensorType:
+        # for numerical reasons we subtract the max logit
+        # (mathematically it doesn't matter!)
+        # otherwise exp(logits) might become too large or too small
+        logits = self.raw
+        logits = logits - logits.max(axis=axis, keepdims=True)
+        e = da.exp(logits)
+        return type(self)(e / e.sum(axis=axis, keepdims=True))
+
+    def log_softmax(self: TensorType, axis: int = -1) -> TensorType:
+        # for numerical reasons we subtract the max logit
+        # (mathematically it doesn't matter!)
+        # otherwise exp(logits) might become too large or too small
+        logits = self.raw
+        logits = logits - logits.max(axis=axis, keepdims=True)
+        log_sum_exp = da.log(da.exp(logits).sum(axis=axis, keepdims=True))
+        return type(self)(logits - log_sum_exp)
+
+    def squeeze(self: TensorType, axis: Optional[AxisAxes] = None) -> TensorType:
+        return type(self)(self.raw.squeeze(axis=axis))
+
+    def expand_dims(self: TensorType, axis: int) -> TensorType:
+        return type(self)(da.expand_dims(self.raw, axis=axis))
+
+    def full(self: TensorType, shape: ShapeOrScalar, value: float) -> TensorType:
+        return type(self)(da.full(shape, value, dtype=self.raw.dtype))
+
+    def index_update(
+        self: TensorType, indices: Any, values: TensorOrScalar
+    ) -> TensorType:
+        x = self.raw
+        values = unwrap1(values)
+        if isinstance(indices, tuple):
+            indices = tuple(_index(i) for i in indices)
+            if sum(_isarray(i) for i in indices) > 1 and len(indices) == x.ndim:
+                # dask only supports assignments with one integer array per
+                # index, so we convert the (small) indices to flat indices
+                indices = np.broadcast_arrays(
+                    *(
+                        i.compute(scheduler=SCHEDULER) if isinstance(i, da.Array) else i
+                        for i in indices
+                    )
+                )
+                flat = np.ravel_multi_index(indices, x.shape).ravel()
+                values = da.broadcast_to(values, indices[0].shape).ravel()
+                y = x.ravel()
+                y[flat] = values
+                return type(self)(y.reshape(x.shape))
+        else:
+            indices = _index(indices)
+        # assigning to a dask array only replaces its graph
+        x = x.copy()
+        x[indices] = values
+        return type(self)(x)
+
+    def arange(
+        self: TensorType,
+        start: int,
+        stop: Optional[int] = None,
+        step: Optional[int] = None,
+    ) -> TensorType:
+        if stop is None:
+            start, stop = 0, start
+        if step is None:
+            step = 1
+        return type(self)(da.arange(start, stop, step))
+
+    def cumsum(self: TensorType, axis: Optional[int] = None) -> TensorType:
+        if axis is None:
+            return type(self)(self.raw.flatten().cumsum(axis=0))
+        return type(self)(self.raw.cumsum(axis=axis))
+
+    def flip(self: TensorType, axis: Optional[AxisAxes] = None) -> TensorType:
+        if axis is None:
+            axis = tuple(range(self.ndim))
+        elif isinstance(axis, int):
+            axis = (axis,)
+        x = self.raw
+        for a in axis:
+            x = da.flip(x, axis=a)
+        return type(self)(x)
+
+    def meshgrid(
+        self: TensorType, *tensors: TensorType, indexing: str = "xy"
+    ) -> Tuple[TensorType, ...]:
+        tensors = unwrap_(*tensors)
+        outputs = da.meshgrid(self.raw, *tensors, indexing=indexing)
+        return tuple(type(self)(out) for out in outputs)
+
+    def pad(
+        self: TensorType,
+        paddings: Tuple[Tuple[int, int], ...],
+        mode: str = "constant",
+        value: float = 0,
+    ) -> TensorType:
+        if len(paddings) != self.ndim:
+            raise ValueError("pad requires a tuple for each dimension")
+        for p in paddings:
+            if len(p) != 2:
+                raise ValueError("pad requires a tuple for each dimension")
+        if not (mode == "constant" or mode == "reflect"):
+            raise ValueError("pad requires mode 'constant' or 'reflect'")
+        if mode == "reflect":
+            # PyTorch's pad has limited support for 'reflect' padding
+            if self.ndim != 3 and self.ndim != 4:
+                raise NotImplementedError  # pragma: no cover
+            k = self.ndim - 2
+            if paddings[:k] != ((0, 0),) * k:
+                raise NotImplementedError  # pragma: no cover
+        if mode == "constant":
+            return type(self)(
+                da.pad(self.raw, paddings, mode=mode, constant_values=value)
+            )
+        else:
+            return type(self)(da.pad(self.raw, paddings, mode=mode))
+
+    def isnan(self: TensorType) -> TensorType:
+        return type(self)(da.isnan(self.raw))
+
+    def isinf(self: TensorType) -> TensorType:
+        return type(self)(da.isinf(self.raw))
+
+    def crossentropy(self: TensorType, labels: TensorType) -> TensorType:
+        if self.ndim != 2:
+            raise ValueError("crossentropy only supported for 2D logits tensors")
+        if self.shape[:1] != labels.shape:
+            raise ValueError("labels must be 1D and must match the length of logits")
+        # for numerical reasons we subtract the max logit
+        # (mathematically it doesn't matter!)
+        # otherwise exp(logits) might become too large or too small
+        logits = self.raw
+        logits = logits - logits.max(axis=1, keepdims=True)
+        e = da.exp(logits)
+        s = da.sum(e, axis=1)
+        # selecting the logit of the label with a mask keeps the computation
+        # blockwise (unlike take_along_axis)
+        columns = da.arange(self.shape[1], chunks=logits.chunks[1])
+        hot = columns[np.newaxis, :] == labels.raw[:, np.newaxis]
+        ces = da.log(s) - da.where(hot, logits, 0).sum(axis=1)
+        return type(self)(ces)
+
+    @overload
+    def _value_and_grad_fn(
+        self: TensorType, f: Callable[..., TensorType]
+    ) -> Callable[..., Tuple[TensorType, TensorType]]:
+        ...
+
+    @overload  # noqa: F811 (waiting for pyflakes > 2.1.1)
+    def _value_and_grad_fn(
+        self: TensorType, f: Callable[..., TensorType], has_aux: Literal[False]
+    ) -> Callable[..., Tuple[TensorType, TensorType]]:
+        ...
+
+    @overload  # noqa: F811 (waiting for pyflakes > 2.1.1)
+    def _value_and_grad_fn(
+        self: TensorType,
+        f: Callable[..., Tuple[TensorType, Any]],
+        has_aux: Literal[True],
+    ) -> Callable[..., Tuple[TensorType, Any, TensorType]]:
+        ...
+
+    def _value_and_grad_fn(  # noqa: F811 (waiting for pyflakes > 2.1.1)
+        self: TensorType, f: Callable, has_aux: bool = False
+    ) -> Callable[..., Tuple]:
+        # dask has no autodiff, so f is evaluated and differentiated in
+        # memory using the NumPy backend
+        from .numpy import NumPyTensor
+        from .numpy_autodiff import value_and_grad_fn
+
+        def to_numpy(x: Any) -> Any:
+            if isinstance(x, DaskTensor):
+                return NumPyTensor(x.raw.compute(scheduler=SCHEDULER))
+            return x
+
+        def to_dask(x: Any) -> Any:
+            if isinstance(x, NumPyTensor):
+                if isinstance(x.raw, da.Array):
+                    raise _captured_error()
+                return DaskTensor(da.from_array(x.raw))
+            if isinstance(x, (tuple, list)):
+                return type(x)(to_dask(y) for y in x)
+            return x
+
+        vgf = value_and_grad_fn(f, has_aux=has_aux)
+
+        def value_and_grad(x: Any, *args: Any, **kwargs: Any) -> Tuple:
+            for cell in getattr(f, "__closure__", None) or ():
+                try:
+                    captured = cell.cell_contents
+                except ValueError:  # a cell that is not assigned yet
+                    continue
+                if isinstance(captured, DaskTensor):
+                    raise _captured_error()
+            args = tuple(to_numpy(a) for a in args)
+            kwargs = {k: to_numpy(v) for k, v in kwargs.items()}
+            return cast(Tuple, to_dask(vgf(to_numpy(x), *args, **kwargs)))
+
+        return value_and_grad
+
+    def _jit(self: TensorType, f: Callable[..., Any]) -> Callable[..., Any]:
+        # dask already builds a task graph and optimizes it before computing
+        return f
+
+    def _vmap(
+        self: TensorType, f: Callable[..., Tuple[Any, ...]]
+    ) -> Callable[..., Tuple[Any, ...]]:
+        def vmapped(*args: Any) -> Tuple[Any, ...]:
+            n = len(args[0])
+            if n == 0:
+                raise ValueError("vmap requires a non-empty batch axis")
+            outputs = zip(*(f(*(x[i] for x in args)) for i in range(n)))
+            return tuple(da.stack(ys) for ys in outputs)
+
+        return vmapped
+
+    def _dlpack(self: TensorType) -> Any:
+        return np.asarray(self.raw.compute(scheduler=SCHEDULER))
+
+    def _data_ptr(self: TensorType) -> Optional[int]:
+        return None
+
+    @classmethod
+    def _from_dlpack(cls: Type[TensorType], x: Any) -> TensorType:
+        dask_array = import_module("dask.array")
+        return cls(dask_array.from_array(np.from_dlpack(x)))
+
+    def _scatter(
+        self: TensorType,
+        indices: Tuple[Any, ...],
+        values: Any,
+        mode: str,
+        inplace: bool,
+    ) -> TensorType:
+        if inplace:
+            raise NotImplementedError("Dask arrays cannot be updated in-place")
+        x = self.raw
+        indices = tuple(
+            i.compute(scheduler=SCHEDULER) if isinstance(i, da.Array) else _index(i)
+            for i in indices
+        )
+        indices = tuple(np.asarray(i) % size for i, size in zip(indices, x.shape))
+        if any(i.size == 0 for i in indices):
+            # like the other backends, nothing is updated
+            return self
+        if mode == "set":
+            return self.index_update(indices, values)
+        # combine the values of duplicate (small) flat indices first, so that
+        # dask only needs to update every element once
+        indices = np.broadcast_arrays(*indices)
+        batch = indices[0].shape
+        rest = x.shape[len(indices) :]
+        # index every element of the indexed sub-arrays
+        indices = np.broadcast_arrays(
+            *(i.reshape(batch + (1,) * len(rest)) for i in indices),
+            *(g.reshape((1,) * len(batch) + rest) for g in np.indices(rest)),
+        )
+        flat = np.ravel_multi_index(indices, x.shape).ravel()
+        if isinstance(values, da.Array):
+            values = values.compute(scheduler=SCHEDULER)
+        values = np.asarray(values, dtype=x.dtype)
+        values = np.broadcast_to(values, batch + rest).ravel()
+        unique, inverse = np.unique(flat, return_inverse=True)
+        ufunc = np.add if mode == "add" else np.maximum
+        combined = np.full(unique.shape, 0 if mode == "add" else values.min(), x.dtype)
+        ufunc.at(combined, inverse, values)
+        y = x.ravel().copy()
+        y[unique] = ufunc(y[unique], combined)
+        return type(self)(y.reshape(x.shape))
+
+    def sign(self: TensorType) -> TensorType:
+        return type(self)(da.sign(self.raw))
+
+    def sqrt(self: TensorType) -> TensorType:
+        return type(self)(da.sqrt(self.raw))
+
+    def tanh(self: TensorType) -> TensorType:
+        return type(self)(da.tanh(self.raw))
+
+    def float32(self: TensorType) -> TensorType:
+        return self.astype(np.float32)
+
+    def where(self: TensorType, x: TensorOrScalar, y: TensorOrScalar) -> TensorType:
+        x, y = unwrap_(x, y)
+        return type(self)(da.where(self.raw, x, y))
+
+    def matmul(self: TensorType, other: TensorType) -> TensorType:
+        if self.ndim != 2 or other.ndim != 2:
+            raise ValueError(
+                f"matmul requires both tensors to be 2D, got {self.ndim}D and {other.ndim}D"
+            )
+        return type(self)(da.matmul(self.raw, other.raw))
+
+    def __lt__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(self.raw.__lt__(unwrap1(other)))
+
+    def __le__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(self.raw.__le__(unwrap1(other)))
+
+    def __eq__(self: TensorType, other: TensorOrScalar) -> TensorType:  # type: ignore
+        return type(self)(self.raw.__eq__(unwrap1(other)))
+
+    def __ne__(self: TensorType, other: TensorOrScalar) -> TensorType:  # type: ignore
+        return type(self)(self.raw.__ne__(unwrap1(other)))
+
+    def __gt__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(self.raw.__gt__(unwrap1(other)))
+
+    def __ge__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(self.raw.__ge__(unwrap1(other)))
+
+    def __getitem__(self: TensorType, index: Any) -> TensorType:
+        if isinstance(index, tuple):
+            index = tuple(_index(x) for x in index)
+            if sum(_isarray(x) and x.dtype != bool for x in index) > 1:
+                # dask only supports one integer array per index, other
+                # combinations are supported by vindex (as pointwise indexing)
+                index = tuple(
+                    x.compute(scheduler=SCHEDULER) if isinstance(x, da.Array) else x
+                    for x in index
+                )
+                return type(self)(self.raw.vindex[index])
+        else:
+            index = _index(index)
+        return type(self)(_known_shape(self.raw[index]))
+
+    def take_along_axis(self: TensorType, index: TensorType, axis: int) -> TensorType:
+        axis = axis % self.ndim
+        x = _along(self.raw, axis)
+        i = _along_like(index.raw, x, axis)
+        return type(self)(
+            da.map_blocks(
+                np.take_along_axis, x, i, axis=axis, chunks=i.chunks, dtype=x.dtype
+            )
+        )
+
+    def put_along_axis(
+        self: TensorType, index: TensorType, values: TensorOrScalar, axis: int
+    ) -> TensorType:
+        axis = axis % self.ndim
+        x = _along(self.raw, axis)
+        i = _along_like(index.raw, x, axis)
+        v = da.broadcast_to(unwrap1(values), i.shape).rechunk(i.chunks)
+        return type(self)(
+            da.map_blocks(_put_along_axis, x, i, v, axis=axis, dtype=x.dtype)
+        )
+
+    def gather(self: TensorType, indices: TensorType, axis: int = 0) -> TensorType:
+        axis = axis % self.ndim
+        i = unwrap1(indices)
+        x = self.raw[(slice(None),) * axis + (i.reshape(-1),)]
+        shape = self.shape[:axis] + indices.shape + self.shape[axis + 1 :]
+        return type(self)(x.reshape(shape))
+
+    def bool(self: TensorType) -> TensorType:
+        return self.astype(np.dtype("bool"))
@@ -1,10 +1,22 @@
-from typing import TypeVar, Callable, Any, Generic
+from typing import TypeVar, Callable, Any, Generic, Dict, Optional, Tuple, Union
 import typing
 import functools
+import numpy as np
 
 from .. import norms
+from ..types import AxisAxes
 
 from .tensor import Tensor
+from .numpy import NumPyTensor
+from .numpy import _axes
+from .numpy import _is_mapped
+from .numpy import _reduce_blocks
+from .pytorch import PyTorchTensor
+from .tensorflow import TensorFlowTensor
+
+# the frameworks are imported lazily by the tensor classes
+from . import pytorch
+from . import tensorflow
 
 
 T = TypeVar("T")
@@ -56,3 +68,196 @@ class NormsMethods(Generic[T_co], ExtensionMethods):
     l2: Callable[..., T_co] = norms.l2
     linf: Callable[..., T_co] = norms.linf
     lp: Callable[..., T_co] = norms.lp
+    project_lp: Callable[..., T_co] = norms.project_lp
+    clip_by_norm: Callable[..., T_co] = norms.clip_by_norm
+
+
+def _numpy_l0(
+    x: NumPyTensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+) -> NumPyTensor:
+    if not _is_mapped(x.raw):
+        return norms.l0(x, axis=axis, keepdims=keepdims)
+    r = _reduce_blocks(x.raw, np.sum, np.add, axis, keepdims, lambda b: b != 0)
+    return NumPyTensor(r.astype(x.dtype))
+
+
+def _numpy_l1(
+    x: NumPyTensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+) -> NumPyTensor:
+    if not _is_mapped(x.raw):
+        return norms.l1(x, axis=axis, keepdims=keepdims)
+    return NumPyTensor(_reduce_blocks(x.raw, np.sum, np.add, axis, keepdims, np.abs))
+
+
+def _sum_of_squares(x: "np.ndarray", axis: Optional[AxisAxes], keepdims: bool) -> Any:
+    # einsum multiplies and adds in a single pass without a temporary
+    axes = _axes(x.ndim, axis)
+    dims = list(range(x.ndim))
+    r = np.einsum(x, dims, x, dims, [d for d in dims if d not in axes])
+    if keepdims:
+        r = r.reshape(tuple(1 if d in axes else n for d, n in enumerate(x.shape)))
+    return r
+
+
+def _numpy_l2(
+    x: NumPyTensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+) -> NumPyTensor:
+    if _is_mapped(x.raw):
+        r = _reduce_blocks(x.raw, np.sum, np.add, axis, keepdims, np.square)
+        return NumPyTensor(np.sqrt(r))
+    if x.dtype not in (np.float32, np.float64):
+        return norms.l2(x, axis=axis, keepdims=keepdims)
+    return NumPyTensor(np.sqrt(_sum_of_squares(x.raw, axis, keepdims)))
+
+
+def _numpy_linf(
+    x: NumPyTensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+) -> NumPyTensor:
+    if _is_mapped(x.raw):
+        r = _reduce_blocks(x.raw, np.max, np.maximum, axis, keepdims, np.abs)
+        return NumPyTensor(r)
+    if x.dtype.kind != "f":
+        return norms.linf(x, axis=axis, keepdims=keepdims)
+    # avoids the temporary created by abs
+    r = np.maximum(
+        x.raw.max(axis=axis, keepdims=keepdims),
+        -x.raw.min(axis=axis, keepdims=keepdims),
+    )
+    return NumPyTensor(r)
+
+
+def _numpy_lp(
+    x: NumPyTensor,
+    p: Union[int, float],
+    axis: Optional[AxisAxes] = None,
+    keepdims: bool = False,
+) -> NumPyTensor:
+    if p == 0:
+        return _numpy_l0(x, axis=axis, keepdims=keepdims)
+    if p == 1:
+        return _numpy_l1(x, axis=axis, keepdims=keepdims)
+    if p == 2:
+        return _numpy_l2(x, axis=axis, keepdims=keepdims)
+    if p == norms.inf:
+        return _numpy_linf(x, axis=axis, keepdims=keepdims)
+    if _is_mapped(x.raw):
+        r = _reduce_blocks(
+            x.raw, np.sum, np.add, axis, keepdims, lambda b: np.abs(b) ** p
+        )
+        return NumPyTensor(r ** (1.0 / p))
+    if x.dtype.kind != "f":
+        return norms.lp(x, p, axis=axis, keepdims=keepdims)
+    # raise the absolute values to the power of p in-place
+    a = np.absolute(x.raw, out=np.empty_like(x.raw))
+    np.power(a, p, out=a)
+    return NumPyTensor(a.sum(axis=axis, keepdims=keepdims) ** (1.0 / p))
+
+
+class NumPyNormsMethods(NormsMethods[NumPyTensor]):
+    # streams over memory-mapped arrays instead of creating temporaries
+    # of their size (see NumPyTensor.sum) and avoids temporaries for floats
+    l0: Callable[..., NumPyTensor] = _numpy_l0
+    l1: Callable[..., NumPyTensor] = _numpy_l1
+    l2: Callable[..., NumPyTensor] = _numpy_l2
+    linf: Callable[..., NumPyTensor] = _numpy_linf
+    lp: Callable[..., NumPyTensor] = _numpy_lp
+
+
+def _pytorch_norm(
+    ord: float, generic: Callable[..., PyTorchTensor]
+) -> Callable[..., PyTorchTensor]:
+    def norm(
+        x: PyTorchTensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+    ) -> PyTorchTensor:
+        # torch.linalg.vector_norm was added in PyTorch 1.9
+        vector_norm = getattr(
+            getattr(pytorch.torch, "linalg", None), "vector_norm", None
+        )
+        if vector_norm is None or not x.raw.is_floating_point():
+            return generic(x, axis=axis, keepdims=keepdims)
+        return PyTorchTensor(vector_norm(x.raw, ord, dim=axis, keepdim=keepdims))
+
+    return norm
+
+
+def _pytorch_lp(
+    x: PyTorchTensor,
+    p: Union[int, float],
+    axis: Optional[AxisAxes] = None,
+    keepdims: bool = False,
+) -> PyTorchTensor:
+    return _pytorch_norm(p, functools.partial(norms.lp, p=p))(x, axis, keepdims)
+
+
+class PyTorchNormsMethods(NormsMethods[PyTorchTensor]):
+    l0: Callable[..., PyTorchTensor] = _pytorch_norm(0, norms.l0)
+    l1: Callable[..., PyTorchTensor] = _pytorch_norm(1, norms.l1)
+    l2: Callable[..., PyTorchTensor] = _pytorch_norm(2, norms.l2)
+    linf: Callable[..., PyTorchTensor] = _pytorch_norm(norms.inf, norms.linf)
+    lp: Callable[..., PyTorchTensor] = _pytorch_lp
+
+
+def _tensorflow_norm(
+    ord: float, generic: Callable[..., TensorFlowTensor]
+) -> Callable[..., TensorFlowTensor]:
+    def norm(
+        x: TensorFlowTensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+    ) -> TensorFlowTensor:
+        # tf.norm interprets two axes as a matrix norm
+        if not x.raw.dtype.is_floating or not (axis is None or isinstance(axis, int)):
+            return generic(x, axis=axis, keepdims=keepdims)
+        return TensorFlowTensor(
+            tensorflow.tf.norm(x.raw, ord=ord, axis=axis, keepdims=keepdims)
+        )
+
+    return norm
+
+
+def _tensorflow_l0(
+    x: TensorFlowTensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+) -> TensorFlowTensor:
+    if not x.raw.dtype.is_floating:
+        return norms.l0(x, axis=axis, keepdims=keepdims)
+    r = tensorflow.tf.math.count_nonzero(
+        x.raw, axis=axis, keepdims=keepdims, dtype=x.raw.dtype
+    )
+    return TensorFlowTensor(r)
+
+
+def _tensorflow_lp(
+    x: TensorFlowTensor,
+    p: Union[int, float],
+    axis: Optional[AxisAxes] = None,
+    keepdims: bool = False,
+) -> TensorFlowTensor:
+    if p == 0:
+        return _tensorflow_l0(x, axis=axis, keepdims=keepdims)
+    if p < 0:
+        # not supported by tf.norm
+        return norms.lp(x, p, axis=axis, keepdims=keepdims)
+    return _tensorflow_norm(p, functools.partial(norms.lp, p=p))(x, axis, keepdims)
+
+
+class TensorFlowNormsMethods(NormsMethods[TensorFlowTensor]):
+    l0: Callable[..., TensorFlowTensor] = _tensorflow_l0
+    l1: Callable[..., TensorFlowTensor] = _tensorflow_norm(1, norms.l1)
+    l2: Callable[..., TensorFlowTensor] = _tensorflow_norm(2, norms.l2)
+    linf: Callable[..., TensorFlowTensor] = _tensorflow_norm(np.inf, norms.linf)
+    lp: Callable[..., TensorFlowTensor] = _tensorflow_lp
+
+
+# backend-specific versions of the extensions, keyed by the exact tensor
+# class and the name of the generic extension (subclasses of the tensor
+# classes get the generic extension)
+_backend_extensions: Dict[Tuple[type, str], type] = {
+    (NumPyTensor, "NormsMethods"): NumPyNormsMethods,
+    (PyTorchTensor, "NormsMethods"): PyTorchNormsMethods,
+    (TensorFlowTensor, "NormsMethods"): TensorFlowNormsMethods,
+}
+
+
+def get_extension(tensor_class: type, name: str) -> Any:
+    try:
+        return _backend_extensions[tensor_class, name]
+    except KeyError:
+        return globals()[name]
@@ -10,6 +10,7 @@ from typing import (
     overload,
     Callable,
     Type,
+    List,
 )
 from typing_extensions import Literal
 from importlib import import_module
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
     import jax
     import jax.numpy as np
     from .extensions import NormsMethods  # noqa: F401
+    from ..random import Generator  # noqa: F401
 else:
     # lazy import in JAXTensor
     jax = None
@@ -63,7 +65,6 @@ class JAXTensor(BaseTensor):
     norms: "NormsMethods[JAXTensor]"
 
     _registered = False
-    key = None
 
     def __new__(cls: Type["JAXTensor"], *args: Any, **kwargs: Any) -> "JAXTensor":
         if not cls._registered:
@@ -91,12 +92,21 @@ class JAXTensor(BaseTensor):
     def raw(self) -> "np.ndarray":  # type: ignore
         return super().raw
 
-    @classmethod
-    def _get_subkey(cls) -> Any:
-        if cls.key is None:
-            cls.key = jax.random.PRNGKey(0)
-        cls.key, subkey = jax.random.split(cls.key)
-        return subkey
+    def _get_subkey(self, generator: Optional["Generator"] = None) -> Any:
+        if generator is None:
+            from ..random import default_generator
+
+            generator = default_generator()
+        if isinstance(self.raw, jax.core.Tracer):
+            # inside jax.jit, a key drawn now would become a constant of the
+            # compiled function, so the key is drawn when it is executed;
+            # checking self instead of the trace state needs no allocation
+            from jax.experimental import io_callback
+
+            spec = jax.eval_shape(lambda: jax.random.PRNGKey(0))
+            g = generator
+            return io_callback(lambda: onp.asarray(g._jax_key()), spec, ordered=True)
+        return generator._jax_key()
 
     def numpy(self) -> Any:
         a = onp.asarray(self.raw)
@@ -174,22 +184,46 @@ class JAXTensor(BaseTensor):
     def sort(self: TensorType, axis: int = -1) -> TensorType:
         return type(self)(self.raw.sort(axis=axis))
 
+    def topk(self: TensorType, k: int, axis: int = -1) -> Tuple[TensorType, TensorType]:
+        # top_k always works on the last axis
+        x = np.moveaxis(self.raw, axis, -1)
+        values, indices = jax.lax.top_k(x, k)
+        values = np.moveaxis(values, -1, axis)
+        indices = np.moveaxis(indices, -1, axis)
+        return type(self)(values), type(self)(indices)
+
+    def partition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        return type(self)(np.partition(self.raw, kth, axis=axis))
+
+    def argpartition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        return type(self)(np.argpartition(self.raw, kth, axis=axis))
+
     def uniform(
-        self: TensorType, shape: ShapeOrScalar, low: float = 0.0, high: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        low: float = 0.0,
+        high: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
         if not isinstance(shape, Iterable):
             shape = (shape,)
 
-        subkey = self._get_subkey()
+        subkey = self._get_subkey(generator)
         return type(self)(jax.random.uniform(subkey, shape, minval=low, maxval=high))
 
     def normal(
-        self: TensorType, shape: ShapeOrScalar, mean: float = 0.0, stddev: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        mean: float = 0.0,
+        stddev: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
         if not isinstance(shape, Iterable):
             shape = (shape,)
 
-        subkey = self._get_subkey()
+        subkey = self._get_subkey(generator)
         return type(self)(jax.random.normal(subkey, shape) * stddev + mean)
 
     def ones(self: TensorType, shape: ShapeOrScalar) -> TensorType:
@@ -210,15 +244,11 @@ class JAXTensor(BaseTensor):
     def onehot_like(
         self: TensorType, indices: TensorType, *, value: float = 1
     ) -> TensorType:
-        if self.ndim != 2:
-            raise ValueError("onehot_like only supported for 2D tensors")
-        if indices.ndim != 1:
-            raise ValueError("onehot_like requires 1D indices")
-        if len(indices) != len(self):
-            raise ValueError("length of indices must match length of tensor")
-        x = np.arange(self.raw.shape[1]).reshape(1, -1)
-        indices = indices.raw.reshape(-1, 1)
-        return type(self)((x == indices) * value)
+        if indices.shape != self.shape[:-1]:
+            raise ValueError("shape of indices must match shape of tensor[..., 0]")
+        x = np.arange(self.raw.shape[-1])
+        hot = x == indices.raw[..., np.newaxis]
+        return type(self)((hot * value).astype(self.raw.dtype))
 
     def from_numpy(self: TensorType, a: Any) -> TensorType:
         return type(self)(np.asarray(a))
@@ -459,6 +489,35 @@ class JAXTensor(BaseTensor):
 
         return value_and_grad
 
+    def _jit(self: TensorType, f: Callable[..., Any]) -> Callable[..., Any]:
+        return jax.jit(f)
+
+    def _vmap(
+        self: TensorType, f: Callable[..., Tuple[Any, ...]]
+    ) -> Callable[..., Tuple[Any, ...]]:
+        return jax.vmap(f)
+
+    def _dlpack(self: TensorType) -> Any:
+        return self.raw
+
+    def _data_ptr(self: TensorType) -> Optional[int]:
+        return int(self.raw.unsafe_buffer_pointer())
+
+    @classmethod
+    def _from_dlpack(cls: Type[TensorType], x: Any) -> TensorType:
+        return cls(import_module("jax.dlpack").from_dlpack(x))
+
+    def _scatter(
+        self: TensorType,
+        indices: Tuple[Any, ...],
+        values: Any,
+        mode: str,
+        inplace: bool,
+    ) -> TensorType:
+        if inplace:
+            raise NotImplementedError("JAX arrays cannot be updated in-place")
+        return type(self)(getattr(self.raw.at[indices], mode)(values))
+
     def sign(self: TensorType) -> TensorType:
         return type(self)(np.sign(self.raw))
 
@@ -508,11 +567,23 @@ class JAXTensor(BaseTensor):
         return type(self)(self.raw[index])
 
     def take_along_axis(self: TensorType, index: TensorType, axis: int) -> TensorType:
-        if axis % self.ndim != self.ndim - 1:
-            raise NotImplementedError(
-                "take_along_axis is currently only supported for the last axis"
-            )
         return type(self)(np.take_along_axis(self.raw, index.raw, axis=axis))
 
+    def put_along_axis(
+        self: TensorType, index: TensorType, values: TensorOrScalar, axis: int
+    ) -> TensorType:
+        values = unwrap1(values)
+        put = getattr(np, "put_along_axis", None)
+        if put is not None:
+            x = put(self.raw, index.raw, values, axis=axis, inplace=False)
+            return type(self)(x)
+        # older versions: index all axes, like np.put_along_axis does internally
+        grid: List[Any] = list(onp.ogrid[tuple(slice(n) for n in self.shape)])
+        grid[axis] = index.raw
+        return type(self)(self.raw.at[tuple(grid)].set(values))
+
+    def gather(self: TensorType, indices: TensorType, axis: int = 0) -> TensorType:
+        return type(self)(np.take(self.raw, indices.raw, axis=axis))
+
     def bool(self: TensorType) -> TensorType:
         return self.astype(np.bool_)
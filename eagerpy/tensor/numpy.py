@@ -1,15 +1,21 @@
 from typing import (
     Tuple,
+    TypeVar,
+    Iterator,
     cast,
     Union,
     Any,
     Iterable,
     Optional,
+    Type,
     overload,
     Callable,
     TYPE_CHECKING,
 )
 from typing_extensions import Literal
+import functools
+import threading
+import os
 import numpy as np
 
 from ..types import Axes, AxisAxes, Shape, ShapeOrScalar
@@ -22,8 +28,15 @@ from .base import BaseTensor
 from .base import unwrap_
 from .base import unwrap1
 
+from ..lazy import Expr
+from ..lazy import is_enabled as is_lazy
+
 if TYPE_CHECKING:
     from .extensions import NormsMethods  # noqa: F401
+    from ..random import Generator  # noqa: F401
+
+
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 def assert_bool(x: Any) -> None:
@@ -33,6 +46,207 @@ def assert_bool(x: Any) -> None:
         raise ValueError(f"requires dtype bool, got {x.dtype}, consider t.bool().all()")
 
 
+def _tensors(args: Iterable[Any]) -> Iterator[Any]:
+    for x in args:
+        if isinstance(x, (tuple, list)):
+            yield from x
+        else:
+            yield x
+
+
+def promote(f: F) -> F:
+    # like Python does for the reflected operators, arguments that are
+    # instances of a subclass of NumPyTensor (e.g. the traced tensors used
+    # for autodiff) get to handle the call
+    @functools.wraps(f)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if type(self) is NumPyTensor:
+            for x in _tensors(args):
+                if isinstance(x, NumPyTensor) and type(x) is not NumPyTensor:
+                    method = getattr(type(x), f.__name__)
+                    return method(type(x)(self.raw), *args, **kwargs)
+        return f(self, *args, **kwargs)
+
+    return cast(F, wrapper)
+
+
+def _lazy(t: TensorType, ufunc: np.ufunc, *args: Any) -> TensorType:
+    args = tuple(x._raw if isinstance(x, NumPyTensor) else unwrap1(x) for x in args)
+    return type(t)(Expr(ufunc, *args))
+
+
+# reductions of memory-mapped arrays larger than this many bytes are
+# evaluated block by block, so that only one block has to be in memory
+BLOCK_SIZE = 1 << 22
+
+
+def _is_mapped(x: Any) -> bool:
+    return isinstance(x, np.memmap) and x.nbytes > BLOCK_SIZE
+
+
+def _axes(ndim: int, axis: Optional[AxisAxes]) -> Tuple[int, ...]:
+    if axis is None:
+        return tuple(range(ndim))
+    if isinstance(axis, int):
+        axis = (axis,)
+    return tuple(a % ndim for a in axis)
+
+
+def _reduce_blocks(
+    x: "np.ndarray",
+    reduce: Callable[..., Any],
+    combine: np.ufunc,
+    axis: Optional[AxisAxes],
+    keepdims: bool,
+    f: Optional[Callable[..., Any]] = None,
+) -> Any:
+    # applies f and reduce to blocks of rows of x; the partial results
+    # are combined if the first axis is reduced and concatenated otherwise
+    axes = _axes(x.ndim, axis)
+    rows = max(1, BLOCK_SIZE // max(1, x[:1].nbytes))
+    parts = []
+    result = None
+    for start in range(0, x.shape[0], rows):
+        block = np.asarray(x[start : start + rows])
+        if f is not None:
+            block = f(block)
+        r = reduce(block, axis=axes, keepdims=True)
+        if 0 not in axes:
+            parts.append(r)
+        elif result is None:
+            result = r
+        else:
+            combine(result, r, out=result)
+    if 0 not in axes:
+        result = np.concatenate(parts)
+    assert result is not None
+    if not keepdims:
+        result = result.squeeze(axis=axes)
+    return result[()] if result.ndim == 0 else result
+
+
+def _mean_blocks(x: "np.ndarray", axis: Optional[AxisAxes], keepdims: bool) -> Any:
+    total = _reduce_blocks(
+        x, functools.partial(np.sum, dtype=np.float64), np.add, axis, keepdims
+    )
+    n = int(np.prod([x.shape[a] for a in _axes(x.ndim, axis)]))
+    return (total / n).astype(x.dtype)
+
+
+def _softmax_into(
+    x: "np.ndarray", out: "np.ndarray", axis: int, log: bool, scratch: Any = None
+) -> None:
+    # for numerical reasons we subtract the max logit
+    # (mathematically it doesn't matter!)
+    # otherwise exp(logits) might become too large or too small
+    np.subtract(x, x.max(axis=axis, keepdims=True), out=out)
+    if log:
+        e = np.exp(out, out=scratch)
+        np.subtract(out, np.log(e.sum(axis=axis, keepdims=True)), out=out)
+    else:
+        np.exp(out, out=out)
+        np.divide(out, out.sum(axis=axis, keepdims=True), out=out)
+
+
+def _softmax(x: "np.ndarray", axis: int, log: bool) -> "np.ndarray":
+    # writes into a single output array and, for rows with more than
+    # BLOCK_SIZE bytes in total, works on blocks of rows so that the
+    # intermediate results stay in the cache
+    out = np.empty(x.shape, dtype=np.result_type(x.dtype, np.float16))
+    if axis % x.ndim != x.ndim - 1:
+        _softmax_into(x, out, axis, log)
+        return out
+    x2 = x.reshape(-1, x.shape[-1])
+    out2 = out.reshape(-1, x.shape[-1])
+    rows = max(1, BLOCK_SIZE // max(1, out2[:1].nbytes))
+    scratch = np.empty_like(out2[:rows]) if log else None
+    for start in range(0, len(x2), rows):
+        block = slice(start, start + rows)
+        n = len(out2[block])
+        s = None if scratch is None else scratch[:n]
+        _softmax_into(x2[block], out2[block], -1, log, s)
+    return out
+
+
+def _kl_div_into(
+    p: "np.ndarray", q: "np.ndarray", out: "np.ndarray", axis: int, scratch: Any
+) -> None:
+    log_p, log_q, e = scratch
+    _softmax_into(p, log_p, axis, True, e)
+    _softmax_into(q, log_q, axis, True, e)
+    np.subtract(log_p, log_q, out=log_q)
+    # p is derived from log p instead of computing another softmax
+    np.exp(log_p, out=log_p)
+    np.multiply(log_p, log_q, out=log_p)
+    log_p.sum(axis=axis, keepdims=True, out=out)
+
+
+def _kl_div_with_logits(
+    p: "np.ndarray", q: "np.ndarray", axis: int, keepdims: bool
+) -> "np.ndarray":
+    # like _softmax, all intermediate results live in three scratch arrays
+    # that, for the last axis, only hold a block of rows at a time
+    if p.ndim != q.ndim or p.shape[axis] != q.shape[axis]:
+        # an input that is broadcasted along axis must be normalized before
+        # it is broadcasted, which the fused kernel cannot do
+        log_p = _softmax(p, axis, True)
+        log_q = _softmax(q, axis, True)
+        kl = np.exp(log_p) * (log_p - log_q)
+        return kl.sum(axis=axis, keepdims=keepdims)  # type: ignore
+    p, q = np.broadcast_arrays(p, q)
+    dtype = np.result_type(p.dtype, q.dtype, np.float16)
+    axis = axis % p.ndim
+    shape = p.shape[:axis] + (1,) + p.shape[axis + 1 :]
+    out = np.empty(shape, dtype=dtype)
+    if axis != p.ndim - 1:
+        scratch = tuple(np.empty(p.shape, dtype=dtype) for _ in range(3))
+        _kl_div_into(p, q, out, axis, scratch)
+    else:
+        p2 = p.reshape(-1, p.shape[-1])
+        q2 = q.reshape(-1, q.shape[-1])
+        out2 = out.reshape(-1, 1)
+        rows = max(1, BLOCK_SIZE // max(1, p.shape[-1] * dtype.itemsize))
+        buffers = [np.empty((min(rows, len(p2)), p.shape[-1]), dtype) for _ in range(3)]
+        for start in range(0, len(p2), rows):
+            block = slice(start, start + rows)
+            n = len(p2[block])
+            scratch = tuple(b[:n] for b in buffers)
+            _kl_div_into(p2[block], q2[block], out2[block], -1, scratch)
+    return out if keepdims else out.squeeze(axis=axis)
+
+
+# every thread samples from its own generator, spawned from a common
+# SeedSequence, so that the streams are independent and need no lock
+_seed_sequence = np.random.SeedSequence()
+_seed_sequence_lock = threading.Lock()
+_thread_local = threading.local()
+
+
+def _default_rng() -> "np.random.Generator":
+    rng = getattr(_thread_local, "rng", None)
+    if rng is None:
+        with _seed_sequence_lock:
+            (seed,) = _seed_sequence.spawn(1)
+        rng = _thread_local.rng = np.random.Generator(np.random.PCG64(seed))
+    return cast(np.random.Generator, rng)
+
+
+def _reset_rng() -> None:
+    # forked processes would otherwise continue the streams of the parent
+    global _seed_sequence, _thread_local
+    _seed_sequence = np.random.SeedSequence()
+    _thread_local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):  # Python 3.7 and newer
+    os.register_at_fork(after_in_child=_reset_rng)
+
+
+def _sample_dtype(x: Any) -> Any:
+    # the generators can directly sample float32 and float64 numbers
+    return x.dtype if x.dtype in (np.float32, np.float64) else np.float64
+
+
 class NumPyTensor(BaseTensor):
     __slots__ = ()
 
@@ -44,7 +258,74 @@ class NumPyTensor(BaseTensor):
 
     @property
     def raw(self) -> "np.ndarray":  # type: ignore
-        return super().raw
+        raw = self._raw
+        if isinstance(raw, Expr):
+            raw = self._raw = raw.evaluate()
+        return cast(np.ndarray, raw)
+
+    @property
+    def dtype(self) -> Any:
+        return self._raw.dtype
+
+    @property
+    def ndim(self) -> int:
+        return cast(int, self._raw.ndim)
+
+    def __abs__(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.absolute, self)
+        return super().__abs__()
+
+    def __neg__(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.negative, self)
+        return super().__neg__()
+
+    def __add__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.add, self, other)
+        return super().__add__(other)
+
+    def __radd__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.add, other, self)
+        return super().__radd__(other)
+
+    def __sub__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.subtract, self, other)
+        return super().__sub__(other)
+
+    def __rsub__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.subtract, other, self)
+        return super().__rsub__(other)
+
+    def __mul__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.multiply, self, other)
+        return super().__mul__(other)
+
+    def __rmul__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.multiply, other, self)
+        return super().__rmul__(other)
+
+    def __truediv__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.true_divide, self, other)
+        return super().__truediv__(other)
+
+    def __rtruediv__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.true_divide, other, self)
+        return super().__rtruediv__(other)
+
+    @promote
+    def __pow__(self: TensorType, exponent: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.power, self, exponent)
+        return super().__pow__(exponent)
 
     def numpy(self: TensorType) -> Any:
         a = self.raw.view()
@@ -58,8 +339,8 @@ class NumPyTensor(BaseTensor):
         return self.raw.item()  # type: ignore
 
     @property
-    def shape(self: TensorType) -> Shape:
-        return cast(Tuple, self.raw.shape)
+    def shape(self) -> Shape:
+        return cast(Tuple, self._raw.shape)
 
     def reshape(self: TensorType, shape: Union[Shape, int]) -> TensorType:
         if isinstance(shape, int):
@@ -70,17 +351,26 @@ class NumPyTensor(BaseTensor):
         return type(self)(self.raw.astype(dtype))
 
     def clip(self: TensorType, min_: float, max_: float) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.minimum, _lazy(self, np.maximum, self, min_), max_)
         return type(self)(np.clip(self.raw, min_, max_))
 
     def square(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.square, self)
         return type(self)(np.square(self.raw))
 
     def arctanh(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.arctanh, self)
         return type(self)(np.arctanh(self.raw))
 
     def sum(
         self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
     ) -> TensorType:
+        if _is_mapped(self.raw):
+            x = _reduce_blocks(self.raw, np.sum, np.add, axis, keepdims)
+            return type(self)(x)
         return type(self)(self.raw.sum(axis=axis, keepdims=keepdims))
 
     def prod(
@@ -95,22 +385,36 @@ class NumPyTensor(BaseTensor):
             raise ValueError(
                 f"Can only calculate the mean of floating types. Got {self.raw.dtype} instead."
             )
+        if _is_mapped(self.raw):
+            return type(self)(_mean_blocks(self.raw, axis, keepdims))
         return type(self)(self.raw.mean(axis=axis, keepdims=keepdims))
 
     def min(
         self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
     ) -> TensorType:
+        if _is_mapped(self.raw):
+            x = _reduce_blocks(self.raw, np.min, np.minimum, axis, keepdims)
+            return type(self)(x)
         return type(self)(self.raw.min(axis=axis, keepdims=keepdims))
 
     def max(
         self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
     ) -> TensorType:
+        if _is_mapped(self.raw):
+            x = _reduce_blocks(self.raw, np.max, np.maximum, axis, keepdims)
+            return type(self)(x)
         return type(self)(self.raw.max(axis=axis, keepdims=keepdims))
 
+    @promote
     def minimum(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.minimum, self, other)
         return type(self)(np.minimum(self.raw, unwrap1(other)))
 
+    @promote
     def maximum(self: TensorType, other: TensorOrScalar) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.maximum, self, other)
         return type(self)(np.maximum(self.raw, unwrap1(other)))
 
     def argmin(self: TensorType, axis: Optional[int] = None) -> TensorType:
@@ -125,15 +429,64 @@ class NumPyTensor(BaseTensor):
     def sort(self: TensorType, axis: int = -1) -> TensorType:
         return type(self)(np.sort(self.raw, axis=axis))
 
+    def topk(self: TensorType, k: int, axis: int = -1) -> Tuple[TensorType, TensorType]:
+        # only the k largest entries selected by argpartition are sorted
+        x = self.raw
+        axis = axis % x.ndim
+        n = x.shape[axis]
+        if not 0 <= k <= n:
+            raise ValueError(f"k must be between 0 and {n}, got {k}")
+        if k == 0:
+            index = np.empty(x.shape[:axis] + (0,) + x.shape[axis + 1 :], np.intp)
+        else:
+            index = np.argpartition(x, n - k, axis=axis)
+            index = index[(slice(None),) * axis + (slice(n - k, None),)]
+        order = np.argsort(np.take_along_axis(x, index, axis=axis), axis=axis)
+        indices = type(self)(np.take_along_axis(index, np.flip(order, axis), axis))
+        return self.take_along_axis(indices, axis), indices
+
+    def partition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        return type(self)(np.partition(self.raw, kth, axis=axis))
+
+    def argpartition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        return type(self)(np.argpartition(self.raw, kth, axis=axis))
+
     def uniform(
-        self: TensorType, shape: ShapeOrScalar, low: float = 0.0, high: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        low: float = 0.0,
+        high: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
-        return type(self)(np.random.uniform(low, high, size=shape))
+        dtype = _sample_dtype(self.raw)
+        if generator is not None:
+            with generator._state("numpy", np.random.default_rng) as rng:
+                x = rng.random(shape, dtype=dtype)
+        else:
+            x = _default_rng().random(shape, dtype=dtype)
+        # in-place to avoid temporaries
+        x *= high - low
+        x += low
+        return type(self)(x)
 
     def normal(
-        self: TensorType, shape: ShapeOrScalar, mean: float = 0.0, stddev: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        mean: float = 0.0,
+        stddev: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
-        return type(self)(np.random.normal(mean, stddev, size=shape))
+        dtype = _sample_dtype(self.raw)
+        if generator is not None:
+            with generator._state("numpy", np.random.default_rng) as rng:
+                x = rng.standard_normal(shape, dtype=dtype)
+        else:
+            x = _default_rng().standard_normal(shape, dtype=dtype)
+        x *= stddev
+        x += mean
+        return type(self)(x)
 
     def ones(self: TensorType, shape: ShapeOrScalar) -> TensorType:
         return type(self)(np.ones(shape, dtype=self.raw.dtype))
@@ -153,20 +506,16 @@ class NumPyTensor(BaseTensor):
     def onehot_like(
         self: TensorType, indices: TensorType, *, value: float = 1
     ) -> TensorType:
-        if self.ndim != 2:
-            raise ValueError("onehot_like only supported for 2D tensors")
-        if indices.ndim != 1:
-            raise ValueError("onehot_like requires 1D indices")
-        if len(indices) != len(self):
-            raise ValueError("length of indices must match length of tensor")
+        if indices.shape != self.shape[:-1]:
+            raise ValueError("shape of indices must match shape of tensor[..., 0]")
         x = np.zeros_like(self.raw)
-        rows = np.arange(len(x))
-        x[rows, indices.raw] = value
+        np.put_along_axis(x, indices.raw[..., np.newaxis], value, axis=-1)
         return type(self)(x)
 
     def from_numpy(self: TensorType, a: Any) -> TensorType:
         return type(self)(np.asarray(a))
 
+    @promote
     def _concatenate(
         self: TensorType, tensors: Iterable[TensorType], axis: int = 0
     ) -> TensorType:
@@ -174,6 +523,7 @@ class NumPyTensor(BaseTensor):
         tensors_ = unwrap_(*tensors)
         return type(self)(np.concatenate(tensors_, axis=axis))
 
+    @promote
     def _stack(
         self: TensorType, tensors: Iterable[TensorType], axis: int = 0
     ) -> TensorType:
@@ -213,18 +563,28 @@ class NumPyTensor(BaseTensor):
         return type(self)(np.logical_not(self.raw))
 
     def exp(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.exp, self)
         return type(self)(np.exp(self.raw))
 
     def log(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.log, self)
         return type(self)(np.log(self.raw))
 
     def log2(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.log2, self)
         return type(self)(np.log2(self.raw))
 
     def log10(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.log10, self)
         return type(self)(np.log10(self.raw))
 
     def log1p(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.log1p, self)
         return type(self)(np.log1p(self.raw))
 
     def tile(self: TensorType, multiples: Axes) -> TensorType:
@@ -234,22 +594,16 @@ class NumPyTensor(BaseTensor):
         return type(self)(np.tile(self.raw, multiples))
 
     def softmax(self: TensorType, axis: int = -1) -> TensorType:
-        # for numerical reasons we subtract the max logit
-        # (mathematically it doesn't matter!)
-        # otherwise exp(logits) might become too large or too small
-        logits = self.raw
-        logits = logits - logits.max(axis=axis, keepdims=True)
-        e = np.exp(logits)
-        return type(self)(e / e.sum(axis=axis, keepdims=True))
+        return type(self)(_softmax(self.raw, axis, log=False))
 
     def log_softmax(self: TensorType, axis: int = -1) -> TensorType:
-        # for numerical reasons we subtract the max logit
-        # (mathematically it doesn't matter!)
-        # otherwise exp(logits) might become too large or too small
-        logits = self.raw
-        logits = logits - logits.max(axis=axis, keepdims=True)
-        log_sum_exp = np.log(np.exp(logits).sum(axis=axis, keepdims=True))
-        return type(self)(logits - log_sum_exp)
+        return type(self)(_softmax(self.raw, axis, log=True))
+
+    @promote
+    def _kl_div_with_logits(
+        self: TensorType, logits_q: TensorType, axis: int, keepdims: bool
+    ) -> TensorType:
+        return type(self)(_kl_div_with_logits(self.raw, logits_q.raw, axis, keepdims))
 
     def squeeze(self: TensorType, axis: Optional[AxisAxes] = None) -> TensorType:
         return type(self)(self.raw.squeeze(axis=axis))
@@ -260,6 +614,7 @@ class NumPyTensor(BaseTensor):
     def full(self: TensorType, shape: ShapeOrScalar, value: float) -> TensorType:
         return type(self)(np.full(shape, value, dtype=self.raw.dtype))
 
+    @promote
     def index_update(
         self: TensorType, indices: Any, values: TensorOrScalar
     ) -> TensorType:
@@ -329,16 +684,20 @@ class NumPyTensor(BaseTensor):
             raise ValueError("crossentropy only supported for 2D logits tensors")
         if self.shape[:1] != labels.shape:
             raise ValueError("labels must be 1D and must match the length of logits")
-        # for numerical reasons we subtract the max logit
-        # (mathematically it doesn't matter!)
-        # otherwise exp(logits) might become too large or too small
+        # like _softmax, but only the sums of the exponentials are kept
         logits = self.raw
-        logits = logits - logits.max(axis=1, keepdims=True)
-        e = np.exp(logits)
-        s = np.sum(e, axis=1)
-        ces = np.log(s) - np.take_along_axis(
-            logits, labels.raw[:, np.newaxis], axis=1
-        ).squeeze(axis=1)
+        dtype = np.result_type(logits.dtype, np.float16)
+        ces = np.empty(len(logits), dtype=dtype)
+        rows = max(1, BLOCK_SIZE // max(1, logits.shape[1] * dtype.itemsize))
+        scratch = np.empty((min(rows, len(logits)), logits.shape[1]), dtype=dtype)
+        for start in range(0, len(logits), rows):
+            block = slice(start, start + rows)
+            x = logits[block]
+            m = x.max(axis=1)
+            e = np.subtract(x, m[:, np.newaxis], out=scratch[: len(x)])
+            np.exp(e, out=e)
+            np.log(e.sum(axis=1), out=ces[block])
+            ces[block] -= x[np.arange(len(x)), labels.raw[block]] - m
         return type(self)(ces)
 
     @overload
@@ -364,25 +723,91 @@ class NumPyTensor(BaseTensor):
     def _value_and_grad_fn(  # noqa: F811 (waiting for pyflakes > 2.1.1)
         self: TensorType, f: Callable, has_aux: bool = False
     ) -> Callable[..., Tuple]:
-        # TODO: maybe implement this using https://github.com/HIPS/autograd
-        raise NotImplementedError  # pragma: no cover
+        from .numpy_autodiff import value_and_grad_fn
+
+        return value_and_grad_fn(f, has_aux=has_aux)
+
+    def _jit(self: TensorType, f: Callable[..., Any]) -> Callable[..., Any]:
+        return f
+
+    def _vmap(
+        self: TensorType, f: Callable[..., Tuple[Any, ...]]
+    ) -> Callable[..., Tuple[Any, ...]]:
+        # a compatibility loop, not a vectorization: calling f once on the
+        # whole batch would be faster, but nothing guarantees that f treats
+        # the samples independently (e.g. x - x.mean() does not)
+        def vmapped(*args: Any) -> Tuple[Any, ...]:
+            n = len(args[0])
+            if n == 0:
+                raise ValueError("vmap requires a non-empty batch axis")
+            results: Tuple[Any, ...] = ()
+            for i in range(n):
+                outputs = f(*(x[i] for x in args))
+                if i == 0:
+                    # preallocate the outputs instead of stacking them later
+                    results = tuple(
+                        np.empty((n,) + np.shape(y), dtype=np.result_type(y))
+                        for y in outputs
+                    )
+                for r, y in zip(results, outputs):
+                    r[i] = y
+            return results
+
+        return vmapped
+
+    def _dlpack(self: TensorType) -> Any:
+        return np.asarray(self.raw)
+
+    def _data_ptr(self: TensorType) -> Optional[int]:
+        if not isinstance(self.raw, np.ndarray):
+            # NumPy scalars are copied when they are converted to arrays
+            return None
+        return int(self.raw.ctypes.data)
+
+    @classmethod
+    def _from_dlpack(cls: Type[TensorType], x: Any) -> TensorType:
+        return cls(np.from_dlpack(x))
+
+    def _scatter(
+        self: TensorType,
+        indices: Tuple[Any, ...],
+        values: Any,
+        mode: str,
+        inplace: bool,
+    ) -> TensorType:
+        x = self.raw if inplace else self.raw.copy()
+        if mode == "set":
+            x[indices] = values
+        elif mode == "add":
+            np.add.at(x, indices, values)
+        else:
+            np.maximum.at(x, indices, values)
+        return type(self)(x)
 
     def sign(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.sign, self)
         return type(self)(np.sign(self.raw))
 
     def sqrt(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.sqrt, self)
         return type(self)(np.sqrt(self.raw))
 
     def tanh(self: TensorType) -> TensorType:
+        if is_lazy():
+            return _lazy(self, np.tanh, self)
         return type(self)(np.tanh(self.raw))
 
     def float32(self: TensorType) -> TensorType:
         return self.astype(np.float32)
 
+    @promote
     def where(self: TensorType, x: TensorOrScalar, y: TensorOrScalar) -> TensorType:
         x, y = unwrap_(x, y)
         return type(self)(np.where(self.raw, x, y))
 
+    @promote
     def matmul(self: TensorType, other: TensorType) -> TensorType:
         if self.ndim != 2 or other.ndim != 2:
             raise ValueError(
@@ -416,11 +841,17 @@ class NumPyTensor(BaseTensor):
         return type(self)(self.raw[index])
 
     def take_along_axis(self: TensorType, index: TensorType, axis: int) -> TensorType:
-        if axis % self.ndim != self.ndim - 1:
-            raise NotImplementedError(
-                "take_along_axis is currently only supported for the last axis"
-            )
         return type(self)(np.take_along_axis(self.raw, index.raw, axis=axis))
 
+    def put_along_axis(
+        self: TensorType, index: TensorType, values: TensorOrScalar, axis: int
+    ) -> TensorType:
+        x = self.raw.copy()
+        np.put_along_axis(x, index.raw, unwrap1(values), axis=axis)
+        return type(self)(x)
+
+    def gather(self: TensorType, indices: TensorType, axis: int = 0) -> TensorType:
+        return type(self)(np.take(self.raw, indices.raw, axis=axis))
+
     def bool(self: TensorType) -> TensorType:
         return self.astype(np.dtype("bool"))
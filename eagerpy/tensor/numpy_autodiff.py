@@ -0,0 +1,685 @@
+"""Reverse-mode automatic differentiation for NumPy tensors
+
+Operations on a TracedNumPyTensor are executed like on a NumPyTensor, but
+each result also remembers which traced inputs it was computed from and how
+to propagate a gradient back to them (its vector-Jacobian products).
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import itertools
+import numpy as np
+
+from ..types import AxisAxes
+
+from .tensor import Tensor
+
+from .base import unwrap1
+
+from .numpy import NumPyTensor
+
+
+VJP = Callable[[Any], Any]
+Rule = Callable[..., List[Tuple[Any, VJP]]]
+
+_order = itertools.count()
+
+
+class Node:
+    __slots__ = ("parents", "order")
+
+    def __init__(self, parents: Sequence[Tuple["Node", VJP]]):
+        self.parents = parents
+        # parents are always created before their children, so processing
+        # the nodes in reverse creation order is a valid topological order
+        self.order = next(_order)
+
+
+class TracedNumPyTensor(NumPyTensor):
+    __slots__ = ("_node",)
+
+    def __init__(self, raw: "np.ndarray", node: Optional[Node] = None):
+        super().__init__(raw)
+        self._node = node
+
+
+_rules: Dict[str, Rule] = {}
+
+
+def defvjp(*names: str) -> Callable[[Rule], Rule]:
+    """Registers a rule for the methods with the given names. A rule is
+    called with the result and the arguments of the method and returns pairs
+    of inputs and functions that map the gradient of the result to the
+    gradient of that input."""
+
+    def decorator(rule: Rule) -> Rule:
+        for name in names:
+            _rules[name] = rule
+        return rule
+
+    return decorator
+
+
+def _raw(x: Any) -> Any:
+    return unwrap1(x)
+
+
+def _unbroadcast(g: Any, x: Any) -> Any:
+    # sums the gradient over the axes along which x has been broadcasted
+    shape = np.shape(_raw(x))
+    while g.ndim > len(shape):
+        g = g.sum(axis=0)
+    axes = tuple(i for i, n in enumerate(shape) if n == 1 and g.shape[i] != 1)
+    if axes:
+        g = g.sum(axis=axes, keepdims=True)
+    return g
+
+
+def _axes(ndim: int, axis: Optional[AxisAxes]) -> Tuple[int, ...]:
+    if axis is None:
+        return tuple(range(ndim))
+    if isinstance(axis, int):
+        axis = (axis,)
+    return tuple(sorted(a % ndim for a in axis))
+
+
+def _keepdims(g: Any, ndim: int, axis: Optional[AxisAxes], keepdims: bool) -> Any:
+    # reinserts the axes that have been removed by a reduction
+    if keepdims:
+        return g
+    return np.expand_dims(g, _axes(ndim, axis))
+
+
+# #############################################################################
+# elementwise operations
+# #############################################################################
+
+
+@defvjp("__abs__")
+def _abs(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g * np.sign(x.raw))]
+
+
+@defvjp("__neg__")
+def _neg(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: -g)]
+
+
+@defvjp("__add__", "__radd__")
+def _add(ans: Any, x: Tensor, y: Any) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: _unbroadcast(g, x)), (y, lambda g: _unbroadcast(g, y))]
+
+
+@defvjp("__sub__")
+def _sub(ans: Any, x: Tensor, y: Any) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: _unbroadcast(g, x)), (y, lambda g: _unbroadcast(-g, y))]
+
+
+@defvjp("__rsub__")
+def _rsub(ans: Any, x: Tensor, y: Any) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: _unbroadcast(-g, x)), (y, lambda g: _unbroadcast(g, y))]
+
+
+@defvjp("__mul__", "__rmul__")
+def _mul(ans: Any, x: Tensor, y: Any) -> List[Tuple[Any, VJP]]:
+    return [
+        (x, lambda g: _unbroadcast(g * _raw(y), x)),
+        (y, lambda g: _unbroadcast(g * x.raw, y)),
+    ]
+
+
+@defvjp("__truediv__")
+def _truediv(ans: Any, x: Tensor, y: Any) -> List[Tuple[Any, VJP]]:
+    return [
+        (x, lambda g: _unbroadcast(g / _raw(y), x)),
+        (y, lambda g: _unbroadcast(-g * ans.raw / _raw(y), y)),
+    ]
+
+
+@defvjp("__rtruediv__")
+def _rtruediv(ans: Any, x: Tensor, y: Any) -> List[Tuple[Any, VJP]]:
+    return [
+        (x, lambda g: _unbroadcast(-g * ans.raw / x.raw, x)),
+        (y, lambda g: _unbroadcast(g / x.raw, y)),
+    ]
+
+
+@defvjp("__mod__")
+def _mod(ans: Any, x: Tensor, y: Any) -> List[Tuple[Any, VJP]]:
+    return [
+        (x, lambda g: _unbroadcast(g, x)),
+        (y, lambda g: _unbroadcast(-g * np.floor_divide(x.raw, _raw(y)), y)),
+    ]
+
+
+@defvjp("__pow__")
+def _pow(ans: Any, x: Tensor, exponent: Any) -> List[Tuple[Any, VJP]]:
+    def vjp_x(g: Any) -> Any:
+        e = _raw(exponent)
+        return _unbroadcast(g * e * x.raw ** np.where(e == 0, 1, e - 1), x)
+
+    def vjp_exponent(g: Any) -> Any:
+        # the derivative w.r.t. the exponent is only defined for x > 0
+        log = np.log(np.where(x.raw > 0, x.raw, 1))
+        return _unbroadcast(g * ans.raw * log, exponent)
+
+    return [(x, vjp_x), (exponent, vjp_exponent)]
+
+
+@defvjp("square")
+def _square(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g * 2 * x.raw)]
+
+
+@defvjp("sqrt")
+def _sqrt(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g / (2 * ans.raw))]
+
+
+@defvjp("exp")
+def _exp(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g * ans.raw)]
+
+
+@defvjp("log")
+def _log(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g / x.raw)]
+
+
+@defvjp("log2")
+def _log2(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g / (x.raw * np.log(2)).astype(x.dtype))]
+
+
+@defvjp("log10")
+def _log10(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g / (x.raw * np.log(10)).astype(x.dtype))]
+
+
+@defvjp("log1p")
+def _log1p(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g / (1 + x.raw))]
+
+
+@defvjp("tanh")
+def _tanh(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g * (1 - np.square(ans.raw)))]
+
+
+@defvjp("arctanh")
+def _arctanh(ans: Any, x: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g / (1 - np.square(x.raw)))]
+
+
+@defvjp("clip")
+def _clip(ans: Any, x: Tensor, min_: float, max_: float) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g * ((x.raw >= min_) & (x.raw <= max_)))]
+
+
+@defvjp("minimum")
+def _minimum(ans: Any, x: Tensor, other: Any) -> List[Tuple[Any, VJP]]:
+    def mask() -> Any:
+        # like JAX, we split the gradient equally if both values are equal
+        y = _raw(other)
+        return (x.raw < y) + 0.5 * (x.raw == y)
+
+    return [
+        (x, lambda g: _unbroadcast(g * mask(), x)),
+        (other, lambda g: _unbroadcast(g * (1 - mask()), other)),
+    ]
+
+
+@defvjp("maximum")
+def _maximum(ans: Any, x: Tensor, other: Any) -> List[Tuple[Any, VJP]]:
+    def mask() -> Any:
+        y = _raw(other)
+        return (x.raw > y) + 0.5 * (x.raw == y)
+
+    return [
+        (x, lambda g: _unbroadcast(g * mask(), x)),
+        (other, lambda g: _unbroadcast(g * (1 - mask()), other)),
+    ]
+
+
+@defvjp("where")
+def _where(ans: Any, condition: Tensor, x: Any, y: Any) -> List[Tuple[Any, VJP]]:
+    c = condition.raw
+    return [
+        (x, lambda g: _unbroadcast(np.where(c, g, 0), x)),
+        (y, lambda g: _unbroadcast(np.where(c, 0, g), y)),
+    ]
+
+
+@defvjp("astype")
+def _astype(ans: Any, x: Tensor, dtype: Any) -> List[Tuple[Any, VJP]]:
+    if not np.issubdtype(ans.dtype, np.inexact):
+        return []
+    return [(x, lambda g: g.astype(x.dtype))]
+
+
+# #############################################################################
+# reductions
+# #############################################################################
+
+
+@defvjp("sum")
+def _sum(
+    ans: Any, x: Tensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        g = _keepdims(g, x.ndim, axis, keepdims)
+        return np.broadcast_to(g, x.shape)
+
+    return [(x, vjp)]
+
+
+@defvjp("mean")
+def _mean(
+    ans: Any, x: Tensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        n = np.prod([x.shape[i] for i in _axes(x.ndim, axis)])
+        g = _keepdims(g, x.ndim, axis, keepdims) / n
+        return np.broadcast_to(g, x.shape).astype(x.dtype)
+
+    return [(x, vjp)]
+
+
+@defvjp("prod")
+def _prod(
+    ans: Any, x: Tensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        # the product of all other elements, computed from exclusive cumulative
+        # products from both sides instead of ans / x, which fails for zeros
+        axes = _axes(x.ndim, axis)
+        rest = tuple(a for a in range(x.ndim) if a not in axes)
+        t = np.transpose(x.raw, rest + axes)
+        flat = t.reshape(t.shape[: len(rest)] + (-1,))
+        ones = np.ones_like(flat[..., :1])
+        left = np.cumprod(np.concatenate([ones, flat[..., :-1]], axis=-1), axis=-1)
+        right = np.concatenate([ones, np.flip(flat, -1)[..., :-1]], axis=-1)
+        right = np.flip(np.cumprod(right, axis=-1), -1)
+        others = np.transpose((left * right).reshape(t.shape), np.argsort(rest + axes))
+        return _keepdims(g, x.ndim, axis, keepdims) * others
+
+    return [(x, vjp)]
+
+
+@defvjp("min", "max")
+def _min_max(
+    ans: Any, x: Tensor, axis: Optional[AxisAxes] = None, keepdims: bool = False
+) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        # the gradient is split equally between all extreme values
+        mask = x.raw == _keepdims(ans.raw, x.ndim, axis, keepdims)
+        axes = _axes(x.ndim, axis)
+        count = mask.sum(axis=axes, keepdims=True)
+        return _keepdims(g, x.ndim, axis, keepdims) * mask / count
+
+    return [(x, vjp)]
+
+
+@defvjp("cumsum")
+def _cumsum(ans: Any, x: Tensor, axis: Optional[int] = None) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        if axis is None:
+            return g[::-1].cumsum()[::-1].reshape(x.shape)
+        return np.flip(np.flip(g, axis=axis).cumsum(axis=axis), axis=axis)
+
+    return [(x, vjp)]
+
+
+@defvjp("softmax")
+def _softmax(ans: Any, x: Tensor, axis: int = -1) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        p = ans.raw
+        return p * (g - (g * p).sum(axis=axis, keepdims=True))
+
+    return [(x, vjp)]
+
+
+@defvjp("log_softmax")
+def _log_softmax(ans: Any, x: Tensor, axis: int = -1) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        return g - np.exp(ans.raw) * g.sum(axis=axis, keepdims=True)
+
+    return [(x, vjp)]
+
+
+@defvjp("crossentropy")
+def _crossentropy(ans: Any, logits: Tensor, labels: Tensor) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        p = logits.softmax(axis=-1).raw.copy()
+        p[np.arange(len(p)), labels.raw] -= 1
+        return p * g[:, np.newaxis]
+
+    return [(logits, vjp)]
+
+
+@defvjp("_kl_div_with_logits")
+def _kl_div_with_logits(
+    ans: Any, logits_p: Tensor, logits_q: Tensor, axis: int, keepdims: bool
+) -> List[Tuple[Any, VJP]]:
+    # the gradients w.r.t. the log-probabilities are unbroadcasted before
+    # they are propagated through the log_softmax of each input, because an
+    # input can be broadcasted along axis
+    def log_softmax_vjp(g: Any, logits: Tensor) -> Any:
+        g = _unbroadcast(g, logits)
+        return g - logits.softmax(axis=axis).raw * g.sum(axis=axis, keepdims=True)
+
+    def vjp_p(g: Any) -> Any:
+        log_p = logits_p.log_softmax(axis=axis).raw
+        log_q = _raw(logits_q.log_softmax(axis=axis))
+        g = _keepdims(g, max(log_p.ndim, log_q.ndim), axis, keepdims)
+        return log_softmax_vjp(np.exp(log_p) * (log_p - log_q + 1) * g, logits_p)
+
+    def vjp_q(g: Any) -> Any:
+        p, _ = np.broadcast_arrays(logits_p.softmax(axis=axis).raw, _raw(logits_q))
+        g = _keepdims(g, p.ndim, axis, keepdims)
+        return log_softmax_vjp(-p * g, logits_q)
+
+    return [(logits_p, vjp_p), (logits_q, vjp_q)]
+
+
+@defvjp("matmul")
+def _matmul(ans: Any, x: Tensor, other: Tensor) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g @ other.raw.T), (other, lambda g: x.raw.T @ g)]
+
+
+# #############################################################################
+# shape manipulation and indexing
+# #############################################################################
+
+
+@defvjp("reshape", "expand_dims", "squeeze")
+def _reshape(ans: Any, x: Tensor, *args: Any, **kwargs: Any) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: g.reshape(x.shape))]
+
+
+@defvjp("transpose")
+def _transpose(
+    ans: Any, x: Tensor, axes: Optional[Sequence[int]] = None
+) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        if axes is None:
+            return np.transpose(g)
+        return np.transpose(g, np.argsort(axes))
+
+    return [(x, vjp)]
+
+
+@defvjp("flip")
+def _flip(
+    ans: Any, x: Tensor, axis: Optional[AxisAxes] = None
+) -> List[Tuple[Any, VJP]]:
+    return [(x, lambda g: np.flip(g, axis=axis))]
+
+
+@defvjp("tile")
+def _tile(ans: Any, x: Tensor, multiples: Sequence[int]) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        # split every axis into (multiple, size) and sum over the multiples
+        shape = [n for m_n in zip(_raw(multiples), x.shape) for n in m_n]
+        return g.reshape(shape).sum(axis=tuple(range(0, len(shape), 2)))
+
+    return [(x, vjp)]
+
+
+@defvjp("pad")
+def _pad(
+    ans: Any,
+    x: Tensor,
+    paddings: Tuple[Tuple[int, int], ...],
+    mode: str = "constant",
+    value: float = 0,
+) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        if mode == "constant":
+            index = tuple(slice(a, g.shape[i] - b) for i, (a, b) in enumerate(paddings))
+            return g[index]
+        # every element of the result is a copy of an element of x
+        n = int(np.prod(x.shape))
+        source = np.pad(np.arange(n).reshape(x.shape), paddings, mode=mode)
+        grad = np.bincount(source.ravel(), weights=g.ravel(), minlength=n)
+        return grad.reshape(x.shape).astype(g.dtype)
+
+    return [(x, vjp)]
+
+
+def _index(index: Any) -> Any:
+    if isinstance(index, tuple):
+        return tuple(_raw(i) for i in index)
+    return _raw(index)
+
+
+@defvjp("__getitem__")
+def _getitem(ans: Any, x: Tensor, index: Any) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        grad = np.zeros(x.shape, dtype=g.dtype)
+        np.add.at(grad, _index(index), g)
+        return grad
+
+    return [(x, vjp)]
+
+
+def _along_axis(index: Any, shape: Tuple[int, ...], axis: int) -> Tuple[Any, ...]:
+    # converts indices along one axis into an index for all axes
+    grid: List[Any] = list(np.ogrid[tuple(slice(n) for n in shape)])
+    grid[axis % len(shape)] = np.broadcast_to(index, shape)
+    return tuple(grid)
+
+
+@defvjp("take_along_axis")
+def _take_along_axis(
+    ans: Any, x: Tensor, index: Tensor, axis: int
+) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        grad = np.zeros(x.shape, dtype=g.dtype)
+        np.add.at(grad, _along_axis(index.raw, g.shape, axis), g)
+        return grad
+
+    return [(x, vjp)]
+
+
+@defvjp("put_along_axis")
+def _put_along_axis(
+    ans: Any, x: Tensor, index: Tensor, values: Any, axis: int
+) -> List[Tuple[Any, VJP]]:
+    def vjp_x(g: Any) -> Any:
+        g = g.copy()
+        np.put_along_axis(g, index.raw, 0, axis=axis)
+        return g
+
+    def vjp_values(g: Any) -> Any:
+        return _unbroadcast(np.take_along_axis(g, index.raw, axis=axis), values)
+
+    return [(x, vjp_x), (values, vjp_values)]
+
+
+@defvjp("gather")
+def _gather(
+    ans: Any, x: Tensor, indices: Tensor, axis: int = 0
+) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        grad = np.zeros(x.shape, dtype=g.dtype)
+        np.add.at(grad, (slice(None),) * (axis % x.ndim) + (indices.raw,), g)
+        return grad
+
+    return [(x, vjp)]
+
+
+@defvjp("sort")
+def _sort(ans: Any, x: Tensor, axis: int = -1) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        grad = np.zeros(x.shape, dtype=g.dtype)
+        indices = np.argsort(x.raw, axis=axis)
+        np.put_along_axis(grad, indices, g, axis=axis)
+        return grad
+
+    return [(x, vjp)]
+
+
+@defvjp("partition")
+def _partition(ans: Any, x: Tensor, kth: int, axis: int = -1) -> List[Tuple[Any, VJP]]:
+    def vjp(g: Any) -> Any:
+        grad = np.zeros(x.shape, dtype=g.dtype)
+        indices = np.argpartition(x.raw, kth, axis=axis)
+        np.put_along_axis(grad, indices, g, axis=axis)
+        return grad
+
+    return [(x, vjp)]
+
+
+@defvjp("index_update")
+def _index_update(
+    ans: Any, x: Tensor, indices: Any, values: Any
+) -> List[Tuple[Any, VJP]]:
+    def vjp_x(g: Any) -> Any:
+        g = g.copy()
+        g[_index(indices)] = 0
+        return g
+
+    def vjp_values(g: Any) -> Any:
+        return _unbroadcast(g[_index(indices)], values)
+
+    return [(x, vjp_x), (values, vjp_values)]
+
+
+@defvjp("scatter")
+def _scatter(
+    ans: Any, x: Tensor, indices: Any, values: Any, mode: str = "set", **kwargs: Any
+) -> List[Tuple[Any, VJP]]:
+    # registered for scatter instead of _scatter, which only gets raw values
+    index = _index(indices if isinstance(indices, tuple) else (indices,))
+
+    def mask_x() -> Any:
+        # max: the gradient goes to the inputs that are equal to the result
+        return x.raw == ans.raw
+
+    def mask_values() -> Any:
+        return np.broadcast_to(_raw(values), ans.raw[index].shape) == ans.raw[index]
+
+    def vjp_x(g: Any) -> Any:
+        if mode == "add":
+            return g
+        if mode == "max":
+            return g * mask_x()
+        g = g.copy()
+        g[index] = 0
+        return g
+
+    def vjp_values(g: Any) -> Any:
+        g = g[index]
+        if mode == "max":
+            g = g * mask_values()
+        return _unbroadcast(g, values)
+
+    return [(x, vjp_x), (values, vjp_values)]
+
+
+@defvjp("_concatenate")
+def _concatenate(
+    ans: Any, self: Tensor, tensors: Sequence[Any], axis: int = 0
+) -> List[Tuple[Any, VJP]]:
+    sections = np.cumsum([t.shape[axis] for t in tensors])[:-1]
+
+    def vjp(i: int) -> VJP:
+        return lambda g: np.split(g, sections, axis=axis)[i]
+
+    return [(t, vjp(i)) for i, t in enumerate(tensors)]
+
+
+@defvjp("_stack")
+def _stack(
+    ans: Any, self: Tensor, tensors: Sequence[Any], axis: int = 0
+) -> List[Tuple[Any, VJP]]:
+    def vjp(i: int) -> VJP:
+        return lambda g: np.take(g, i, axis=axis)
+
+    return [(t, vjp(i)) for i, t in enumerate(tensors)]
+
+
+# #############################################################################
+# tracing
+# #############################################################################
+
+
+def _traced(name: str, rule: Rule) -> Callable[..., Any]:
+    method = getattr(NumPyTensor, name)
+
+    def traced(self: TracedNumPyTensor, *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        parents = [
+            (x._node, vjp)
+            for x, vjp in rule(result, self, *args, **kwargs)
+            if isinstance(x, TracedNumPyTensor) and x._node is not None
+        ]
+        if parents:
+            result = TracedNumPyTensor(result.raw, Node(parents))
+        return result
+
+    traced.__name__ = name
+    return traced
+
+
+for _name, _rule in _rules.items():
+    setattr(TracedNumPyTensor, _name, _traced(_name, _rule))
+
+
+def backward(loss: TracedNumPyTensor, leaf: Node) -> Optional[Any]:
+    if loss._node is None:
+        return None
+
+    nodes: Dict[int, Node] = {}
+    stack = [loss._node]
+    while stack:
+        node = stack.pop()
+        if id(node) not in nodes:
+            nodes[id(node)] = node
+            stack.extend(parent for parent, _ in node.parents)
+
+    grads: Dict[int, Any] = {id(loss._node): np.ones_like(loss.raw)}
+    for node in sorted(nodes.values(), key=lambda node: node.order, reverse=True):
+        if node is leaf:
+            continue
+        g = grads.pop(id(node), None)
+        if g is None:
+            continue
+        for parent, vjp in node.parents:
+            grad = vjp(g)
+            if id(parent) in grads:
+                grads[id(parent)] = grads[id(parent)] + grad
+            else:
+                grads[id(parent)] = grad
+    return grads.get(id(leaf))
+
+
+def _detach(x: Any) -> Any:
+    if isinstance(x, TracedNumPyTensor):
+        return NumPyTensor(x.raw)
+    if isinstance(x, tuple):
+        return tuple(_detach(t) for t in x)
+    return x
+
+
+def value_and_grad_fn(f: Callable, has_aux: bool = False) -> Callable[..., Tuple]:
+    def value_and_grad(x: NumPyTensor, *args: Any, **kwargs: Any) -> Tuple:
+        leaf = Node(())
+        x_ = TracedNumPyTensor(x.raw, leaf)
+        if has_aux:
+            loss, aux = f(x_, *args, **kwargs)
+        else:
+            loss = f(x_, *args, **kwargs)
+        if loss.ndim != 0:
+            raise ValueError("the function must return a scalar loss")
+        grad = None
+        if isinstance(loss, TracedNumPyTensor):
+            grad = backward(loss, leaf)
+        if grad is None:
+            grad = np.zeros_like(x.raw)
+        grad = NumPyTensor(np.array(grad, dtype=x.dtype).reshape(x.shape))
+        loss = NumPyTensor(loss.raw)
+        if has_aux:
+            return loss, _detach(aux), grad
+        return loss, grad
+
+    return value_and_grad
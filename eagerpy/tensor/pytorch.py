@@ -7,11 +7,12 @@ from typing import (
     TYPE_CHECKING,
     Iterable,
     Optional,
+    Type,
     overload,
     Callable,
+    ContextManager,
 )
 from typing_extensions import Literal
-import numpy as np
 from importlib import import_module
 
 from ..types import Axes, AxisAxes, Shape, ShapeOrScalar
@@ -26,6 +27,7 @@ from .base import unwrap1
 if TYPE_CHECKING:
     import torch  # for static analyzers
     from .extensions import NormsMethods  # noqa: F401
+    from ..random import Generator  # noqa: F401
 else:
     # lazy import in PyTorchTensor
     torch = None
@@ -42,6 +44,15 @@ def assert_bool(x: Any) -> None:
         raise ValueError(f"requires dtype bool, got {x.dtype}, consider t.bool().all()")
 
 
+def _broadcast_index(index: Any, x: Any, axis: int) -> Any:
+    # unlike np.take_along_axis, torch.gather does not broadcast the index
+    shape = list(x.shape)
+    shape[axis] = index.shape[axis]
+    if list(index.shape) == shape:
+        return index
+    return index.expand(shape)
+
+
 class PyTorchTensor(BaseTensor):
     __slots__ = ()
 
@@ -61,6 +72,13 @@ class PyTorchTensor(BaseTensor):
     def tanh(self: TensorType) -> TensorType:
         return type(self)(torch.tanh(self.raw))
 
+    def _generator_state(self, generator: "Generator") -> ContextManager[Any]:
+        device = self.raw.device
+        return generator._state(
+            ("pytorch", device),
+            lambda seed: torch.Generator(device=device).manual_seed(seed),
+        )
+
     def numpy(self: TensorType) -> Any:
         a = self.raw.detach().cpu().numpy()
         if a.flags.writeable:
@@ -197,15 +215,65 @@ class PyTorchTensor(BaseTensor):
     def argmax(self: TensorType, axis: Optional[int] = None) -> TensorType:
         return type(self)(self.raw.argmax(dim=axis))
 
+    def min_with_indices(
+        self: TensorType, axis: Optional[int] = None
+    ) -> Tuple[TensorType, TensorType]:
+        x = self.raw.reshape(-1) if axis is None else self.raw
+        values, indices = x.min(dim=0 if axis is None else axis)
+        return type(self)(values), type(self)(indices)
+
+    def max_with_indices(
+        self: TensorType, axis: Optional[int] = None
+    ) -> Tuple[TensorType, TensorType]:
+        x = self.raw.reshape(-1) if axis is None else self.raw
+        values, indices = x.max(dim=0 if axis is None else axis)
+        return type(self)(values), type(self)(indices)
+
     def argsort(self: TensorType, axis: int = -1) -> TensorType:
         return type(self)(self.raw.argsort(dim=axis))
 
     def sort(self: TensorType, axis: int = -1) -> TensorType:
         return type(self)(self.raw.sort(dim=axis).values)  # type: ignore
 
+    def topk(self: TensorType, k: int, axis: int = -1) -> Tuple[TensorType, TensorType]:
+        values, indices = self.raw.topk(k, dim=axis)
+        return type(self)(values), type(self)(indices)
+
+    def partition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        return self.take_along_axis(self.argpartition(kth, axis=axis), axis)
+
+    def argpartition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        # PyTorch has no partition; topk selects the smaller side of kth in
+        # sorted order and the other side is the complement, selected from
+        # a mask so that ties cannot select an index twice
+        x = self.raw if self.raw.dtype != torch.bool else self.raw.to(torch.uint8)
+        axis = axis % x.ndim
+        n = x.shape[axis]
+        kth = kth % n
+        lower = kth + 1 <= n - kth
+        if lower:
+            index = x.topk(kth + 1, dim=axis, largest=False).indices
+        else:
+            index = x.topk(n - kth, dim=axis).indices.flip(axis)
+        mask = torch.ones_like(x, dtype=torch.uint8).scatter_(axis, index, 0)
+        rest = mask.topk(n - index.shape[axis], dim=axis, sorted=False).indices
+        parts = [index, rest] if lower else [rest, index]
+        return type(self)(torch.cat(parts, dim=axis))
+
     def uniform(
-        self: TensorType, shape: ShapeOrScalar, low: float = 0.0, high: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        low: float = 0.0,
+        high: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
+        if generator is not None:
+            with self._generator_state(generator) as g:
+                x = torch.rand(
+                    shape, dtype=self.raw.dtype, device=self.raw.device, generator=g
+                )
+            return type(self)(x * (high - low) + low)
         return type(self)(
             torch.rand(shape, dtype=self.raw.dtype, device=self.raw.device)
             * (high - low)
@@ -213,8 +281,19 @@ class PyTorchTensor(BaseTensor):
         )
 
     def normal(
-        self: TensorType, shape: ShapeOrScalar, mean: float = 0.0, stddev: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        mean: float = 0.0,
+        stddev: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
+        if generator is not None:
+            with self._generator_state(generator) as g:
+                x = torch.randn(
+                    shape, dtype=self.raw.dtype, device=self.raw.device, generator=g
+                )
+            return type(self)(x * stddev + mean)
         return type(self)(
             torch.randn(shape, dtype=self.raw.dtype, device=self.raw.device) * stddev
             + mean
@@ -242,15 +321,10 @@ class PyTorchTensor(BaseTensor):
     def onehot_like(
         self: TensorType, indices: TensorType, *, value: float = 1
     ) -> TensorType:
-        if self.ndim != 2:
-            raise ValueError("onehot_like only supported for 2D tensors")
-        if indices.ndim != 1:
-            raise ValueError("onehot_like requires 1D indices")
-        if len(indices) != len(self):
-            raise ValueError("length of indices must match length of tensor")
+        if indices.shape != self.shape[:-1]:
+            raise ValueError("shape of indices must match shape of tensor[..., 0]")
         x = torch.zeros_like(self.raw)
-        rows = np.arange(x.shape[0])
-        x[rows, indices.raw] = value
+        x.scatter_(-1, indices.raw.unsqueeze(-1), value)
         return type(self)(x)
 
     def from_numpy(self: TensorType, a: Any) -> TensorType:
@@ -345,6 +419,15 @@ class PyTorchTensor(BaseTensor):
     def log_softmax(self: TensorType, axis: int = -1) -> TensorType:
         return type(self)(torch.nn.functional.log_softmax(self.raw, dim=axis))
 
+    def _kl_div_with_logits(
+        self: TensorType, logits_q: TensorType, axis: int, keepdims: bool
+    ) -> TensorType:
+        log_p = torch.nn.functional.log_softmax(self.raw, dim=axis)
+        log_q = torch.nn.functional.log_softmax(logits_q.raw, dim=axis)
+        # computes exp(log_p) * (log_p - log_q) in a single kernel
+        kl = torch.nn.functional.kl_div(log_q, log_p, reduction="none", log_target=True)
+        return type(self)(kl.sum(dim=axis, keepdim=keepdims))
+
     def squeeze(self: TensorType, axis: Optional[AxisAxes] = None) -> TensorType:
         if axis is None:
             return type(self)(self.raw.squeeze())
@@ -516,6 +599,66 @@ class PyTorchTensor(BaseTensor):
 
         return value_and_grad
 
+    def _jit(self: TensorType, f: Callable[..., Any]) -> Callable[..., Any]:
+        if not hasattr(torch, "compile"):
+            # torch.compile was added in PyTorch 2.0
+            return f
+        return torch.compile(f)
+
+    def _vmap(
+        self: TensorType, f: Callable[..., Tuple[Any, ...]]
+    ) -> Callable[..., Tuple[Any, ...]]:
+        try:
+            from torch.func import vmap
+
+            return vmap(f)
+        except ImportError:  # pragma: no cover
+            # torch.func was added in PyTorch 2.0
+            def vmapped(*args: Any) -> Tuple[Any, ...]:
+                outputs = zip(*(f(*xs) for xs in zip(*args)))
+                return tuple(torch.stack(ys) for ys in outputs)
+
+            return vmapped
+
+    def _dlpack(self: TensorType) -> Any:
+        # tensors that require grad cannot be exported
+        return self.raw.detach()
+
+    def _data_ptr(self: TensorType) -> Optional[int]:
+        return int(self.raw.data_ptr())
+
+    @classmethod
+    def _from_dlpack(cls: Type[TensorType], x: Any) -> TensorType:
+        return cls(import_module("torch").from_dlpack(x))
+
+    def _scatter(
+        self: TensorType,
+        indices: Tuple[Any, ...],
+        values: Any,
+        mode: str,
+        inplace: bool,
+    ) -> TensorType:
+        x = self.raw
+        if not inplace:
+            x = x.clone(memory_format=torch.contiguous_format)
+        indices = tuple(torch.as_tensor(i, device=x.device) for i in indices)
+        values = torch.as_tensor(values, dtype=x.dtype, device=x.device)
+        if mode != "max":
+            x.index_put_(indices, values, accumulate=mode == "add")
+            return type(self)(x)
+        # index_put_ cannot take the maximum, so we scatter into a view in
+        # which the indexed axes are flattened
+        n = len(indices)
+        indices = torch.broadcast_tensors(*indices)  # type: ignore
+        flat = torch.zeros_like(indices[0])
+        for i, size in zip(indices, x.shape[:n]):
+            flat = flat * size + i % size
+        rest = x.shape[n:]
+        values = values.expand(indices[0].shape + rest).reshape((-1,) + rest)
+        flat = flat.reshape((-1,) + (1,) * len(rest)).expand_as(values)
+        x.view((-1,) + rest).scatter_reduce_(0, flat, values, "amax")
+        return type(self)(x)
+
     def sign(self: TensorType) -> TensorType:
         return type(self)(torch.sign(self.raw))
 
@@ -573,11 +716,25 @@ class PyTorchTensor(BaseTensor):
         return type(self)(self.raw[index])
 
     def take_along_axis(self: TensorType, index: TensorType, axis: int) -> TensorType:
-        if axis % self.ndim != self.ndim - 1:
-            raise NotImplementedError(
-                "take_along_axis is currently only supported for the last axis"
-            )
-        return type(self)(torch.gather(self.raw, axis, index.raw))
+        index_ = _broadcast_index(index.raw, self.raw, axis)
+        return type(self)(torch.gather(self.raw, axis, index_))
+
+    def put_along_axis(
+        self: TensorType, index: TensorType, values: TensorOrScalar, axis: int
+    ) -> TensorType:
+        index_ = _broadcast_index(index.raw, self.raw, axis)
+        values_ = unwrap1(values)
+        if isinstance(values_, torch.Tensor):
+            values_ = values_.to(self.raw.dtype).expand(index_.shape)
+        return type(self)(self.raw.scatter(axis, index_, values_))
+
+    def gather(self: TensorType, indices: TensorType, axis: int = 0) -> TensorType:
+        if indices.ndim == 1:
+            return type(self)(self.raw.index_select(axis, indices.raw))
+        axis = axis % self.ndim
+        x = self.raw.index_select(axis, indices.raw.flatten())
+        shape = self.shape[:axis] + indices.shape + self.shape[axis + 1 :]
+        return type(self)(x.reshape(shape))
 
     def bool(self: TensorType) -> TensorType:
         return self.astype(torch.bool)
@@ -19,6 +19,7 @@ from ..types import Axes, AxisAxes, Shape, ShapeOrScalar
 
 if TYPE_CHECKING:
     from .extensions import NormsMethods  # noqa: F401
+    from ..random import Generator  # noqa: F401
 
 
 TensorType = TypeVar("TensorType", bound="Tensor")
@@ -45,6 +46,11 @@ class LazyCachedAccessor:
 
         return getattr(extensions, self._extension_name)
 
+    def _extension_for(self, tensor_class: type) -> Any:
+        from . import extensions
+
+        return extensions.get_extension(tensor_class, self._extension_name)
+
     def __get__(
         self, instance: Optional["Tensor"], owner: Optional[Type["Tensor"]] = None
     ) -> Any:
@@ -57,7 +63,7 @@ class LazyCachedAccessor:
             return methods
 
         # create the extension for this instance
-        methods = self._extension(instance)
+        methods = self._extension_for(type(instance))(instance)
 
         # add it to the instance to avoid recreation
         instance.__setattr__(self._cache_name, methods)
@@ -301,6 +307,18 @@ class Tensor(metaclass=ABCMeta):
     def argmax(self: TensorType, axis: Optional[int] = None) -> TensorType:
         ...
 
+    @abstractmethod
+    def min_with_indices(
+        self: TensorType, axis: Optional[int] = None
+    ) -> Tuple[TensorType, TensorType]:
+        ...
+
+    @abstractmethod
+    def max_with_indices(
+        self: TensorType, axis: Optional[int] = None
+    ) -> Tuple[TensorType, TensorType]:
+        ...
+
     @abstractmethod
     def argsort(self: TensorType, axis: int = -1) -> TensorType:
         ...
@@ -309,15 +327,37 @@ class Tensor(metaclass=ABCMeta):
     def sort(self: TensorType, axis: int = -1) -> TensorType:
         ...
 
+    @abstractmethod
+    def topk(self: TensorType, k: int, axis: int = -1) -> Tuple[TensorType, TensorType]:
+        ...
+
+    @abstractmethod
+    def partition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        ...
+
+    @abstractmethod
+    def argpartition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        ...
+
     @abstractmethod
     def uniform(
-        self: TensorType, shape: ShapeOrScalar, low: float = 0.0, high: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        low: float = 0.0,
+        high: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
         ...
 
     @abstractmethod
     def normal(
-        self: TensorType, shape: ShapeOrScalar, mean: float = 0.0, stddev: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        mean: float = 0.0,
+        stddev: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
         ...
 
@@ -371,6 +411,16 @@ class Tensor(metaclass=ABCMeta):
     def take_along_axis(self: TensorType, index: TensorType, axis: int) -> TensorType:
         ...
 
+    @abstractmethod
+    def put_along_axis(
+        self: TensorType, index: TensorType, values: TensorOrScalar, axis: int
+    ) -> TensorType:
+        ...
+
+    @abstractmethod
+    def gather(self: TensorType, indices: TensorType, axis: int = 0) -> TensorType:
+        ...
+
     @abstractmethod
     def all(
         self: TensorType, axis: Optional[AxisAxes] = None, keepdims: bool = False
@@ -515,6 +565,79 @@ class Tensor(metaclass=ABCMeta):
     ) -> Callable[..., Tuple]:
         ...
 
+    @abstractmethod
+    def _jit(self: TensorType, f: Callable[..., Any]) -> Callable[..., Any]:
+        ...
+
+    @abstractmethod
+    def _vmap(
+        self: TensorType, f: Callable[..., Tuple[Any, ...]]
+    ) -> Callable[..., Tuple[Any, ...]]:
+        ...
+
+    @abstractmethod
+    def _dlpack(self: TensorType) -> Any:
+        # an object implementing the DLPack protocol (__dlpack__)
+        ...
+
+    @abstractmethod
+    def _data_ptr(self: TensorType) -> Optional[int]:
+        # the address of the underlying buffer or None if it is not known
+        ...
+
+    @classmethod
+    @abstractmethod
+    def _from_dlpack(cls: Type[TensorType], x: Any) -> TensorType:
+        ...
+
+    @abstractmethod
+    def _kl_div_with_logits(
+        self: TensorType, logits_q: TensorType, axis: int, keepdims: bool
+    ) -> TensorType:
+        ...
+
+    @abstractmethod
+    def _scatter(
+        self: TensorType,
+        indices: Tuple[Any, ...],
+        values: Any,
+        mode: str,
+        inplace: bool,
+    ) -> TensorType:
+        # indices is a tuple of native integer arrays (or ints) for the
+        # leading axes, values a native tensor or a scalar
+        ...
+
+    @final
+    def to_backend(
+        self, backend: Union[str, Type["Tensor"]], *, allow_copy: bool = True
+    ) -> "Tensor":
+        from ..convert import convert
+
+        return convert(self, backend, allow_copy=allow_copy)
+
+    @final
+    def scatter(
+        self: TensorType,
+        indices: Any,
+        values: TensorOrScalar,
+        mode: str = "set",
+        *,
+        inplace: bool = False,
+    ) -> TensorType:
+        """Sets, adds or takes the maximum (mode "set", "add" or "max") with
+        values at indices, one integer index tensor per leading axis; for
+        "add" and "max", duplicate indices accumulate. With inplace=True
+        (NumPy and PyTorch only), the tensor itself is updated instead of a
+        copy, so an update costs O(len(indices)) instead of O(size)."""
+        if mode not in ("set", "add", "max"):
+            raise ValueError(f"mode must be 'set', 'add' or 'max', got {mode!r}")
+        if not isinstance(indices, tuple):
+            indices = (indices,)
+        indices = tuple(i.raw if isinstance(i, Tensor) else i for i in indices)
+        values_ = values.raw if isinstance(values, Tensor) else values
+        return self._scatter(indices, values_, mode, inplace)
+
     @abstractmethod
     def bool(self: TensorType) -> TensorType:
         ...
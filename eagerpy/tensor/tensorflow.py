@@ -7,8 +7,10 @@ from typing import (
     TYPE_CHECKING,
     Iterable,
     Optional,
+    Type,
     overload,
     Callable,
+    Dict,
 )
 from typing_extensions import Literal
 import numpy as np
@@ -30,6 +32,7 @@ from .base import unwrap1
 if TYPE_CHECKING:
     import tensorflow as tf  # for static analyzers
     from .extensions import NormsMethods  # noqa: F401
+    from ..random import Generator  # noqa: F401
 else:
     # lazy import in TensorFlowTensor
     tf = None
@@ -38,38 +41,129 @@ FuncType = Callable[..., Any]
 F = TypeVar("F", bound=FuncType)
 
 
+# the device new tensors are placed on, per device scope
+_placements: Dict[Optional[str], str] = {}
+
+
+def _placement() -> Optional[str]:
+    eager_context = getattr(tf.__internal__, "eager_context", None)
+    if eager_context is None:  # pragma: no cover
+        return None
+    scope = eager_context.get_device_name()
+    try:
+        return _placements[scope]
+    except KeyError:
+        device = cast(str, tf.zeros(()).device)
+        if device:
+            # empty when tracing a graph
+            _placements[scope] = device
+        return device
+
+
+@functools.lru_cache(maxsize=None)
+def _device_spec(device: str) -> Any:
+    return tf.DeviceSpec.from_string(device)
+
+
 def samedevice(f: F) -> F:
     @functools.wraps(f)
     def wrapper(self: "TensorFlowTensor", *args: Any, **kwargs: Any) -> Any:
-        with tf.device(self.raw.device):
+        device = self.raw.device
+        if device == _placement():
+            # new tensors end up on the right device anyway
+            return f(self, *args, **kwargs)
+        with tf.device(_device_spec(device)):
             return f(self, *args, **kwargs)
 
     return cast(F, wrapper)
 
 
+# maps pairs of dtypes to the dtype NumPy would promote them to; it is
+# filled on first use because tensorflow is only imported lazily
+_promotions: Dict[Tuple[Any, Any], Any] = {}
+
+
+def _promote(a: Any, b: Any) -> Any:
+    try:
+        return _promotions[a, b]
+    except KeyError:
+        dtype = tf.as_dtype(np.promote_types(a.as_numpy_dtype, b.as_numpy_dtype))
+        _promotions[a, b] = _promotions[b, a] = dtype
+        return dtype
+
+
 def common_dtype(f: F) -> F:
     @functools.wraps(f)
-    def wrapper(self: "TensorFlowTensor", *args: Any, **kwargs: Any) -> Any:
-        dtypes = {self.dtype} | {arg.dtype for arg in args if isinstance(arg, Tensor)}
-        if len(dtypes) == 1:
-            # all dtypes are the same, nothing more to do
-            return f(self, *args, **kwargs)
-        numpy_dtypes = [np.dtype(dtype.name) for dtype in dtypes]
-        common = np.find_common_type(numpy_dtypes, [])
-        common = getattr(tf, common.name)
-        if self.dtype != common:
-            self = self.astype(common)
-        args = tuple(
-            arg.astype(common)
-            if isinstance(arg, Tensor) and arg.dtype != common
-            else arg
-            for arg in args
-        )
-        return f(self, *args, **kwargs)
+    def wrapper(self: "TensorFlowTensor", other: Any) -> Any:
+        if isinstance(other, Tensor) and other.dtype != self.dtype:
+            dtype = _promote(self.dtype, other.dtype)
+            if self.dtype != dtype:
+                self = self.astype(dtype)
+            if other.dtype != dtype:
+                other = other.astype(dtype)
+        return f(self, other)
 
     return cast(F, wrapper)
 
 
+@functools.lru_cache(maxsize=128)
+def _offsets(shape: Tuple[int, ...], axis: int) -> Tuple[Any, int, Any]:
+    # the flat offsets of the elements with index 0 along axis (as a NumPy
+    # array with size 1 along axis), the stride of axis and an index dtype
+    # that can represent all flat indices
+    size = int(np.prod(shape))
+    dtype = np.int32 if size <= np.iinfo(np.int32).max else np.int64
+    strides = [int(np.prod(shape[d + 1 :])) for d in range(len(shape))]
+    shape_ = tuple(1 if d == axis else n for d, n in enumerate(shape))
+    grid = np.ogrid[tuple(slice(n) for n in shape_)]
+    offsets = sum(g * s for d, (g, s) in enumerate(zip(grid, strides)) if d != axis)
+    offsets = np.asarray(offsets, dtype=dtype).reshape(shape_)
+    return offsets, strides[axis], tf.as_dtype(dtype)
+
+
+def _along_axis(index: Any, shape: Tuple[int, ...], axis: int) -> Any:
+    # converts indices along one axis into indices of the flattened tensor;
+    # unlike stacking coordinates for tf.gather_nd, this needs no broadcast
+    # tensors for the other axes
+    offsets, stride, dtype = _offsets(shape, axis)
+    index = tf.cast(index, dtype) % shape[axis]
+    return (index * stride if stride != 1 else index) + offsets
+
+
+@functools.lru_cache(maxsize=128)
+def _index_plan(
+    shape: Tuple[int, ...], index_shapes: Tuple[Tuple[int, ...], ...]
+) -> Optional[Tuple[Tuple[int, ...], int, Any]]:
+    # None if the indices have the same shape and can simply be stacked,
+    # otherwise the strides to linearize them, the number of elements in
+    # the indexed axes and an index dtype that can represent it
+    if len(set(index_shapes)) == 1:
+        return None
+    strides = []
+    size = 1
+    for k in reversed(shape[: len(index_shapes)]):
+        strides.append(size)
+        size *= k
+    dtype = tf.int32 if size <= np.iinfo(np.int32).max else tf.int64
+    return tuple(reversed(strides)), size, dtype
+
+
+_DLPACK_DEVICE_TYPES = {"CPU": 1, "GPU": 2}
+
+
+class _DLPackCapsule:
+    # TensorFlow tensors do not implement __dlpack__ themselves
+    def __init__(self, capsule: Any, device: Tuple[int, int]):
+        self.capsule = capsule
+        self.device = device
+
+    def __dlpack__(self, **kwargs: Any) -> Any:
+        return self.capsule
+
+    def __dlpack_device__(self) -> Tuple[int, int]:
+        return self.device
+
+
 def assert_bool(x: Any) -> None:
     if not isinstance(x, Tensor):
         return
@@ -176,22 +270,92 @@ class TensorFlowTensor(BaseTensor):
     def sort(self: TensorType, axis: Optional[int] = -1) -> TensorType:
         return type(self)(tf.sort(self.raw, axis=axis))
 
+    def topk(self: TensorType, k: int, axis: int = -1) -> Tuple[TensorType, TensorType]:
+        # top_k always works on the last axis
+        axis = axis % self.ndim
+        perm = list(range(self.ndim))
+        perm[axis], perm[-1] = perm[-1], perm[axis]
+        x = self.raw if axis == self.ndim - 1 else tf.transpose(self.raw, perm)
+        values, indices = tf.math.top_k(x, k)
+        if axis != self.ndim - 1:
+            values = tf.transpose(values, perm)
+            indices = tf.transpose(indices, perm)
+        return type(self)(values), type(self)(indices)
+
+    def partition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        return self.take_along_axis(self.argpartition(kth, axis=axis), axis)
+
+    def argpartition(self: TensorType, kth: int, axis: int = -1) -> TensorType:
+        # TensorFlow has no partition; like for PyTorch, top_k selects the
+        # smaller side of kth and the other side is the complement, but top_k
+        # is only faster than sorting if that side is small
+        axis = axis % self.ndim
+        n = self.shape[axis]
+        kth = kth % n
+        k = min(kth + 1, n - kth)
+        x = self.raw if self.raw.dtype != tf.bool else tf.cast(self.raw, tf.int8)
+        if k > n // 8:
+            return type(self)(tf.argsort(x, axis=axis))
+        perm = list(range(self.ndim))
+        perm[axis], perm[-1] = perm[-1], perm[axis]
+        x = x if axis == self.ndim - 1 else tf.transpose(x, perm)
+        lower = k == kth + 1
+        if lower:
+            # the smallest values are the largest of the order-reversed ones
+            x = -x if x.dtype.is_floating else tf.bitwise.invert(x)
+            index = tf.math.top_k(x, k).indices
+        else:
+            index = tf.reverse(tf.math.top_k(x, k).indices, [-1])
+        flat = _along_axis(index, tuple(x.shape), x.ndim - 1)
+        mask = tf.ones((tf.size(x),), tf.bool)
+        mask = tf.tensor_scatter_nd_update(
+            mask, flat[..., tf.newaxis], tf.zeros(flat.shape, tf.bool)
+        )
+        # tf.where returns the remaining indices of every row in order
+        rest = tf.where(tf.reshape(mask, x.shape))[:, -1]
+        rest = tf.cast(rest, index.dtype)
+        rest = tf.reshape(rest, tuple(x.shape[:-1]) + (n - k,))
+        result = tf.concat([index, rest] if lower else [rest, index], axis=-1)
+        if axis != self.ndim - 1:
+            result = tf.transpose(result, perm)
+        return type(self)(result)
+
     @samedevice
     def uniform(
-        self: TensorType, shape: ShapeOrScalar, low: float = 0.0, high: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        low: float = 0.0,
+        high: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
         if not isinstance(shape, Iterable):
             shape = (shape,)
+        if generator is not None:
+            with generator._state("tensorflow", tf.random.Generator.from_seed) as g:
+                return type(self)(
+                    g.uniform(shape, minval=low, maxval=high, dtype=self.raw.dtype)
+                )
         return type(self)(
             tf.random.uniform(shape, minval=low, maxval=high, dtype=self.raw.dtype)
         )
 
     @samedevice
     def normal(
-        self: TensorType, shape: ShapeOrScalar, mean: float = 0.0, stddev: float = 1.0
+        self: TensorType,
+        shape: ShapeOrScalar,
+        mean: float = 0.0,
+        stddev: float = 1.0,
+        *,
+        generator: Optional["Generator"] = None,
     ) -> TensorType:
         if not isinstance(shape, Iterable):
             shape = (shape,)
+        if generator is not None:
+            with generator._state("tensorflow", tf.random.Generator.from_seed) as g:
+                return type(self)(
+                    g.normal(shape, mean=mean, stddev=stddev, dtype=self.raw.dtype)
+                )
         return type(self)(
             tf.random.normal(shape, mean=mean, stddev=stddev, dtype=self.raw.dtype)
         )
@@ -218,12 +382,8 @@ class TensorFlowTensor(BaseTensor):
     def onehot_like(
         self: TensorType, indices: TensorType, *, value: float = 1
     ) -> TensorType:
-        if self.ndim != 2:
-            raise ValueError("onehot_like only supported for 2D tensors")
-        if indices.ndim != 1:
-            raise ValueError("onehot_like requires 1D indices")
-        if len(indices) != len(self):
-            raise ValueError("length of indices must match length of tensor")
+        if indices.shape != self.shape[:-1]:
+            raise ValueError("shape of indices must match shape of tensor[..., 0]")
         value = tf.cast(value, self.raw.dtype)
         return type(self)(
             tf.one_hot(
@@ -479,6 +639,69 @@ class TensorFlowTensor(BaseTensor):
 
         return value_and_grad
 
+    def _jit(self: TensorType, f: Callable[..., Any]) -> Callable[..., Any]:
+        return tf.function(f)  # type: ignore
+
+    def _vmap(
+        self: TensorType, f: Callable[..., Tuple[Any, ...]]
+    ) -> Callable[..., Tuple[Any, ...]]:
+        def vmapped(*args: Any) -> Tuple[Any, ...]:
+            return tf.vectorized_map(lambda xs: f(*xs), args)  # type: ignore
+
+        return vmapped
+
+    def _dlpack(self: TensorType) -> Any:
+        device = tf.DeviceSpec.from_string(self.raw.device)
+        return _DLPackCapsule(
+            tf.experimental.dlpack.to_dlpack(self.raw),
+            (_DLPACK_DEVICE_TYPES[device.device_type], device.device_index or 0),
+        )
+
+    def _data_ptr(self: TensorType) -> Optional[int]:
+        if tf.DeviceSpec.from_string(self.raw.device).device_type != "CPU":
+            return None
+        # TensorFlow does not expose the address, but NumPy can import
+        # CPU tensors without copying them
+        return int(np.from_dlpack(self._dlpack()).ctypes.data)
+
+    @classmethod
+    def _from_dlpack(cls: Type[TensorType], x: Any) -> TensorType:
+        tf = import_module("tensorflow")
+        return cls(tf.experimental.dlpack.from_dlpack(x.__dlpack__()))
+
+    def _scatter(
+        self: TensorType,
+        indices: Tuple[Any, ...],
+        values: Any,
+        mode: str,
+        inplace: bool,
+    ) -> TensorType:
+        if inplace:
+            raise NotImplementedError("TensorFlow tensors cannot be updated in-place")
+        x = self.raw
+        n = len(indices)
+        # tf.tensor_scatter_nd_* expect the indices stacked along the last
+        # axis and do not support negative indices
+        indices = tuple(tf.cast(i, tf.int64) for i in indices)
+        shape = functools.reduce(
+            tf.broadcast_static_shape, (i.shape for i in indices)
+        ).as_list()
+        indices = tf.stack(
+            [tf.broadcast_to(i % size, shape) for i, size in zip(indices, x.shape)],
+            axis=-1,
+        )
+        rest = x.shape[n:].as_list()
+        values = tf.broadcast_to(tf.cast(values, x.dtype), shape + rest)
+        # the scatter ops need exactly one batch axis
+        indices = tf.reshape(indices, (-1, n))
+        values = tf.reshape(values, [-1] + rest)
+        scatter = {
+            "set": tf.tensor_scatter_nd_update,
+            "add": tf.tensor_scatter_nd_add,
+            "max": tf.tensor_scatter_nd_max,
+        }[mode]
+        return type(self)(scatter(x, indices, values))
+
     def sign(self: TensorType) -> TensorType:
         return type(self)(tf.sign(self.raw))
 
@@ -502,6 +725,26 @@ class TensorFlowTensor(BaseTensor):
             )
         return type(self)(tf.matmul(self.raw, other.raw))
 
+    @common_dtype
+    def __add__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(self.raw.__add__(unwrap1(other)))
+
+    @common_dtype
+    def __sub__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(self.raw.__sub__(unwrap1(other)))
+
+    @common_dtype
+    def __mul__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(self.raw.__mul__(unwrap1(other)))
+
+    @common_dtype
+    def __truediv__(self: TensorType, other: TensorOrScalar) -> TensorType:
+        return type(self)(self.raw.__truediv__(unwrap1(other)))
+
+    @common_dtype
+    def __pow__(self: TensorType, exponent: TensorOrScalar) -> TensorType:
+        return type(self)(self.raw.__pow__(unwrap1(exponent)))
+
     @common_dtype
     def __lt__(self: TensorType, other: TensorOrScalar) -> TensorType:
         return type(self)(self.raw.__lt__(unwrap1(other)))
@@ -534,29 +777,28 @@ class TensorFlowTensor(BaseTensor):
                 for x in index
             )
             if not basic:
-                # workaround for missing support for this in TensorFlow
+                # TensorFlow does not support this, use tf.gather_nd or, if
+                # the indices need to be broadcasted, tf.gather on a flat view
                 index = [tf.convert_to_tensor(x) for x in index]
-                shapes = [tuple(x.shape) for x in index]
-                shape = tuple(max(x) for x in zip(*shapes))
-                int64 = any(x.dtype == tf.int64 for x in index)
-                for i in range(len(index)):
-                    t = index[i]
-                    if int64:
-                        t = tf.cast(t, tf.int64)  # pragma: no cover
-                    assert t.ndim == len(shape)
-                    tiling = []
-                    for b, k in zip(shape, t.shape):
-                        if k == 1:
-                            tiling.append(b)
-                        elif k == b:
-                            tiling.append(1)
-                        else:
-                            raise ValueError(  # pragma: no cover
-                                f"{tuple(t.shape)} cannot be broadcasted to {shape}"
-                            )
-                    index[i] = tf.tile(t, tiling)
-                index = tf.stack(index, axis=-1)
-                return type(self)(tf.gather_nd(self.raw, index))
+                shape = tuple(self.raw.shape)
+                plan = _index_plan(shape, tuple(tuple(x.shape) for x in index))
+                if plan is None:
+                    if len({x.dtype for x in index}) > 1:
+                        index = [tf.cast(x, tf.int64) for x in index]
+                    # like tf.gather, tf.gather_nd does not wrap negative indices
+                    index = [x % n for x, n in zip(index, shape)]
+                    index = tf.stack(index, axis=-1)
+                    return type(self)(tf.gather_nd(self.raw, index))
+                strides, size, dtype = plan
+                # the arithmetic broadcasts the indices without tiling them;
+                # negative indices must be wrapped because they would
+                # otherwise silently select the wrong elements
+                flat: Any = 0
+                for x, n, stride in zip(index, shape, strides):
+                    x = tf.cast(x, dtype) % n
+                    flat = flat + (x * stride if stride != 1 else x)
+                x = tf.reshape(self.raw, (size,) + shape[len(index) :])
+                return type(self)(tf.gather(x, flat))
         elif (
             isinstance(index, range)
             or isinstance(index, list)
@@ -572,13 +814,26 @@ class TensorFlowTensor(BaseTensor):
 
     def take_along_axis(self: TensorType, index: TensorType, axis: int) -> TensorType:
         axis = batch_dims = axis % self.ndim
-        if axis != self.ndim - 1:
-            raise NotImplementedError(
-                "take_along_axis is currently only supported for the last axis"
+        if axis == self.ndim - 1 and index.shape[:-1] == self.shape[:-1]:
+            return type(self)(
+                tf.gather(self.raw, index.raw, axis=axis, batch_dims=batch_dims)
             )
-        return type(self)(
-            tf.gather(self.raw, index.raw, axis=axis, batch_dims=batch_dims)
-        )
+        flat = _along_axis(index.raw, self.shape, axis)
+        return type(self)(tf.gather(tf.reshape(self.raw, (-1,)), flat))
+
+    def put_along_axis(
+        self: TensorType, index: TensorType, values: TensorOrScalar, axis: int
+    ) -> TensorType:
+        flat = _along_axis(index.raw, self.shape, axis % self.ndim)
+        values_ = tf.cast(unwrap1(values), self.raw.dtype)
+        if values_.shape != flat.shape:
+            values_ = tf.broadcast_to(values_, flat.shape)
+        x = tf.reshape(self.raw, (-1,))
+        x = tf.tensor_scatter_nd_update(x, flat[..., tf.newaxis], values_)
+        return type(self)(tf.reshape(x, self.raw.shape))
+
+    def gather(self: TensorType, indices: TensorType, axis: int = 0) -> TensorType:
+        return type(self)(tf.gather(self.raw, indices.raw, axis=axis))
 
     def bool(self: TensorType) -> TensorType:
         return self.astype(tf.bool)
@@ -0,0 +1,200 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+import functools
+
+from .tensor import Tensor
+from .astensor import astensor
+from .astensor import _get_tensor_class
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_LEAF = "leaf"
+
+
+def _istensor(x: Any) -> bool:
+    return isinstance(x, Tensor) or _get_tensor_class(x) is not None
+
+
+def _flatten(x: Any, leaves: List[Any]) -> Any:
+    # returns a hashable description of the structure of x and appends all
+    # (EagerPy or native) tensors in x to leaves; everything else is static
+    if isinstance(x, (tuple, list)):
+        return (type(x), tuple(_flatten(y, leaves) for y in x))
+    if isinstance(x, dict):
+        keys = tuple(x.keys())
+        return (dict, keys, tuple(_flatten(x[k], leaves) for k in keys))
+    if _istensor(x):
+        leaves.append(x)
+        return _LEAF
+    # the type is part of the key because 1 == 1.0 == True
+    return ("static", type(x), x)
+
+
+def _unflatten(treedef: Any, leaves: Iterator[Any]) -> Any:
+    if treedef == _LEAF:
+        return next(leaves)
+    kind = treedef[0]
+    if kind == "static":
+        return treedef[2]
+    if kind is dict:
+        _, keys, children = treedef
+        return {k: _unflatten(c, leaves) for k, c in zip(keys, children)}
+    children = [_unflatten(c, leaves) for c in treedef[1]]
+    if hasattr(kind, "_fields"):  # NamedTuple
+        return kind(*children)
+    return kind(children)
+
+
+def jit(f: F) -> F:
+    """Compiles a function that takes and returns tensors using the compiler
+    of the framework the tensors belong to (jax.jit, tf.function,
+    torch.compile). NumPy functions are executed as is.
+
+    Non-tensor arguments are treated as static. The function is recompiled
+    for every new combination of static arguments and tensor shapes and
+    dtypes. If the function is called with native tensors, it returns native
+    tensors."""
+    cache: Dict[Any, Tuple[Callable[..., Tuple[Any, ...]], List[Any]]] = {}
+
+    @functools.wraps(f)
+    def jitted(*args: Any, **kwargs: Any) -> Any:
+        leaves: List[Any] = []
+        treedef = _flatten((args, kwargs), leaves)
+        if not leaves:
+            return f(*args, **kwargs)
+        restore_type = not any(isinstance(x, Tensor) for x in leaves)
+        tensors = [astensor(x) for x in leaves]
+        tensor_type = type(tensors[0])
+        key = (tensor_type, treedef, tuple((x.shape, x.dtype) for x in tensors))
+        try:
+            entry = cache.get(key)
+        except TypeError:
+            raise TypeError(
+                "non-tensor arguments of jitted functions must be hashable"
+            ) from None
+
+        if entry is None:
+            # the structure of the output is only known after tracing
+            out_treedef: List[Any] = [None]
+
+            def f_raw(*raw_leaves: Any) -> Tuple[Any, ...]:
+                inputs = (tensor_type(x) for x in raw_leaves)
+                args, kwargs = _unflatten(treedef, inputs)
+                out_leaves: List[Any] = []
+                out_treedef[0] = _flatten(f(*args, **kwargs), out_leaves)
+                return tuple(astensor(x).raw for x in out_leaves)
+
+            entry = cache[key] = (tensors[0]._jit(f_raw), out_treedef)
+
+        compiled, out_treedef = entry
+        raw_outputs = compiled(*(x.raw for x in tensors))
+        if restore_type:
+            outputs = iter(raw_outputs)
+        else:
+            outputs = (tensor_type(x) for x in raw_outputs)
+        return _unflatten(out_treedef[0], outputs)
+
+    return cast(F, jitted)
+
+
+def _moveaxis(x: Tensor, source: int, destination: int) -> Tensor:
+    source = source % x.ndim
+    destination = destination % x.ndim
+    if source == destination:
+        return x
+    axes = [i for i in range(x.ndim) if i != source]
+    axes.insert(destination, source)
+    return x.transpose(tuple(axes))
+
+
+def vmap(
+    f: F,
+    in_axes: Union[Optional[int], Sequence[Optional[int]]] = 0,
+    out_axes: Union[int, Sequence[int]] = 0,
+) -> F:
+    """Vectorizes a function that processes a single sample so that it
+    processes a batch of samples using the batching transform of the
+    framework the tensors belong to (jax.vmap, torch.func.vmap,
+    tf.vectorized_map). NumPy has no such transform, so for NumPy this is
+    only a compatibility loop that calls the function once per sample and
+    writes the results into preallocated output arrays; it gives no
+    vectorized throughput, so write the function for the whole batch where
+    speed matters.
+
+    in_axes specifies the batch axis for each positional argument (or all of
+    them if it is an int); None means that the argument is not batched.
+    Keyword arguments are not batched. out_axes specifies where the batch
+    axis is placed in the outputs, either for all or for each output tensor.
+    If the function is called with native tensors, it returns native
+    tensors."""
+
+    @functools.wraps(f)
+    def vmapped(*args: Any, **kwargs: Any) -> Any:
+        if isinstance(in_axes, int) or in_axes is None:
+            axes = [in_axes] * len(args)
+        else:
+            axes = list(in_axes)
+            if len(axes) != len(args):
+                raise ValueError(
+                    f"in_axes has {len(axes)} entries, but got {len(args)} arguments"
+                )
+
+        mapped: List[Tensor] = []
+        restore_type = True
+        for x, axis in zip(args, axes):
+            if axis is None:
+                continue
+            if not _istensor(x):
+                raise ValueError(f"can only map over tensors, got {type(x)}")
+            restore_type = restore_type and not isinstance(x, Tensor)
+            mapped.append(_moveaxis(astensor(x), axis, 0))
+        if not mapped:
+            raise ValueError("vmap requires at least one mapped argument")
+        sizes = {x.shape[0] for x in mapped}
+        if len(sizes) != 1:
+            raise ValueError(f"mapped axes must have the same size, got {sizes}")
+        tensor_type = type(mapped[0])
+
+        # the structure of the output is only known after calling f
+        out_treedef: List[Any] = [None]
+
+        def f_raw(*raw_args: Any) -> Tuple[Any, ...]:
+            inputs = iter(raw_args)
+            args_ = [
+                x if axis is None else tensor_type(next(inputs))
+                for x, axis in zip(args, axes)
+            ]
+            out_leaves: List[Any] = []
+            out_treedef[0] = _flatten(f(*args_, **kwargs), out_leaves)
+            return tuple(astensor(x).raw for x in out_leaves)
+
+        raw_outputs = mapped[0]._vmap(f_raw)(*(x.raw for x in mapped))
+
+        if isinstance(out_axes, int):
+            axes_ = [out_axes] * len(raw_outputs)
+        else:
+            axes_ = list(out_axes)
+            if len(axes_) != len(raw_outputs):
+                raise ValueError(
+                    f"out_axes has {len(axes_)} entries, but got {len(raw_outputs)} outputs"
+                )
+        outputs = [
+            _moveaxis(tensor_type(x), 0, axis) for x, axis in zip(raw_outputs, axes_)
+        ]
+        if restore_type:
+            return _unflatten(out_treedef[0], (x.raw for x in outputs))
+        return _unflatten(out_treedef[0], iter(outputs))
+
+    return cast(F, vmapped)
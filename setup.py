@@ -39,7 +39,7 @@ setup(
     author_email="jonas.rauber@bethgelab.org",
     url="https://github.com/jonasrauber/eagerpy",
     license="MIT License",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks"]),
     include_package_data=True,
     zip_safe=False,
     install_requires=install_requires,
@@ -0,0 +1,63 @@
+import warnings
+import pytest
+import numpy as np
+import eagerpy as ep
+from eagerpy import Tensor
+
+backends = {
+    "numpy": ep.NumPyTensor,
+    "pytorch": ep.PyTorchTensor,
+    "jax": ep.JAXTensor,
+    "tensorflow": ep.TensorFlowTensor,
+}
+
+
+@pytest.mark.parametrize("backend", list(backends.keys()))
+def test_convert(dummy: Tensor, backend: str) -> None:
+    x = ep.arange(dummy, 12).float32().reshape((3, 4))
+    with warnings.catch_warnings():
+        # whether data can be shared depends on alignment and layout
+        warnings.simplefilter("ignore", ep.CopyWarning)
+        y = ep.convert(x, backend)
+        z = x.to_backend(backends[backend])
+    assert isinstance(y, backends[backend])
+    assert isinstance(z, backends[backend])
+    np.testing.assert_array_equal(y.numpy(), x.numpy())
+    np.testing.assert_array_equal(z.numpy(), x.numpy())
+
+
+def test_convert_without_copy(dummy: Tensor) -> None:
+    x = ep.arange(dummy, 12).float32().reshape((3, 4))
+    y = ep.convert(x, "numpy", allow_copy=False)
+    assert isinstance(y, ep.NumPyTensor)
+    np.testing.assert_array_equal(y.numpy(), x.numpy())
+
+
+def test_convert_same_backend(dummy: Tensor) -> None:
+    x = ep.arange(dummy, 5)
+    assert ep.convert(x, type(x)) is x
+
+
+def test_convert_native(dummy: Tensor) -> None:
+    x = ep.arange(dummy, 5).float32()
+    y = ep.convert(x.raw, "numpy")
+    assert isinstance(y, np.ndarray)
+    np.testing.assert_array_equal(y, x.numpy())
+
+
+def test_convert_copy(dummy: Tensor) -> None:
+    if not isinstance(dummy, (ep.NumPyTensor, ep.PyTorchTensor)):
+        pytest.skip()
+    # TensorFlow cannot import strided tensors
+    x = ep.arange(dummy, 12).float32().reshape((3, 4)).T
+    with pytest.warns(ep.CopyWarning):
+        y = ep.convert(x, "tensorflow")
+    assert isinstance(y, ep.TensorFlowTensor)
+    np.testing.assert_array_equal(y.numpy(), x.numpy())
+    with pytest.raises(ValueError):
+        ep.convert(x, "tensorflow", allow_copy=False)
+
+
+def test_convert_unknown_backend(dummy: Tensor) -> None:
+    with pytest.raises(ValueError):
+        ep.convert(dummy, "mxnet")
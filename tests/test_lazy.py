@@ -0,0 +1,92 @@
+from typing import Tuple
+import tracemalloc
+import pytest
+import numpy as np
+import eagerpy as ep
+from eagerpy import Tensor
+
+
+@pytest.fixture
+def x(dummy: Tensor) -> Tensor:
+    if not isinstance(dummy, ep.NumPyTensor):
+        pytest.skip()
+    return ep.arange(dummy, 12).float32().reshape((3, 4)) / 7.0 - 0.5
+
+
+def test_lazy_enabled(x: Tensor) -> None:
+    assert not ep.lazy_enabled()
+    with ep.lazy():
+        assert ep.lazy_enabled()
+        with ep.lazy(False):
+            assert not ep.lazy_enabled()
+        assert ep.lazy_enabled()
+    assert not ep.lazy_enabled()
+
+
+def test_lazy_matches_eager(x: Tensor) -> None:
+    def f(x: Tensor) -> Tensor:
+        y = (2 * abs(x) + 1.0).sqrt().log() - x.square() / 3
+        y = (-y).exp().minimum(x).maximum(x.tanh()) ** 2
+        y = 1 - y.clip(-0.2, 0.2) * x.sign() + x.log1p()
+        return y + (x.square() + 1).log2().log10()
+
+    expected = f(x)
+    with ep.lazy():
+        result = f(x)
+        assert result.shape == expected.shape
+        assert result.dtype == expected.dtype
+    np.testing.assert_allclose(result.numpy(), expected.numpy(), rtol=1e-6)
+
+
+def test_lazy_dtype_promotion(x: Tensor) -> None:
+    i = ep.arange(x, 4)
+    with ep.lazy():
+        assert (x + 1.0).dtype == x.dtype
+        assert (x * i).dtype == (x.raw * i.raw).dtype
+        assert (i + 1).dtype == i.dtype
+        assert (i / 2).dtype == (i.raw / 2).dtype
+        assert (x.sum() * x).dtype == x.dtype
+    np.testing.assert_allclose((x * i).numpy(), x.numpy() * i.numpy())
+
+
+def test_lazy_shared_subexpression(x: Tensor) -> None:
+    with ep.lazy():
+        a = x.exp()
+        b = a * a + a
+        c = a + 1
+    np.testing.assert_allclose(b.numpy(), np.exp(x.numpy()) ** 2 + np.exp(x.numpy()))
+    # a was used as a temporary buffer while evaluating b, but must not change
+    np.testing.assert_allclose(a.numpy(), np.exp(x.numpy()))
+    np.testing.assert_allclose(c.numpy(), np.exp(x.numpy()) + 1)
+
+
+def test_lazy_inputs_not_modified(x: Tensor) -> None:
+    before = x.numpy().copy()
+    with ep.lazy():
+        y = (x + 1).square()
+    y.numpy()
+    np.testing.assert_array_equal(x.numpy(), before)
+
+
+def test_lazy_reuses_buffers(x: Tensor) -> None:
+    x = ep.ones(x, (1000, 1000)).float32()
+    nbytes = x.raw.nbytes
+
+    def f(x: Tensor) -> Tensor:
+        return (((x + 1) * 2 - 3).abs() / 4).sqrt().sum()
+
+    def peak(x: Tensor, lazy: bool) -> Tuple[float, int]:
+        tracemalloc.start()
+        try:
+            with ep.lazy(lazy):
+                result = f(x).item()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return result, peak
+
+    expected, eager_peak = peak(x, False)
+    result, lazy_peak = peak(x, True)
+    assert result == expected
+    assert eager_peak >= 2 * nbytes
+    assert lazy_peak < 1.5 * nbytes
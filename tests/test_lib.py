@@ -1,4 +1,6 @@
+from typing import Tuple
 import pytest
+import numpy as np
 import eagerpy as ep
 
 
@@ -6,3 +8,113 @@ import eagerpy as ep
 def test_kl_div_with_logits(dummy: ep.Tensor, axis: int) -> None:
     logits_p = logits_q = ep.arange(dummy, 12).float32().reshape((3, 4))
     assert (ep.kl_div_with_logits(logits_p, logits_q, axis=axis) == 0).all()
+
+
+@pytest.mark.parametrize("axis", [0, 1, -1])
+@pytest.mark.parametrize("keepdims", [False, True])
+def test_kl_div_with_logits_values(dummy: ep.Tensor, axis: int, keepdims: bool) -> None:
+    a = np.arange(24, dtype=np.float32).reshape((2, 3, 4)) / 5
+    b = np.cos(a)
+    p = np.exp(a) / np.exp(a).sum(axis=axis, keepdims=True)
+    q = np.exp(b) / np.exp(b).sum(axis=axis, keepdims=True)
+    expected = (p * np.log(p / q)).sum(axis=axis, keepdims=keepdims)
+    logits_p = ep.from_numpy(dummy, a)
+    logits_q = ep.from_numpy(dummy, b)
+    kl = ep.kl_div_with_logits(logits_p, logits_q, axis=axis, keepdims=keepdims)
+    assert kl.shape == expected.shape
+    np.testing.assert_allclose(kl.numpy(), expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("axis", [0, -1])
+@pytest.mark.parametrize("q_shape", [(1, 5), (5,), (4, 1)])
+def test_kl_div_with_logits_broadcast(
+    dummy: ep.Tensor, axis: int, q_shape: Tuple[int, ...]
+) -> None:
+    # the softmaxes are taken over axis before the inputs are broadcasted
+    a = np.arange(20, dtype=np.float32).reshape((4, 5)) / 5
+    b = np.cos(np.arange(np.prod(q_shape), dtype=np.float32)).reshape(q_shape)
+    log_p = a - np.log(np.exp(a).sum(axis=axis, keepdims=True))
+    log_q = b - np.log(np.exp(b).sum(axis=axis, keepdims=True))
+    logits_p = ep.from_numpy(dummy, a)
+    logits_q = ep.from_numpy(dummy, b)
+    for kl, expected in [
+        (
+            ep.kl_div_with_logits(logits_p, logits_q, axis=axis),
+            (np.exp(log_p) * (log_p - log_q)).sum(axis=axis),
+        ),
+        (
+            ep.kl_div_with_logits(logits_q, logits_p, axis=axis),
+            (np.exp(log_q) * (log_q - log_p)).sum(axis=axis),
+        ),
+    ]:
+        assert kl.shape == expected.shape
+        np.testing.assert_allclose(kl.numpy(), expected, rtol=1e-5, atol=1e-6)
+
+
+def _logits_and_labels(dummy: ep.Tensor) -> Tuple[ep.Tensor, ep.Tensor]:
+    a = np.cos(np.arange(30, dtype=np.float32)).reshape((6, 5)) * 3
+    labels = np.array([0, 1, 4, 2, 2, 3])
+    return ep.from_numpy(dummy, a), ep.from_numpy(dummy, labels)
+
+
+def test_margin_and_hinge(dummy: ep.Tensor) -> None:
+    logits, labels = _logits_and_labels(dummy)
+    a, y = logits.numpy(), labels.numpy()
+    rows = np.arange(len(a))
+    others = a.copy()
+    others[rows, y] = -np.inf
+    expected = a[rows, y] - others.max(axis=-1)
+    np.testing.assert_allclose(ep.lib.losses.margin(logits, labels).numpy(), expected)
+    hinge = ep.lib.losses.hinge(logits, labels, delta=0.5).numpy()
+    np.testing.assert_allclose(hinge, np.maximum(0.5 - expected, 0))
+    single = ep.lib.losses.margin(logits[:, :1], labels.zeros_like())
+    assert single.shape == labels.shape
+    assert (single.numpy() == 0).all()
+
+
+@pytest.mark.parametrize("gamma", [0.0, 2.0])
+def test_focal(dummy: ep.Tensor, gamma: float) -> None:
+    logits, labels = _logits_and_labels(dummy)
+    a, y = logits.numpy().astype(np.float64), labels.numpy()
+    p = (np.exp(a) / np.exp(a).sum(axis=-1, keepdims=True))[np.arange(len(a)), y]
+    expected = -((1 - p) ** gamma) * np.log(p)
+    focal = ep.lib.losses.focal(logits, labels, gamma=gamma)
+    np.testing.assert_allclose(focal.numpy(), expected, rtol=1e-5)
+    if gamma == 0:
+        ce = ep.crossentropy(logits, labels)
+        np.testing.assert_allclose(focal.numpy(), ce.numpy(), rtol=1e-5)
+
+
+@pytest.mark.parametrize("axis", [0, -1])
+def test_js_div_with_logits(dummy: ep.Tensor, axis: int) -> None:
+    logits, _ = _logits_and_labels(dummy)
+    a = logits.numpy().astype(np.float64)
+    b = a[::-1] * 2
+    p = np.exp(a) / np.exp(a).sum(axis=axis, keepdims=True)
+    q = np.exp(b) / np.exp(b).sum(axis=axis, keepdims=True)
+    m = (p + q) / 2
+    expected = (p * np.log(p / m) + q * np.log(q / m)).sum(axis=axis) / 2
+    js = ep.lib.losses.js_div_with_logits(logits, logits.flip(axis=0) * 2, axis=axis)
+    np.testing.assert_allclose(js.numpy(), expected, rtol=1e-5, atol=1e-6)
+    same = ep.lib.losses.js_div_with_logits(logits, logits, axis=axis)
+    np.testing.assert_allclose(same.numpy(), 0, atol=1e-6)
+
+
+@pytest.mark.parametrize("k", [1, 2, 5, 7])
+def test_topk_accuracy(dummy: ep.Tensor, k: int) -> None:
+    logits, labels = _logits_and_labels(dummy)
+    a, y = logits.numpy(), labels.numpy()
+    topk = np.argsort(-a, axis=-1)[:, :k]
+    expected = (topk == y[:, np.newaxis]).any(axis=-1)
+    accuracy = ep.lib.losses.topk_accuracy(logits, labels, k=k)
+    assert (accuracy.numpy() == expected).all()
+
+
+def test_losses_raise(dummy: ep.Tensor) -> None:
+    logits, labels = _logits_and_labels(dummy)
+    with pytest.raises(ValueError):
+        ep.lib.losses.margin(logits.reshape((2, 3, 5)), labels)
+    with pytest.raises(ValueError):
+        ep.lib.losses.focal(logits, labels[:4])
+    with pytest.raises(ValueError):
+        ep.lib.losses.topk_accuracy(logits, labels, k=0)
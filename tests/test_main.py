@@ -28,6 +28,54 @@ def test_astensor_tensor(t: Tensor) -> None:
     assert (ep.astensor(t) == t).all()
 
 
+def test_astensor_unknown() -> None:
+    with pytest.raises(ValueError):
+        ep.astensor([1, 2, 3])
+    with pytest.raises(ValueError):
+        ep.astensor(np.float64(3.0))
+
+
+def test_register_tensor_type() -> None:
+    class MyArray(np.ndarray):
+        pass
+
+    class MyTensor(ep.NumPyTensor):
+        __slots__ = ()
+
+    ep.register_tensor_type(MyArray, MyTensor)
+    assert type(ep.astensor(np.ones(3).view(MyArray))) is MyTensor
+    assert type(ep.astensor(np.ones(3))) is ep.NumPyTensor
+
+
+def test_register_backend() -> None:
+    class OtherArray(np.ndarray):
+        pass
+
+    class OtherTensor(ep.NumPyTensor):
+        __slots__ = ()
+
+    backend = ep.register_backend(
+        "other",
+        OtherTensor,
+        [OtherArray],
+        lambda: np.zeros(0).view(OtherArray),
+        "numpy",
+    )
+    assert ep.backends.get_backend("other") is backend
+    assert "other" in ep.backends.list_backends()
+    dummy = ep.utils.get_dummy("other")
+    assert isinstance(dummy, OtherTensor)
+    assert dummy.dtype == np.float32
+    assert isinstance(ep.astensor(np.ones(3).view(OtherArray)), OtherTensor)
+    assert isinstance(ep.convert(ep.numpy.ones(3), "other"), OtherTensor)
+    assert backend.module is not None
+    assert ep.istensor(backend.module.ones(3))
+    with pytest.raises(ValueError):
+        ep.register_backend("other", OtherTensor, [], lambda: None)
+    with pytest.raises(ValueError):
+        ep.utils.get_dummy("unknown")
+
+
 def test_astensor_restore_raw(t: Tensor) -> None:
     r = t.raw
     y, restore_type = ep.astensor_(r)
@@ -114,11 +162,23 @@ def test_module_dir() -> None:
     assert "zeros" in dir(ep.numpy)
 
 
+def test_module_cache() -> None:
+    assert ep.numpy.tanh is ep.numpy.tanh
+    assert ep.numpy.linalg is ep.numpy.linalg
+    assert ep.istensor(ep.numpy.linalg.norm([[3, 4]], axis=1))
+    for _ in range(2):
+        assert ep.istensor(ep.numpy.ones(2))
+        assert not ep.istensor(ep.numpy.tanh(3))
+        assert ep.numpy.shape([1, 2]) == (2,)
+
+
 def test_repr(t: Tensor) -> None:
     assert not repr(t).startswith("<")
     t = ep.zeros(t, (10, 10))
     assert not repr(t).startswith("<")
-    assert len(repr(t).split("\n")) > 1
+    if not isinstance(t, ep.DaskTensor):
+        # Dask does not compute the values to show them
+        assert len(repr(t).split("\n")) > 1
 
 
 def test_logical_or_manual(t: Tensor) -> None:
@@ -143,9 +203,6 @@ def test_log_softmax_manual(t: Tensor) -> None:
 
 
 def test_value_and_grad_fn(dummy: Tensor) -> None:
-    if isinstance(dummy, ep.NumPyTensor):
-        pytest.skip()
-
     def f(x: ep.Tensor) -> ep.Tensor:
         return x.square().sum()
 
@@ -157,9 +214,6 @@ def test_value_and_grad_fn(dummy: Tensor) -> None:
 
 
 def test_value_and_grad_fn_with_aux(dummy: Tensor) -> None:
-    if isinstance(dummy, ep.NumPyTensor):
-        pytest.skip()
-
     def f(x: Tensor) -> Tuple[Tensor, Tensor]:
         x = x.square()
         return x.sum(), x
@@ -173,9 +227,6 @@ def test_value_and_grad_fn_with_aux(dummy: Tensor) -> None:
 
 
 def test_value_and_grad(dummy: Tensor) -> None:
-    if isinstance(dummy, ep.NumPyTensor):
-        pytest.skip()
-
     def f(x: Tensor) -> Tensor:
         return x.square().sum()
 
@@ -186,9 +237,6 @@ def test_value_and_grad(dummy: Tensor) -> None:
 
 
 def test_value_aux_and_grad(dummy: Tensor) -> None:
-    if isinstance(dummy, ep.NumPyTensor):
-        pytest.skip()
-
     def f(x: Tensor) -> Tuple[Tensor, Tensor]:
         x = x.square()
         return x.sum(), x
@@ -201,9 +249,6 @@ def test_value_aux_and_grad(dummy: Tensor) -> None:
 
 
 def test_value_aux_and_grad_multiple_aux(dummy: Tensor) -> None:
-    if isinstance(dummy, ep.NumPyTensor):
-        pytest.skip()
-
     def f(x: Tensor) -> Tuple[Tensor, Tuple[Tensor, Tensor]]:
         x = x.square()
         return x.sum(), (x, x + 1)
@@ -217,9 +262,6 @@ def test_value_aux_and_grad_multiple_aux(dummy: Tensor) -> None:
 
 
 def test_value_and_grad_multiple_args(dummy: Tensor) -> None:
-    if isinstance(dummy, ep.NumPyTensor):
-        pytest.skip()
-
     def f(x: Tensor, y: Tensor) -> Tensor:
         return (x * y).sum()
 
@@ -329,17 +371,221 @@ def test_matmul_raise(dummy: Tensor) -> None:
         ep.matmul(t[0], t[0])
 
 
-def test_take_along_axis_2d_first_raises(dummy: Tensor) -> None:
-    t = ep.arange(dummy, 32).float32().reshape((8, 4))
-    indices = ep.arange(t, t.shape[-1]) % t.shape[0]
-    with pytest.raises(NotImplementedError):
-        ep.take_along_axis(t, indices[ep.newaxis], axis=0)
+def test_tensorflow_promotion(dummy: Tensor) -> None:
+    if not isinstance(dummy, ep.TensorFlowTensor):
+        pytest.skip()
+    x = ep.arange(dummy, 5)
+    assert (x + x.float32()).dtype == np.float64
+    assert (x.float32() < x.astype(np.int8)).dtype == np.bool_
+    assert (x.astype(np.int8) * x.astype(np.uint8)).dtype == np.int16
+    # __mod__ and __floordiv__ are final in BaseTensor and keep the rules
+    # of TensorFlow, which does not promote mixed dtypes
+    assert (x % 3).dtype == x.dtype
+    with pytest.raises(Exception):
+        x % x.float32()
+    with pytest.raises(Exception):
+        x // x.float32()
+
+
+def test_tensorflow_samedevice(dummy: Tensor) -> None:
+    if not isinstance(dummy, ep.TensorFlowTensor):
+        pytest.skip()
+    import tensorflow as tf
+
+    x = ep.zeros(dummy, 3)
+    assert ep.ones(x, 3).raw.device == x.raw.device
+    with tf.device("CPU:0"):
+        y = ep.zeros(dummy, 3)
+        assert ep.arange(y, 3).raw.device == y.raw.device
+    assert ep.full(y, 3, 1.0).raw.device == y.raw.device
 
 
 def test_norms_class() -> None:
     assert ep.Tensor.norms is not None
 
 
+def test_generator(dummy: Tensor) -> None:
+    g = ep.random.Generator(42)
+    x = g.uniform(dummy, (2, 3), 1.0, 2.0)
+    y = ep.uniform(dummy, (2, 3), 1.0, 2.0, generator=g)
+    assert x.shape == (2, 3)
+    assert (x >= 1.0).all() and (x < 2.0).all()
+    assert not (x == y).all()
+    g = ep.random.Generator(42)
+    np.testing.assert_array_equal(g.uniform(dummy, (2, 3), 1.0, 2.0).numpy(), x.numpy())
+    np.testing.assert_array_equal(g.uniform(dummy, (2, 3), 1.0, 2.0).numpy(), y.numpy())
+    z = ep.random.Generator(42).normal(dummy, 5, 1.0, 0.5)
+    assert z.shape == (5,)
+    np.testing.assert_array_equal(
+        ep.normal(dummy, 5, 1.0, 0.5, generator=ep.random.Generator(42)).numpy(),
+        z.numpy(),
+    )
+
+
+def test_generator_spawn(dummy: Tensor) -> None:
+    g = ep.random.Generator(0)
+    assert g.seed == 0
+    a, b = g.spawn(2)
+    (c,) = g.spawn(1)
+    assert len({g.seed, a.seed, b.seed, c.seed}) == 4
+    assert not (a.uniform(dummy, 10) == b.uniform(dummy, 10)).all()
+    assert ep.random.Generator().seed != ep.random.Generator().seed
+
+
+def test_numpy_random(dummy: Tensor) -> None:
+    if not isinstance(dummy, ep.NumPyTensor):
+        pytest.skip()
+    import threading
+
+    assert ep.uniform(dummy, 3).dtype == np.float32
+    assert ep.normal(dummy.astype(np.float64), 3).dtype == np.float64
+    assert ep.uniform(ep.numpy.arange(3), 3).dtype == np.float64
+    # every thread gets its own stream
+    samples = []
+    threads = [
+        threading.Thread(
+            target=lambda: samples.append(tuple(ep.normal(dummy, 5).numpy()))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(samples)) == 4
+
+
+def test_scatter_inplace(dummy: Tensor) -> None:
+    x = ep.zeros(dummy, (3, 2))
+    if not isinstance(dummy, (ep.NumPyTensor, ep.PyTorchTensor)):
+        with pytest.raises(NotImplementedError):
+            x.scatter(0, 1.0, inplace=True)
+        return
+    y = x.scatter(ep.arange(x, 4) % 2, 1.0, "add", inplace=True)
+    assert y.raw is x.raw
+    np.testing.assert_array_equal(x.numpy(), [[2, 2], [2, 2], [0, 0]])
+
+
+def test_scatter_copy(dummy: Tensor) -> None:
+    for shape in [(4,), (2, 2)]:
+        x = ep.arange(dummy, 4).float32().reshape(shape)
+        for mode in ["set", "add", "max"]:
+            y = ep.scatter(x, [0, 1], 5.0, mode)
+            assert y.shape == x.shape
+            np.testing.assert_array_equal(x.numpy().ravel(), [0, 1, 2, 3])
+
+
+def test_scatter_mode(dummy: Tensor) -> None:
+    with pytest.raises(ValueError):
+        ep.scatter(ep.zeros(dummy, 3), 0, 1.0, "min")
+
+
+def test_norms_raise(dummy: Tensor) -> None:
+    x = ep.arange(dummy, 12).float32().reshape((3, 4))
+    with pytest.raises(ValueError):
+        x.norms.project_lp(2.0, 3)
+    with pytest.raises(ValueError):
+        x.norms.clip_by_norm(2.0, 0)
+
+
+def test_norms_backend(dummy: Tensor) -> None:
+    # the backend-specific norms should match the generic implementations
+    x = ep.arange(dummy, 60).float32().reshape((3, 4, 5)) % 7 - 3
+    for axis in [None, 0, -1, (0, 2)]:
+        for keepdims in [False, True]:
+            kw = dict(axis=axis, keepdims=keepdims)
+            for p in [0, 1, 2, 3, 0.5, ep.inf]:
+                r = x.norms.lp(p, **kw)
+                expected = ep.norms.lp(x, p, **kw)
+                assert r.shape == expected.shape
+                assert r.dtype == expected.dtype
+                np.testing.assert_allclose(r.numpy(), expected.numpy(), 1e-5)
+
+
+def test_from_file(tmp_path: Any, monkeypatch: Any) -> None:
+    # a small block size to make the reductions stream over several blocks
+    monkeypatch.setattr("eagerpy.tensor.numpy.BLOCK_SIZE", 64)
+    a = np.arange(-150, 150, dtype=np.float32).reshape((20, 5, 3)) / 7
+    path = str(tmp_path / "a.npy")
+    np.save(path, a)
+    x = ep.from_file(path)
+    assert isinstance(x.raw, np.memmap)
+    assert not isinstance(ep.from_file(path, mmap=False).raw, np.memmap)
+    n = ep.astensor(a)
+    for f in [
+        lambda x, kw: x.sum(**kw),
+        lambda x, kw: x.mean(**kw),
+        lambda x, kw: x.min(**kw),
+        lambda x, kw: x.max(**kw),
+        lambda x, kw: x.norms.l0(**kw),
+        lambda x, kw: x.norms.l1(**kw),
+        lambda x, kw: x.norms.l2(**kw),
+        lambda x, kw: x.norms.linf(**kw),
+        lambda x, kw: x.norms.lp(3, **kw),
+    ]:
+        for axis in [None, 0, -1, (0, 2), (1, 2)]:
+            for keepdims in [False, True]:
+                kw = dict(axis=axis, keepdims=keepdims)
+                r = f(x, kw)
+                expected = f(n, kw)
+                assert r.shape == expected.shape
+                assert r.dtype == expected.dtype
+                np.testing.assert_allclose(r.numpy(), expected.numpy(), 1e-5)
+
+
+def test_numpy_softmax_blocks(monkeypatch: Any) -> None:
+    a = np.arange(-150, 150, dtype=np.float32).reshape((20, 15)) / 7
+    labels = np.arange(20) % 15
+    e = np.exp(a.astype(np.float64))
+    p = e / e.sum(axis=-1, keepdims=True)
+    ce = -np.log(p[np.arange(20), labels])
+    e3 = e.reshape((4, 5, 15))
+    p3 = e3 / e3.sum(axis=1, keepdims=True)
+    q = p[::-1]
+    kl = (p * np.log(p / q)).sum(axis=-1)
+    x = ep.astensor(a)
+    for block_size in [1 << 22, 64, 1]:
+        # a small block size to make them work on several blocks of rows
+        monkeypatch.setattr("eagerpy.tensor.numpy.BLOCK_SIZE", block_size)
+        for r, expected in [
+            (x.softmax(), p),
+            (x.log_softmax(), np.log(p)),
+            (x.crossentropy(ep.astensor(labels)), ce),
+            (x.reshape((4, 5, 15)).softmax(axis=1), p3),
+            (ep.kl_div_with_logits(x, x[::-1]), kl),
+        ]:
+            assert r.dtype == np.float32
+            np.testing.assert_allclose(r.numpy(), expected, 1e-5, 1e-6)
+
+
+def test_dask_chunks(dummy: Tensor) -> None:
+    if not isinstance(dummy, ep.DaskTensor):
+        pytest.skip()
+    import dask.array as da
+
+    a = np.arange(600, dtype=np.float32).reshape((30, 20)) / 100
+    labels = np.arange(30) % 20
+    x = ep.astensor(da.from_array(a, chunks=(7, 6)))
+    n = ep.astensor(a)
+    y = ep.astensor(da.from_array(labels, chunks=7))
+    for f in [
+        lambda x, y: x.softmax(axis=-1),
+        lambda x, y: x.log_softmax(axis=0),
+        lambda x, y: ep.crossentropy(x, y),
+        lambda x, y: ep.onehot_like(x, y, value=2),
+        lambda x, y: x.norms.l2(axis=-1),
+        lambda x, y: ep.matmul(x, x.T),
+        lambda x, y: x.sort(axis=-1),
+        lambda x, y: ep.take_along_axis(x, x.argsort(axis=-1), axis=-1),
+        lambda x, y: x[y],
+        lambda x, y: x[x.sum(axis=-1) > 50],
+        lambda x, y: ep.index_update(x, ep.index[y, y], 1.0),
+    ]:
+        r = f(x, y)
+        assert isinstance(r, ep.DaskTensor)
+        np.testing.assert_allclose(r.numpy(), f(n, ep.astensor(labels)).numpy(), 1e-6)
+
+
 def test_numpy_readonly(t: Tensor) -> None:
     a = t.numpy()
     assert a.flags.writeable is False
@@ -370,6 +616,36 @@ def test_iter_next(t: Tensor) -> None:
     assert isinstance(next(iter(t)), Tensor)
 
 
+@pytest.mark.parametrize("axis", [0, -1])
+@pytest.mark.parametrize("kth", [0, 2, 4, -1])
+def test_partition(dummy: Tensor, axis: int, kth: int) -> None:
+    # small and large kth along a long axis use selection instead of sorting
+    a = np.cos(np.arange(200, dtype=np.float32)).reshape((5, 40))
+    n = a.shape[axis]
+    t = ep.from_numpy(dummy, a)
+    index = ep.argpartition(t, kth, axis=axis).numpy()
+    assert (np.sort(index, axis=axis) == np.sort(a.argsort(axis=axis), axis=axis)).all()
+    kth = kth % n
+    expected = np.take(np.sort(a, axis=axis), [kth], axis=axis)
+    partitioned = ep.partition(t, kth, axis=axis).numpy()
+    for p in [partitioned, np.take_along_axis(a, index, axis=axis)]:
+        assert (np.take(p, [kth], axis=axis) == expected).all()
+        assert (np.take(p, range(kth), axis=axis) <= expected).all()
+        assert (np.take(p, range(kth + 1, n), axis=axis) >= expected).all()
+
+
+def test_topk_k(dummy: Tensor) -> None:
+    t = ep.arange(dummy, 12).float32().reshape((3, 4))
+    for axis in [0, -1]:
+        values, indices = ep.topk(t, 0, axis=axis)
+        shape = (0, 4) if axis == 0 else (3, 0)
+        assert values.shape == indices.shape == shape
+        values, _ = ep.topk(t, t.shape[axis], axis=axis)
+        np.testing.assert_array_equal(values.numpy(), np.flip(t.numpy(), axis=axis))
+        with pytest.raises(Exception):
+            ep.topk(t, t.shape[axis] + 1, axis=axis)
+
+
 def test_flatten(dummy: Tensor) -> None:
     t = ep.ones(dummy, (16, 3, 32, 32))
     assert ep.flatten(t).shape == (16 * 3 * 32 * 32,)
@@ -680,6 +956,30 @@ def test_getitem_tuple_tensors_full_broadcast(dummy: Tensor) -> Tensor:
     return t[rows, cols]
 
 
+@compare_all
+def test_getitem_tuple_tensors_negative_int(dummy: Tensor) -> Tensor:
+    t = ep.arange(dummy, 60).float32().reshape((3, 4, 5))
+    rows = -ep.arange(t, 1, 4)[:, np.newaxis]
+    cols = ep.arange(t, 4)
+    return t[rows, cols, -2]
+
+
+@compare_all
+def test_getitem_tuple_tensors_negative(dummy: Tensor) -> Tensor:
+    t = ep.arange(dummy, 32).float32().reshape((8, 4))
+    rows = ep.from_numpy(dummy, np.array([0, -1, 2]))
+    cols = ep.from_numpy(dummy, np.array([1, 2, -4]))
+    return t[rows, cols]
+
+
+@compare_all
+def test_getitem_tuple_tensors_trailing(dummy: Tensor) -> Tensor:
+    t = ep.arange(dummy, 60).float32().reshape((3, 4, 5))
+    rows = ep.arange(t, 6).reshape((2, 3)) % 3
+    cols = ep.arange(t, 3) % 4
+    return t[rows, cols]
+
+
 @compare_all
 def test_getitem_tuple_range_tensor(dummy: Tensor) -> Tensor:
     t = ep.arange(dummy, 32).float32().reshape((8, 4))
@@ -735,6 +1035,48 @@ def test_take_along_axis_3d(dummy: Tensor) -> Tensor:
     return ep.take_along_axis(t, indices, axis=-1)
 
 
+@compare_all
+def test_take_along_axis_2d_first(dummy: Tensor) -> Tensor:
+    t = ep.arange(dummy, 32).float32().reshape((8, 4))
+    indices = ep.arange(t, t.shape[-1]) % t.shape[0]
+    return ep.take_along_axis(t, indices[ep.newaxis], axis=0)
+
+
+@pytest.mark.parametrize("axis", [0, 1, -1])
+@compare_all
+def test_take_along_axis_3d_axis(dummy: Tensor, axis: int) -> Tensor:
+    t = ep.arange(dummy, 60).float32().reshape((3, 4, 5))
+    shape = list(t.shape)
+    shape[axis] = 2
+    indices = (ep.arange(t, 2 * 3 * 4 * 5 // t.shape[axis]) * 7).reshape(shape)
+    return ep.take_along_axis(t, indices % t.shape[axis], axis=axis)
+
+
+@pytest.mark.parametrize("axis", [0, 1, -1])
+@compare_all
+def test_put_along_axis(dummy: Tensor, axis: int) -> Tensor:
+    t = ep.arange(dummy, 60).float32().reshape((3, 4, 5))
+    indices = t.argsort(axis=axis)
+    indices = indices[(slice(None),) * (axis % t.ndim) + (slice(2),)]
+    values = -ep.ones(t, indices.shape)
+    return ep.put_along_axis(t, indices, values, axis=axis)
+
+
+@compare_all
+def test_put_along_axis_scalar(dummy: Tensor) -> Tensor:
+    t = ep.arange(dummy, 32).float32().reshape((8, 4))
+    indices = (ep.arange(t, 8) % 4).reshape((8, 1))
+    return ep.put_along_axis(t, indices, -1.0, axis=1)
+
+
+@pytest.mark.parametrize("axis", [0, 1, -1])
+@compare_all
+def test_gather(dummy: Tensor, axis: int) -> Tensor:
+    t = ep.arange(dummy, 60).float32().reshape((3, 4, 5))
+    indices = ep.arange(t, 6).reshape((2, 3)) % t.shape[axis]
+    return ep.gather(t, indices, axis=axis)
+
+
 @compare_all
 def test_sqrt(t: Tensor) -> Tensor:
     return ep.sqrt(t)
@@ -1071,6 +1413,25 @@ def test_argmax_axis(t: Tensor) -> Tensor:
     return ep.argmax(t, axis=0)
 
 
+@pytest.mark.parametrize("f", [ep.min_with_indices, ep.max_with_indices])
+@pytest.mark.parametrize("axis", [None, 0, 1, -1])
+@compare_all
+def test_with_indices_values(dummy: Tensor, f: Callable, axis: Optional[int]) -> Tensor:
+    # with ties to check that the first index is returned
+    t = (ep.arange(dummy, 24) * 7 % 5).float32().reshape((2, 3, 4))
+    return f(t, axis=axis)[0]
+
+
+@pytest.mark.parametrize("f", [ep.min_with_indices, ep.max_with_indices])
+@pytest.mark.parametrize("axis", [None, 0, 1, -1])
+@compare_all
+def test_with_indices_indices(
+    dummy: Tensor, f: Callable, axis: Optional[int]
+) -> Tensor:
+    t = (ep.arange(dummy, 24) * 7 % 5).float32().reshape((2, 3, 4))
+    return f(t, axis=axis)[1]
+
+
 @compare_all
 def test_logical_and(t: Tensor) -> Tensor:
     return ep.logical_and(t < 3, t > 1)
@@ -1144,6 +1505,13 @@ def test_onehot_like(dummy: Tensor, value: float) -> Tensor:
     return ep.onehot_like(t, indices, value=value)
 
 
+@compare_all
+def test_onehot_like_3d(dummy: Tensor) -> Tensor:
+    t = ep.arange(dummy, 60).float32().reshape((3, 4, 5))
+    indices = ep.arange(t, 12).reshape((3, 4)) % 5
+    return ep.onehot_like(t, indices, value=2)
+
+
 @compare_all
 def test_zeros_scalar(t: Tensor) -> Tensor:
     return ep.zeros(t, 5)
@@ -1206,6 +1574,20 @@ def test_sort(dummy: Tensor) -> Tensor:
     return ep.sort(t)
 
 
+@pytest.mark.parametrize("axis", [0, 1, -1])
+@compare_all
+def test_topk_values(dummy: Tensor, axis: int) -> Tensor:
+    t = (ep.arange(dummy, 24).float32() * 7 % 24).reshape((2, 3, 4))
+    return ep.topk(t, 2, axis=axis)[0]
+
+
+@pytest.mark.parametrize("axis", [0, 1, -1])
+@compare_all
+def test_topk_indices(dummy: Tensor, axis: int) -> Tensor:
+    t = (ep.arange(dummy, 24).float32() * 7 % 24).reshape((2, 3, 4))
+    return ep.topk(t, 2, axis=axis)[1]
+
+
 @compare_all
 def test_transpose(dummy: Tensor) -> Tensor:
     t = ep.arange(dummy, 8).float32().reshape((2, 4))
@@ -1392,6 +1774,25 @@ def test_index_update_indices_scalar(dummy: Tensor) -> Tensor:
     return ep.index_update(x, ep.index[ind, ep.arange(x, 4)], 33.0)
 
 
+@pytest.mark.parametrize("mode", ["set", "add", "max"])
+@pytest.mark.parametrize("n", [4, 0])
+@compare_all
+def test_scatter(dummy: Tensor, mode: str, n: int) -> Tensor:
+    x = ep.arange(dummy, 12).float32().reshape((3, 4))
+    rows = ep.from_numpy(dummy, np.array([0, 2, 2, -1]))[:n]
+    cols = ep.from_numpy(dummy, np.array([1, 3, 3, 0]))[:n]
+    values = ep.arange(x, 4).float32()[:n] * 5.0
+    return ep.scatter(x, (rows, cols), values, mode)
+
+
+@pytest.mark.parametrize("mode", ["set", "add", "max"])
+@compare_all
+def test_scatter_rows(dummy: Tensor, mode: str) -> Tensor:
+    x = ep.arange(dummy, 12).float32().reshape((3, 4))
+    rows = ep.from_numpy(dummy, np.array([1, 0, 1]))
+    return x.scatter(rows, 6.0, mode)
+
+
 @compare_all
 def test_lt(t1: Tensor, t2: Tensor) -> Tensor:
     return t1 < t2
@@ -1482,6 +1883,16 @@ def test_float_int_ne(t1: Tensor, t2int: Tensor) -> Tensor:
     return t1 != t2int
 
 
+@compare_allclose(rtol=1e-6)
+def test_float_int_add(t1: Tensor, t2int: Tensor) -> Tensor:
+    return t1 + t2int
+
+
+@compare_allclose(rtol=1e-6)
+def test_int_float_truediv(t1int: Tensor, t2: Tensor) -> Tensor:
+    return t1int / t2
+
+
 @compare_all
 def test_int_float_lt(t1int: Tensor, t2: Tensor) -> Tensor:
     return t1int < t2
@@ -1540,3 +1951,139 @@ def test_norms_lp(t: Tensor) -> Tensor:
 @compare_all
 def test_norms_cache(t: Tensor) -> Tensor:
     return t.norms.l1() + t.norms.l2()
+
+
+@pytest.mark.parametrize("p", [0, 1, 2, ep.inf])
+@pytest.mark.parametrize("axis", [None, 0, -1])
+@compare_allclose(rtol=1e-6)
+def test_norms_project_lp(dummy: Tensor, p: float, axis: Optional[AxisAxes]) -> Tensor:
+    x = ep.arange(dummy, 12).float32().reshape((3, 4)) * 1.3 - 5
+    y = x.norms.project_lp(2.0, p, axis=axis)
+    if p != 0:
+        assert (y.norms.lp(p, axis=axis) <= 2.0 + 1e-5).all()
+    return y
+
+
+@pytest.mark.parametrize("p", [1, 2, ep.inf])
+@compare_allclose(rtol=1e-6)
+def test_norms_clip_by_norm(dummy: Tensor, p: float) -> Tensor:
+    x = ep.arange(dummy, 12).float32().reshape((3, 4)) * 1.3 - 5
+    return ep.norms.clip_by_norm(x, 3.0, p, axis=-1)
+
+
+def _grad_elementwise(x: Tensor) -> Tensor:
+    y = abs(x - 1) * 2 - x.square() / 3 + x.sqrt() + x.exp() * 0.1 + x.log()
+    y = y + x.log2() + x.log10() + x.log1p() + (x / 10).tanh() + (x / 10).arctanh()
+    y = y + x.clip(1.0, 2.0) + x ** 3 + x ** (x / 4) - (-x).sign() * x
+    return y.sum()
+
+
+def _grad_broadcast(x: Tensor) -> Tensor:
+    y = x * x[0] + x / x[:, :1] - 1 / x + (1 - x) + 2 * x - x[1:2]
+    y = y + ep.minimum(x, 1.2) + ep.maximum(x.flip(axis=0), x + 0.01)
+    return (y + ep.where(x > 1, x, -2 * x) + x % 0.3).sum()
+
+
+def _grad_reductions(x: Tensor) -> Tensor:
+    y = x.sum(axis=0).square().sum() + x.mean(axis=1).prod() + x.max(axis=1).sum()
+    y = y + x.min() + x.cumsum(axis=1).sum() + x.cumsum().square().sum()
+    y = y + ep.max_with_indices(x, axis=0)[0].square().sum()
+    y = y + ep.min_with_indices(x, axis=-1)[0].sum() + ep.max_with_indices(x)[0]
+    return y + x.prod(axis=0, keepdims=True).sum() + x.mean(axis=(0, 1))
+
+
+def _grad_softmax(x: Tensor) -> Tensor:
+    y = (x.softmax(axis=0) * x).sum() + x.log_softmax(axis=-1)[:, 1].sum()
+    labels = ep.arange(x, 3)
+    y = y + (ep.kl_div_with_logits(x, x.square() / 3, axis=0) * x[0]).sum()
+    y = y + ep.kl_div_with_logits(x.flip(axis=1), x, keepdims=True).square().sum()
+    y = y + (ep.kl_div_with_logits(x, x[1:2].square(), axis=0) * x[0]).sum()
+    y = y + ep.kl_div_with_logits(x[:, :1], x.square() / 3).square().sum()
+    y = y + ep.lib.losses.js_div_with_logits(x, x.square() / 3).sum()
+    y = y + ep.lib.losses.focal(x, labels).sum() + ep.lib.losses.hinge(x, labels).sum()
+    return y + ep.crossentropy(x, labels).sum()
+
+
+def _grad_linear_algebra(x: Tensor) -> Tensor:
+    y = ep.matmul(x, x.T).square().sum()
+    return y + x.norms.l2() + x.norms.lp(3, axis=-1).sum()
+
+
+def _grad_shapes(x: Tensor) -> Tensor:
+    y = x.reshape(-1)[::2].sum() + (x.T[1] * ep.arange(x, 3).float32()).sum()
+    y = y + x.expand_dims(0).squeeze().flip(axis=1)[0].square().sum()
+    y = y + x.tile((2, 1))[2:].square().sum() + x.flatten()[1:].exp().sum()
+    x4d = x.reshape((1, 1, 3, 4))
+    y = y + ep.pad(x4d, ((0, 0), (0, 0), (1, 1), (1, 2)), mode="reflect").sum()
+    y = y + ep.pad(x, ((1, 1), (1, 2)), value=1.0).square().sum()
+    index = ep.argsort(x.square().flip(axis=-1), axis=-1)[:, :2]
+    y = y + ep.take_along_axis(x, index, axis=-1).square().sum()
+    y = y + ep.take_along_axis(x, x.argsort(axis=0)[:2], axis=0).square().sum()
+    y = y + ep.gather(x, index, axis=1).square().sum()
+    y = y + ep.put_along_axis(x, index, x[:, :2].exp(), axis=-1).square().sum()
+    y = y + ep.concatenate([x, x.square()], axis=1)[:, 3:].exp().sum()
+    y = y + ep.stack([x, x.square()], axis=1)[:, 1].sum()
+    y = y + ep.index_update(x, ep.index[:, 1], x[:, 2]).square().sum()
+    rows = ep.arange(x, 2) * 2
+    for mode in ["set", "add", "max"]:
+        y = y + ep.scatter(x, rows, x[:2].square() * 1.5, mode).square().sum()
+        y = y + ep.scatter(x, (rows, rows + 1), x[1, 1], mode).square().sum()
+    y = y + ep.topk(x.square().flip(axis=1), 2, axis=0)[0].exp().sum()
+    y = y + ep.partition(x.square(), 1, axis=-1)[:, :2].exp().sum()
+    return y + ep.sort(x.square().flip(axis=0), axis=0)[0].exp().sum()
+
+
+grad_functions: Dict[str, Callable[[Tensor], Tensor]] = {
+    "elementwise": _grad_elementwise,
+    "broadcast": _grad_broadcast,
+    "reductions": _grad_reductions,
+    "softmax": _grad_softmax,
+    "linear_algebra": _grad_linear_algebra,
+    "shapes": _grad_shapes,
+}
+
+
+@pytest.mark.parametrize("name", list(grad_functions.keys()))
+@compare_allclose(rtol=1e-5, atol=1e-6)
+def test_value_and_grad_ops(dummy: Tensor, name: str) -> Tensor:
+    x = ep.arange(dummy, 12).float32().reshape((3, 4)) / 7.0 + 0.5
+    _, g = ep.value_and_grad(grad_functions[name], x)
+    return g
+
+
+@pytest.mark.parametrize("axis", [None, 0, 1, (0, 1)])
+@pytest.mark.parametrize("keepdims", [False, True])
+@compare_allclose(rtol=1e-6)
+def test_value_and_grad_prod_zeros(
+    dummy: Tensor, axis: Optional[AxisAxes], keepdims: bool
+) -> Tensor:
+    a = np.array([[0, 1, 2], [3, 0, 5], [0, 0, 4]], dtype=np.float32)
+    x = ep.from_numpy(dummy, a)
+
+    def f(x: Tensor) -> Tensor:
+        return (x.prod(axis=axis, keepdims=keepdims) * 2).sum()
+
+    _, g = ep.value_and_grad(f, x)
+    return g
+
+
+@compare_allclose(rtol=1e-5, atol=1e-6)
+def test_value_and_grad_constant_first(dummy: Tensor) -> Tensor:
+    # the traced tensor is not the first argument of the operation
+    c = ep.arange(dummy, 12).float32().reshape((3, 4)) / 5.0
+    x = ep.arange(dummy, 12).float32().reshape((3, 4)) / 7.0 + 0.5
+    if isinstance(dummy, ep.DaskTensor):
+        # gradients of Dask functions are computed using NumPy tensors, so
+        # constants in closures cannot be Dask tensors
+        with pytest.raises(ValueError, match="passed as arguments"):
+            ep.value_and_grad(lambda x: (x * c).sum(), x)
+        c = ep.astensor(c.numpy())
+
+    def f(x: Tensor) -> Tensor:
+        y = ep.maximum(c, x) + ep.minimum(c, x) + ep.where(c > 1, x, c) + c ** x
+        y = y + ep.concatenate([c, x], axis=0)[2:5] + ep.stack([c, x])[1]
+        y = y + ep.index_update(c, ep.index[:, 1], x[:, 2]) + ep.matmul(c[:, :3], x[:3])
+        return y.square().sum()
+
+    _, g = ep.value_and_grad(f, x)
+    return g
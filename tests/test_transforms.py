@@ -0,0 +1,123 @@
+from typing import Dict, Set, Tuple
+import pytest
+import numpy as np
+import eagerpy as ep
+from eagerpy import Tensor
+
+
+def test_jit(dummy: Tensor) -> None:
+    def f(x: Tensor, y: Tensor, p: float) -> Tuple[Tensor, Dict[str, Tensor]]:
+        z = (x * y + p).square()
+        return z, {"sum": z.sum(), "max": x.maximum(y).max()}
+
+    x = ep.arange(dummy, 6).float32().reshape((2, 3))
+    y = x.square()
+    expected = f(x, y, 2.0)
+    result = ep.jit(f)(x, y, 2.0)
+    assert isinstance(result, tuple)
+    assert isinstance(result[0], type(x))
+    assert isinstance(result[1], dict)
+    assert set(result[1].keys()) == {"sum", "max"}
+    np.testing.assert_allclose(result[0].numpy(), expected[0].numpy())
+    np.testing.assert_allclose(result[1]["sum"].numpy(), expected[1]["sum"].numpy())
+    np.testing.assert_allclose(result[1]["max"].numpy(), expected[1]["max"].numpy())
+
+
+def test_jit_cache(dummy: Tensor) -> None:
+    traces = []
+
+    @ep.jit
+    def f(x: Tensor, p: int) -> Tensor:
+        traces.append(x.shape)
+        return x ** p
+
+    x = ep.arange(dummy, 4).float32()
+    assert (f(x, 2) == x.square()).all()
+    n = len(traces)
+    assert n >= 1
+    assert (f(x + 1, 2) == (x + 1).square()).all()
+    if isinstance(dummy, (ep.JAXTensor, ep.TensorFlowTensor)):
+        # same shape, dtype and static arguments -> no retracing
+        # (torch.compile replays side effects, NumPy does not compile)
+        assert len(traces) == n
+    # a new static argument or shape causes a recompilation
+    assert (f(x, 3) == x ** 3).all()
+    assert (f(x.reshape((2, 2)), 2) == x.reshape((2, 2)).square()).all()
+    assert len(traces) > n + 1
+
+
+def test_jit_native(dummy: Tensor) -> None:
+    @ep.jit
+    def f(x: Tensor) -> Tensor:
+        return x.sum(axis=-1)
+
+    x = ep.arange(dummy, 6).float32().reshape((3, 2))
+    result = f(x.raw)
+    assert not isinstance(result, Tensor)
+    np.testing.assert_allclose(ep.astensor(result).numpy(), [1.0, 5.0, 9.0])
+
+
+def test_jit_unhashable_static_argument(dummy: Tensor) -> None:
+    @ep.jit
+    def f(x: Tensor, p: Set[int]) -> Tensor:
+        return x
+
+    with pytest.raises(TypeError):
+        f(dummy, {1, 2})
+
+
+def test_jit_random(dummy: Tensor) -> None:
+    g = ep.random.Generator(0)
+
+    @ep.jit
+    def f(x: Tensor) -> Tuple[Tensor, Tensor]:
+        return x + g.uniform(x, x.shape), x + ep.normal(x, x.shape)
+
+    x = ep.zeros(dummy, 5)
+    a, b = f(x)
+    c, d = f(x)
+    # every call samples new values instead of reusing those of the trace
+    assert not (a == c).all()
+    assert not (b == d).all()
+
+
+def test_vmap(dummy: Tensor) -> None:
+    def f(x: Tensor, w: Tensor) -> Tuple[Tensor, Tensor]:
+        assert x.ndim == 1
+        return (x * w).sum(), x.square()
+
+    x = ep.arange(dummy, 12).float32().reshape((3, 4))
+    w = ep.arange(dummy, 4).float32()
+    s, q = ep.vmap(f, in_axes=(0, None))(x, w)
+    assert isinstance(s, type(x))
+    np.testing.assert_allclose(s.numpy(), x.numpy() @ w.numpy())
+    np.testing.assert_allclose(q.numpy(), x.square().numpy())
+
+
+def test_vmap_axes(dummy: Tensor) -> None:
+    def f(x: Tensor, y: Tensor) -> Tensor:
+        return x * y
+
+    x = ep.arange(dummy, 12).float32().reshape((3, 4))
+    y = ep.arange(dummy, 12).float32().reshape((4, 3))
+    result = ep.vmap(f, in_axes=(1, 0), out_axes=1)(x, y)
+    assert result.shape == (3, 4)
+    np.testing.assert_allclose(result.numpy(), x.numpy() * y.numpy().T)
+
+    result = ep.vmap(f, out_axes=-1)(x.raw, y.T.raw)
+    assert not isinstance(result, Tensor)
+    expected = (x.numpy() * y.numpy().T).T
+    np.testing.assert_allclose(ep.astensor(result).numpy(), expected)
+
+
+def test_vmap_errors(dummy: Tensor) -> None:
+    def f(x: Tensor, y: Tensor) -> Tensor:
+        return x
+
+    x = ep.ones(dummy, (3, 4))
+    with pytest.raises(ValueError):
+        ep.vmap(f)(x, x.T)
+    with pytest.raises(ValueError):
+        ep.vmap(f, in_axes=(0,))(x, x)
+    with pytest.raises(ValueError):
+        ep.vmap(f, in_axes=None)(x, x)